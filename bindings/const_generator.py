@@ -292,16 +292,146 @@ def gen(lang):
         else:
             os.rename(outfn + ".tmp", outfn)
 
+# registers metadata tables for the python binding, generated from the python
+# constants files. for every arch, registers are matched in order against a list
+# of (name pattern, value width in bytes, value class) rules. registers that are
+# held in architecture-specific structures have no class here; the binding arch
+# modules provide it.
+# note that the width of word-sized registers on arches with both 32 and 64 bit
+# variants is the wider one, so the value buffer is large enough in any mode.
+regs_template = {
+    'header': "# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [%s_regs.py]\n",
+    'const_file': './python/unicorn/%s_const.py',
+    'out_file': './python/unicorn/unicorn_py3/arch/%s_regs.py',
+}
+
+regs_classes = {
+    1:  'c_uint8',
+    2:  'c_uint16',
+    4:  'c_uint32',
+    8:  'c_uint64',
+    16: 'UcReg128',
+    32: 'UcReg256',
+    64: 'UcReg512',
+}
+
+regs_rules = {
+    'arm': (
+        (r'd\d+', 8),
+        (r'q\d+', 16),
+        (r'cp_reg', 40, None),
+        (r'.*', 4),
+    ),
+    'arm64': (
+        (r'b\d+', 1),
+        (r'h\d+', 2),
+        (r'(s|w)\d+|wsp|wzr|nzcv|pstate|fpcr|fpsr|cpacr_el1', 4),
+        (r'(q|v)\d+', 16),
+        (r'cp_reg', 32, None),
+        (r'.*', 8),
+    ),
+    'mips': (
+        (r'w\d+', 16),
+        (r'.*', 8),
+    ),
+    'x86': (
+        (r'[abcd][hl]|(sp|bp|si|di)l|r\d+b', 1),
+        (r'[abcd]x|sp|bp|si|di|ip|flags|[c-gs]s|r\d+w|fp(sw|cw|tag)|fcs|fds|fop', 2),
+        (r'e([abcd]x|sp|bp|si|di|ip|flags)|r\d+d|mxcsr', 4),
+        (r'(fp|st)\d+', 10, None),
+        (r'xmm\d+', 16),
+        (r'ymm\d+', 32),
+        (r'zmm\d+', 64),
+        (r'msr', 16, None),
+        (r'idtr|gdtr|ldtr|tr', 24, None),
+        (r'.*', 8),
+    ),
+    'sparc': (
+        (r'.*', 8),
+    ),
+    'm68k': (
+        (r'.*', 4),
+    ),
+    'ppc': (
+        (r'cr\d*|xer|fpscr', 4),
+        (r'.*', 8),
+    ),
+    'riscv': (
+        (r'.*', 8),
+    ),
+    's390x': (
+        (r'a\d+', 4),
+        (r'.*', 8),
+    ),
+    'tricore': (
+        (r'.*', 4),
+    ),
+}
+
+def gen_regs():
+    for prefix, rules in regs_rules.items():
+        reg_prefix = 'UC_%s_REG_' % prefix.upper()
+        regs = []
+
+        # registers in definition order; the first name of each register id is its canonical name
+        with open(regs_template['const_file'] % prefix) as f:
+            for line in f:
+                match = re.match(r'^%s(\w+) = (\d+)$' % reg_prefix, line.strip())
+                if match and match.group(1) not in ('INVALID', 'ENDING'):
+                    regs.append((match.group(1).lower(), int(match.group(2))))
+
+        count = max(rid for _, rid in regs) + 1
+        width = [0] * count
+        klass = ['None'] * count
+        name = ['None'] * count
+
+        for rname, rid in regs:
+            if name[rid] != 'None':
+                continue
+            for rule in rules:
+                if re.fullmatch(rule[0], rname):
+                    break
+            width[rid] = rule[1]
+            klass[rid] = regs_classes[rule[1]] if len(rule) < 3 else 'None'
+            name[rid] = repr(rname)
+
+        ctypes_used = sorted(set(k for k in klass if k.startswith('c_')), key=lambda k: int(k[len('c_uint'):]))
+        large_used = sorted(set(k for k in klass if k.startswith('UcReg')), key=lambda k: int(k[len('UcReg'):]))
+
+        def table(items, per_line):
+            rows = [', '.join(items[i:i + per_line]) for i in range(0, len(items), per_line)]
+            return '(\n' + ''.join('    %s,\n' % row for row in rows) + ')\n'
+
+        outfn = regs_template['out_file'] % prefix
+        with open(outfn, 'wb') as outfile:
+            out = regs_template['header'] % prefix
+            out += '\nfrom ctypes import %s\n' % ', '.join(ctypes_used)
+            if large_used:
+                out += '\nfrom .types import %s\n' % ', '.join(large_used)
+            out += '\n# registers value width in bytes, indexed by register id\n'
+            out += 'REG_WIDTH = ' + table([str(w) for w in width], 16)
+            out += '\n# registers value class, indexed by register id; None for undefined registers\n'
+            out += '# and for registers held in an architecture-specific structure\n'
+            out += 'REG_CLASS = ' + table(klass, 8)
+            out += '\n# registers canonical name, indexed by register id\n'
+            out += 'REG_NAME = ' + table(name, 8)
+            out += '\n# registers id by name, including aliases\n'
+            out += 'REG_ID = {\n' + ''.join('    %r: %d,\n' % reg for reg in regs) + '}\n'
+            outfile.write(out.encode("utf-8"))
+
 def main():
     lang = sys.argv[1]
     if lang == "all":
         for lang in template.keys():
             print("Generating constants for {}".format(lang))
             gen(lang)
+        gen_regs()
     else:
         if not lang in template:
             raise RuntimeError("Unsupported binding %s" % lang)
         gen(lang)
+        if lang == 'python':
+            gen_regs()
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
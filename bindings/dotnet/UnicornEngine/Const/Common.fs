@@ -148,6 +148,8 @@ module Common =
     let UC_CTL_TLB_TYPE = 12
     let UC_CTL_TCG_BUFFER_SIZE = 13
     let UC_CTL_CONTEXT_MODE = 14
+    let UC_CTL_CONTEXT_DIRTY_PAGES = 15
+    let UC_CTL_COVERAGE_MAP = 16
 
     let UC_PROT_NONE = 0
     let UC_PROT_READ = 1
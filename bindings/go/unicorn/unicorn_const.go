@@ -143,6 +143,8 @@ const (
 	CTL_TLB_TYPE = 12
 	CTL_TCG_BUFFER_SIZE = 13
 	CTL_CONTEXT_MODE = 14
+	CTL_CONTEXT_DIRTY_PAGES = 15
+	CTL_COVERAGE_MAP = 16
 
 	PROT_NONE = 0
 	PROT_READ = 1
@@ -145,6 +145,8 @@ public interface UnicornConst {
     public static final int UC_CTL_TLB_TYPE = 12;
     public static final int UC_CTL_TCG_BUFFER_SIZE = 13;
     public static final int UC_CTL_CONTEXT_MODE = 14;
+    public static final int UC_CTL_CONTEXT_DIRTY_PAGES = 15;
+    public static final int UC_CTL_COVERAGE_MAP = 16;
 
     public static final int UC_PROT_NONE = 0;
     public static final int UC_PROT_READ = 1;
@@ -135,17 +135,10 @@ def bin_to_ipv4(ip):
 
 
 def read_string(uc, addr):
-    ret = ""
+    # file names are bounded by PATH_MAX, which the default limit covers
+    data, _ = uc.mem_read_cstring(addr)
 
-    c = uc.mem_read(addr, 1)[0]
-    read_bytes = 1
-
-    while c != 0x0:
-        ret += chr(c)
-        c = uc.mem_read(addr + read_bytes, 1)[0]
-        read_bytes += 1
-
-    return ret
+    return data.decode('latin-1')
 
 
 def parse_sock_address(sock_addr):
@@ -60,15 +60,10 @@ def hook_block(uc, address, size, user_data):
     print(">>> Tracing basic block at 0x%x, block size = 0x%x" %(address, size))
 
 def read_string(uc, address):
-    ret = ""
-    c = uc.mem_read(address, 1)[0]
-    read_bytes = 1
-
-    while c != 0x0:
-        ret += chr(c)
-        c = uc.mem_read(address + read_bytes, 1)[0]
-        read_bytes += 1
-    return ret
+    # file names are bounded by PATH_MAX, which the default limit covers
+    data, _ = uc.mem_read_cstring(address)
+
+    return data.decode('latin-1')
 
 # callback for tracing Linux interrupt
 def hook_intr(uc, intno, user_data):
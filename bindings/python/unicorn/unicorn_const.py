@@ -141,6 +141,8 @@ UC_CTL_TLB_FLUSH = 11
 UC_CTL_TLB_TYPE = 12
 UC_CTL_TCG_BUFFER_SIZE = 13
 UC_CTL_CONTEXT_MODE = 14
+UC_CTL_CONTEXT_DIRTY_PAGES = 15
+UC_CTL_COVERAGE_MAP = 16
 
 UC_PROT_NONE = 0
 UC_PROT_READ = 1
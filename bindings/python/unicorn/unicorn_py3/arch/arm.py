@@ -2,7 +2,7 @@
 """
 # @author elicn
 
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple, Type
 
 import ctypes
 
@@ -11,7 +11,7 @@ from unicorn import arm_const as const
 
 # newly introduced unicorn imports
 from ..unicorn import Uc
-from .types import UcTupledReg, UcReg128
+from .types import UcTupledReg
 
 ARMCPReg = Tuple[int, int, int, int, int, int, int, int]
 
@@ -40,46 +40,22 @@ class UcAArch32(Uc):
     """Unicorn subclass for ARM architecture.
     """
 
-    REG_RANGE_Q = range(const.UC_ARM_REG_Q0, const.UC_ARM_REG_Q15 + 1)
-
-    @staticmethod
-    def __select_reg_class(reg_id: int):
-        """Select class for special architectural registers.
-        """
-
-        reg_class = (
-            (UcAArch32.REG_RANGE_Q, UcReg128),
-        )
-
-        return next((cls for rng, cls in reg_class if reg_id in rng), None)
+    _REG_SPECIAL = {
+        const.UC_ARM_REG_CP_REG: UcRegCP
+    }
 
     def reg_read(self, reg_id: int, aux: Any = None):
-        # select register class for special cases
-        reg_cls = UcAArch32.__select_reg_class(reg_id)
-
-        if reg_cls is None:
-            if reg_id == const.UC_ARM_REG_CP_REG:
-                return self._reg_read(reg_id, UcRegCP, *aux)
-
-            else:
-                # fallback to default reading method
-                return super().reg_read(reg_id, aux)
-
-        return self._reg_read(reg_id, reg_cls)
-
-    def reg_write(self, reg_id: int, value) -> None:
-        # select register class for special cases
-        reg_cls = UcAArch32.__select_reg_class(reg_id)
+        if reg_id == const.UC_ARM_REG_CP_REG:
+            return self._reg_read(reg_id, UcRegCP, *aux)
 
-        if reg_cls is None:
-            if reg_id == const.UC_ARM_REG_CP_REG:
-                self._reg_write(reg_id, UcRegCP, value)
+        # fallback to default reading method
+        return super().reg_read(reg_id, aux)
 
-            else:
-                # fallback to default writing method
-                super().reg_write(reg_id, value)
+    def _select_reg_type(self, reg_id: int) -> Optional[Type]:
+        # registers that require auxiliary data
+        if reg_id == const.UC_ARM_REG_CP_REG:
+            return None
 
-        else:
-            self._reg_write(reg_id, reg_cls, value)
+        return super()._select_reg_type(reg_id)
 
 __all__ = ['UcRegCP', 'UcAArch32']
@@ -2,7 +2,7 @@
 """
 # @author elicn
 
-from typing import Any, Callable, NamedTuple, Tuple
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Type
 
 import ctypes
 
@@ -12,7 +12,7 @@ from unicorn.unicorn_const import UC_ERR_ARG, UC_HOOK_INSN
 
 # newly introduced unicorn imports
 from ..unicorn import Uc, UcError, uccallback
-from .types import uc_engine, UcTupledReg, UcReg128
+from .types import uc_engine, UcTupledReg
 
 ARM64CPReg = Tuple[int, int, int, int, int, int]
 
@@ -41,8 +41,9 @@ class UcAArch64(Uc):
     """Unicorn subclass for ARM64 architecture.
     """
 
-    REG_RANGE_Q = range(const.UC_ARM64_REG_Q0, const.UC_ARM64_REG_Q31 + 1)
-    REG_RANGE_V = range(const.UC_ARM64_REG_V0, const.UC_ARM64_REG_V31 + 1)
+    _REG_SPECIAL = {
+        const.UC_ARM64_REG_CP_REG: UcRegCP64
+    }
 
     def hook_add(self, htype: int, callback: Callable, user_data: Any = None, begin: int = 1, end: int = 0, aux1: int = 0, aux2: int = 0) -> int:
         if htype != UC_HOOK_INSN:
@@ -83,47 +84,20 @@ class UcAArch64(Uc):
 
         fptr = handler()
 
-        return getattr(self, '_Uc__do_hook_add')(htype, fptr, begin, end, insn)
-
-    @staticmethod
-    def __select_reg_class(reg_id: int):
-        """Select class for special architectural registers.
-        """
-
-        reg_class = (
-            (UcAArch64.REG_RANGE_Q, UcReg128),
-            (UcAArch64.REG_RANGE_V, UcReg128)
-        )
-
-        return next((cls for rng, cls in reg_class if reg_id in rng), None)
+        return self._do_hook_add(htype, fptr, begin, end, insn)
 
     def reg_read(self, reg_id: int, aux: Any = None):
-        # select register class for special cases
-        reg_cls = UcAArch64.__select_reg_class(reg_id)
-
-        if reg_cls is None:
-            if reg_id == const.UC_ARM64_REG_CP_REG:
-                return self._reg_read(reg_id, UcRegCP64, *aux)
-
-            else:
-                # fallback to default reading method
-                return super().reg_read(reg_id, aux)
-
-        return self._reg_read(reg_id, reg_cls)
-
-    def reg_write(self, reg_id: int, value) -> None:
-        # select register class for special cases
-        reg_cls = UcAArch64.__select_reg_class(reg_id)
+        if reg_id == const.UC_ARM64_REG_CP_REG:
+            return self._reg_read(reg_id, UcRegCP64, *aux)
 
-        if reg_cls is None:
-            if reg_id == const.UC_ARM64_REG_CP_REG:
-                self._reg_write(reg_id, UcRegCP64, value)
+        # fallback to default reading method
+        return super().reg_read(reg_id, aux)
 
-            else:
-                # fallback to default writing method
-                super().reg_write(reg_id, value)
+    def _select_reg_type(self, reg_id: int) -> Optional[Type]:
+        # registers that require auxiliary data
+        if reg_id == const.UC_ARM64_REG_CP_REG:
+            return None
 
-        else:
-            self._reg_write(reg_id, reg_cls, value)
+        return super()._select_reg_type(reg_id)
 
 __all__ = ['UcRegCP64', 'UcAArch64']
@@ -0,0 +1,411 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [arm64_regs.py]
+
+from ctypes import c_uint8, c_uint16, c_uint32, c_uint64
+
+from .types import UcReg128
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 8, 8, 4, 8, 4, 4, 8, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 16, 16, 16, 16, 16, 16, 16, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 16, 16, 16, 8, 4, 8, 8, 8, 4, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 32, 4, 4,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint64, c_uint64, c_uint32, c_uint64, c_uint32, c_uint32, c_uint64,
+    c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8,
+    c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8,
+    c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8,
+    c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8, c_uint8,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16,
+    c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16,
+    c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16,
+    c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16, c_uint16,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, c_uint64, c_uint32, c_uint64, c_uint64,
+    c_uint64, c_uint32, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, None, c_uint32, c_uint32,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'x29', 'x30', 'nzcv', 'sp', 'wsp', 'wzr', 'xzr',
+    'b0', 'b1', 'b2', 'b3', 'b4', 'b5', 'b6', 'b7',
+    'b8', 'b9', 'b10', 'b11', 'b12', 'b13', 'b14', 'b15',
+    'b16', 'b17', 'b18', 'b19', 'b20', 'b21', 'b22', 'b23',
+    'b24', 'b25', 'b26', 'b27', 'b28', 'b29', 'b30', 'b31',
+    'd0', 'd1', 'd2', 'd3', 'd4', 'd5', 'd6', 'd7',
+    'd8', 'd9', 'd10', 'd11', 'd12', 'd13', 'd14', 'd15',
+    'd16', 'd17', 'd18', 'd19', 'd20', 'd21', 'd22', 'd23',
+    'd24', 'd25', 'd26', 'd27', 'd28', 'd29', 'd30', 'd31',
+    'h0', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'h7',
+    'h8', 'h9', 'h10', 'h11', 'h12', 'h13', 'h14', 'h15',
+    'h16', 'h17', 'h18', 'h19', 'h20', 'h21', 'h22', 'h23',
+    'h24', 'h25', 'h26', 'h27', 'h28', 'h29', 'h30', 'h31',
+    'q0', 'q1', 'q2', 'q3', 'q4', 'q5', 'q6', 'q7',
+    'q8', 'q9', 'q10', 'q11', 'q12', 'q13', 'q14', 'q15',
+    'q16', 'q17', 'q18', 'q19', 'q20', 'q21', 'q22', 'q23',
+    'q24', 'q25', 'q26', 'q27', 'q28', 'q29', 'q30', 'q31',
+    's0', 's1', 's2', 's3', 's4', 's5', 's6', 's7',
+    's8', 's9', 's10', 's11', 's12', 's13', 's14', 's15',
+    's16', 's17', 's18', 's19', 's20', 's21', 's22', 's23',
+    's24', 's25', 's26', 's27', 's28', 's29', 's30', 's31',
+    'w0', 'w1', 'w2', 'w3', 'w4', 'w5', 'w6', 'w7',
+    'w8', 'w9', 'w10', 'w11', 'w12', 'w13', 'w14', 'w15',
+    'w16', 'w17', 'w18', 'w19', 'w20', 'w21', 'w22', 'w23',
+    'w24', 'w25', 'w26', 'w27', 'w28', 'w29', 'w30', 'x0',
+    'x1', 'x2', 'x3', 'x4', 'x5', 'x6', 'x7', 'x8',
+    'x9', 'x10', 'x11', 'x12', 'x13', 'x14', 'x15', 'x16',
+    'x17', 'x18', 'x19', 'x20', 'x21', 'x22', 'x23', 'x24',
+    'x25', 'x26', 'x27', 'x28', 'v0', 'v1', 'v2', 'v3',
+    'v4', 'v5', 'v6', 'v7', 'v8', 'v9', 'v10', 'v11',
+    'v12', 'v13', 'v14', 'v15', 'v16', 'v17', 'v18', 'v19',
+    'v20', 'v21', 'v22', 'v23', 'v24', 'v25', 'v26', 'v27',
+    'v28', 'v29', 'v30', 'v31', 'pc', 'cpacr_el1', 'tpidr_el0', 'tpidrro_el0',
+    'tpidr_el1', 'pstate', 'elr_el0', 'elr_el1', 'elr_el2', 'elr_el3', 'sp_el0', 'sp_el1',
+    'sp_el2', 'sp_el3', 'ttbr0_el1', 'ttbr1_el1', 'esr_el0', 'esr_el1', 'esr_el2', 'esr_el3',
+    'far_el0', 'far_el1', 'far_el2', 'far_el3', 'par_el1', 'mair_el1', 'vbar_el0', 'vbar_el1',
+    'vbar_el2', 'vbar_el3', 'cp_reg', 'fpcr', 'fpsr',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'x29': 1,
+    'x30': 2,
+    'nzcv': 3,
+    'sp': 4,
+    'wsp': 5,
+    'wzr': 6,
+    'xzr': 7,
+    'b0': 8,
+    'b1': 9,
+    'b2': 10,
+    'b3': 11,
+    'b4': 12,
+    'b5': 13,
+    'b6': 14,
+    'b7': 15,
+    'b8': 16,
+    'b9': 17,
+    'b10': 18,
+    'b11': 19,
+    'b12': 20,
+    'b13': 21,
+    'b14': 22,
+    'b15': 23,
+    'b16': 24,
+    'b17': 25,
+    'b18': 26,
+    'b19': 27,
+    'b20': 28,
+    'b21': 29,
+    'b22': 30,
+    'b23': 31,
+    'b24': 32,
+    'b25': 33,
+    'b26': 34,
+    'b27': 35,
+    'b28': 36,
+    'b29': 37,
+    'b30': 38,
+    'b31': 39,
+    'd0': 40,
+    'd1': 41,
+    'd2': 42,
+    'd3': 43,
+    'd4': 44,
+    'd5': 45,
+    'd6': 46,
+    'd7': 47,
+    'd8': 48,
+    'd9': 49,
+    'd10': 50,
+    'd11': 51,
+    'd12': 52,
+    'd13': 53,
+    'd14': 54,
+    'd15': 55,
+    'd16': 56,
+    'd17': 57,
+    'd18': 58,
+    'd19': 59,
+    'd20': 60,
+    'd21': 61,
+    'd22': 62,
+    'd23': 63,
+    'd24': 64,
+    'd25': 65,
+    'd26': 66,
+    'd27': 67,
+    'd28': 68,
+    'd29': 69,
+    'd30': 70,
+    'd31': 71,
+    'h0': 72,
+    'h1': 73,
+    'h2': 74,
+    'h3': 75,
+    'h4': 76,
+    'h5': 77,
+    'h6': 78,
+    'h7': 79,
+    'h8': 80,
+    'h9': 81,
+    'h10': 82,
+    'h11': 83,
+    'h12': 84,
+    'h13': 85,
+    'h14': 86,
+    'h15': 87,
+    'h16': 88,
+    'h17': 89,
+    'h18': 90,
+    'h19': 91,
+    'h20': 92,
+    'h21': 93,
+    'h22': 94,
+    'h23': 95,
+    'h24': 96,
+    'h25': 97,
+    'h26': 98,
+    'h27': 99,
+    'h28': 100,
+    'h29': 101,
+    'h30': 102,
+    'h31': 103,
+    'q0': 104,
+    'q1': 105,
+    'q2': 106,
+    'q3': 107,
+    'q4': 108,
+    'q5': 109,
+    'q6': 110,
+    'q7': 111,
+    'q8': 112,
+    'q9': 113,
+    'q10': 114,
+    'q11': 115,
+    'q12': 116,
+    'q13': 117,
+    'q14': 118,
+    'q15': 119,
+    'q16': 120,
+    'q17': 121,
+    'q18': 122,
+    'q19': 123,
+    'q20': 124,
+    'q21': 125,
+    'q22': 126,
+    'q23': 127,
+    'q24': 128,
+    'q25': 129,
+    'q26': 130,
+    'q27': 131,
+    'q28': 132,
+    'q29': 133,
+    'q30': 134,
+    'q31': 135,
+    's0': 136,
+    's1': 137,
+    's2': 138,
+    's3': 139,
+    's4': 140,
+    's5': 141,
+    's6': 142,
+    's7': 143,
+    's8': 144,
+    's9': 145,
+    's10': 146,
+    's11': 147,
+    's12': 148,
+    's13': 149,
+    's14': 150,
+    's15': 151,
+    's16': 152,
+    's17': 153,
+    's18': 154,
+    's19': 155,
+    's20': 156,
+    's21': 157,
+    's22': 158,
+    's23': 159,
+    's24': 160,
+    's25': 161,
+    's26': 162,
+    's27': 163,
+    's28': 164,
+    's29': 165,
+    's30': 166,
+    's31': 167,
+    'w0': 168,
+    'w1': 169,
+    'w2': 170,
+    'w3': 171,
+    'w4': 172,
+    'w5': 173,
+    'w6': 174,
+    'w7': 175,
+    'w8': 176,
+    'w9': 177,
+    'w10': 178,
+    'w11': 179,
+    'w12': 180,
+    'w13': 181,
+    'w14': 182,
+    'w15': 183,
+    'w16': 184,
+    'w17': 185,
+    'w18': 186,
+    'w19': 187,
+    'w20': 188,
+    'w21': 189,
+    'w22': 190,
+    'w23': 191,
+    'w24': 192,
+    'w25': 193,
+    'w26': 194,
+    'w27': 195,
+    'w28': 196,
+    'w29': 197,
+    'w30': 198,
+    'x0': 199,
+    'x1': 200,
+    'x2': 201,
+    'x3': 202,
+    'x4': 203,
+    'x5': 204,
+    'x6': 205,
+    'x7': 206,
+    'x8': 207,
+    'x9': 208,
+    'x10': 209,
+    'x11': 210,
+    'x12': 211,
+    'x13': 212,
+    'x14': 213,
+    'x15': 214,
+    'x16': 215,
+    'x17': 216,
+    'x18': 217,
+    'x19': 218,
+    'x20': 219,
+    'x21': 220,
+    'x22': 221,
+    'x23': 222,
+    'x24': 223,
+    'x25': 224,
+    'x26': 225,
+    'x27': 226,
+    'x28': 227,
+    'v0': 228,
+    'v1': 229,
+    'v2': 230,
+    'v3': 231,
+    'v4': 232,
+    'v5': 233,
+    'v6': 234,
+    'v7': 235,
+    'v8': 236,
+    'v9': 237,
+    'v10': 238,
+    'v11': 239,
+    'v12': 240,
+    'v13': 241,
+    'v14': 242,
+    'v15': 243,
+    'v16': 244,
+    'v17': 245,
+    'v18': 246,
+    'v19': 247,
+    'v20': 248,
+    'v21': 249,
+    'v22': 250,
+    'v23': 251,
+    'v24': 252,
+    'v25': 253,
+    'v26': 254,
+    'v27': 255,
+    'v28': 256,
+    'v29': 257,
+    'v30': 258,
+    'v31': 259,
+    'pc': 260,
+    'cpacr_el1': 261,
+    'tpidr_el0': 262,
+    'tpidrro_el0': 263,
+    'tpidr_el1': 264,
+    'pstate': 265,
+    'elr_el0': 266,
+    'elr_el1': 267,
+    'elr_el2': 268,
+    'elr_el3': 269,
+    'sp_el0': 270,
+    'sp_el1': 271,
+    'sp_el2': 272,
+    'sp_el3': 273,
+    'ttbr0_el1': 274,
+    'ttbr1_el1': 275,
+    'esr_el0': 276,
+    'esr_el1': 277,
+    'esr_el2': 278,
+    'esr_el3': 279,
+    'far_el0': 280,
+    'far_el1': 281,
+    'far_el2': 282,
+    'far_el3': 283,
+    'par_el1': 284,
+    'mair_el1': 285,
+    'vbar_el0': 286,
+    'vbar_el1': 287,
+    'vbar_el2': 288,
+    'vbar_el3': 289,
+    'cp_reg': 290,
+    'fpcr': 291,
+    'fpsr': 292,
+    'ip0': 215,
+    'ip1': 216,
+    'fp': 1,
+    'lr': 2,
+}
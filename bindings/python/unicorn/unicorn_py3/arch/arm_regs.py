@@ -0,0 +1,213 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [arm_regs.py]
+
+from ctypes import c_uint32, c_uint64
+
+from .types import UcReg128
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 4, 4,
+    4, 4, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 16, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 40,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint32, c_uint32,
+    c_uint32, c_uint32, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, None,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'apsr', 'apsr_nzcv', 'cpsr', 'fpexc', 'fpinst', 'fpscr', 'fpscr_nzcv',
+    'fpsid', 'itstate', 'lr', 'pc', 'sp', 'spsr', 'd0', 'd1',
+    'd2', 'd3', 'd4', 'd5', 'd6', 'd7', 'd8', 'd9',
+    'd10', 'd11', 'd12', 'd13', 'd14', 'd15', 'd16', 'd17',
+    'd18', 'd19', 'd20', 'd21', 'd22', 'd23', 'd24', 'd25',
+    'd26', 'd27', 'd28', 'd29', 'd30', 'd31', 'fpinst2', 'mvfr0',
+    'mvfr1', 'mvfr2', 'q0', 'q1', 'q2', 'q3', 'q4', 'q5',
+    'q6', 'q7', 'q8', 'q9', 'q10', 'q11', 'q12', 'q13',
+    'q14', 'q15', 'r0', 'r1', 'r2', 'r3', 'r4', 'r5',
+    'r6', 'r7', 'r8', 'r9', 'r10', 'r11', 'r12', 's0',
+    's1', 's2', 's3', 's4', 's5', 's6', 's7', 's8',
+    's9', 's10', 's11', 's12', 's13', 's14', 's15', 's16',
+    's17', 's18', 's19', 's20', 's21', 's22', 's23', 's24',
+    's25', 's26', 's27', 's28', 's29', 's30', 's31', 'c1_c0_2',
+    'c13_c0_2', 'c13_c0_3', 'ipsr', 'msp', 'psp', 'control', 'iapsr', 'eapsr',
+    'xpsr', 'epsr', 'iepsr', 'primask', 'basepri', 'basepri_max', 'faultmask', 'apsr_nzcvq',
+    'apsr_g', 'apsr_nzcvqg', 'iapsr_nzcvq', 'iapsr_g', 'iapsr_nzcvqg', 'eapsr_nzcvq', 'eapsr_g', 'eapsr_nzcvqg',
+    'xpsr_nzcvq', 'xpsr_g', 'xpsr_nzcvqg', 'cp_reg',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'apsr': 1,
+    'apsr_nzcv': 2,
+    'cpsr': 3,
+    'fpexc': 4,
+    'fpinst': 5,
+    'fpscr': 6,
+    'fpscr_nzcv': 7,
+    'fpsid': 8,
+    'itstate': 9,
+    'lr': 10,
+    'pc': 11,
+    'sp': 12,
+    'spsr': 13,
+    'd0': 14,
+    'd1': 15,
+    'd2': 16,
+    'd3': 17,
+    'd4': 18,
+    'd5': 19,
+    'd6': 20,
+    'd7': 21,
+    'd8': 22,
+    'd9': 23,
+    'd10': 24,
+    'd11': 25,
+    'd12': 26,
+    'd13': 27,
+    'd14': 28,
+    'd15': 29,
+    'd16': 30,
+    'd17': 31,
+    'd18': 32,
+    'd19': 33,
+    'd20': 34,
+    'd21': 35,
+    'd22': 36,
+    'd23': 37,
+    'd24': 38,
+    'd25': 39,
+    'd26': 40,
+    'd27': 41,
+    'd28': 42,
+    'd29': 43,
+    'd30': 44,
+    'd31': 45,
+    'fpinst2': 46,
+    'mvfr0': 47,
+    'mvfr1': 48,
+    'mvfr2': 49,
+    'q0': 50,
+    'q1': 51,
+    'q2': 52,
+    'q3': 53,
+    'q4': 54,
+    'q5': 55,
+    'q6': 56,
+    'q7': 57,
+    'q8': 58,
+    'q9': 59,
+    'q10': 60,
+    'q11': 61,
+    'q12': 62,
+    'q13': 63,
+    'q14': 64,
+    'q15': 65,
+    'r0': 66,
+    'r1': 67,
+    'r2': 68,
+    'r3': 69,
+    'r4': 70,
+    'r5': 71,
+    'r6': 72,
+    'r7': 73,
+    'r8': 74,
+    'r9': 75,
+    'r10': 76,
+    'r11': 77,
+    'r12': 78,
+    's0': 79,
+    's1': 80,
+    's2': 81,
+    's3': 82,
+    's4': 83,
+    's5': 84,
+    's6': 85,
+    's7': 86,
+    's8': 87,
+    's9': 88,
+    's10': 89,
+    's11': 90,
+    's12': 91,
+    's13': 92,
+    's14': 93,
+    's15': 94,
+    's16': 95,
+    's17': 96,
+    's18': 97,
+    's19': 98,
+    's20': 99,
+    's21': 100,
+    's22': 101,
+    's23': 102,
+    's24': 103,
+    's25': 104,
+    's26': 105,
+    's27': 106,
+    's28': 107,
+    's29': 108,
+    's30': 109,
+    's31': 110,
+    'c1_c0_2': 111,
+    'c13_c0_2': 112,
+    'c13_c0_3': 113,
+    'ipsr': 114,
+    'msp': 115,
+    'psp': 116,
+    'control': 117,
+    'iapsr': 118,
+    'eapsr': 119,
+    'xpsr': 120,
+    'epsr': 121,
+    'iepsr': 122,
+    'primask': 123,
+    'basepri': 124,
+    'basepri_max': 125,
+    'faultmask': 126,
+    'apsr_nzcvq': 127,
+    'apsr_g': 128,
+    'apsr_nzcvqg': 129,
+    'iapsr_nzcvq': 130,
+    'iapsr_g': 131,
+    'iapsr_nzcvqg': 132,
+    'eapsr_nzcvq': 133,
+    'eapsr_g': 134,
+    'eapsr_nzcvqg': 135,
+    'xpsr_nzcvq': 136,
+    'xpsr_g': 137,
+    'xpsr_nzcvqg': 138,
+    'cp_reg': 139,
+    'r13': 12,
+    'r14': 10,
+    'r15': 11,
+    'sb': 75,
+    'sl': 76,
+    'fp': 77,
+    'ip': 78,
+}
@@ -2,7 +2,7 @@
 """
 # @author elicn
 
-from typing import Any, Callable, Sequence, Tuple
+from typing import Any, Callable, Optional, Tuple, Type
 
 import ctypes
 
@@ -12,7 +12,7 @@ from unicorn.unicorn_const import UC_ERR_ARG, UC_HOOK_INSN
 
 # newly introduced unicorn imports
 from ..unicorn import Uc, UcError, uccallback
-from .types import uc_engine, UcTupledReg, UcReg128, UcReg256, UcReg512
+from .types import uc_engine, UcTupledReg
 
 X86MMRReg = Tuple[int, int, int, int]
 X86MSRReg = Tuple[int, int]
@@ -71,10 +71,15 @@ class UcIntel(Uc):
         const.UC_X86_REG_TR
     )
 
-    REG_RANGE_FP  = range(const.UC_X86_REG_FP0,  const.UC_X86_REG_FP7   + 1)
-    REG_RANGE_XMM = range(const.UC_X86_REG_XMM0, const.UC_X86_REG_XMM31 + 1)
-    REG_RANGE_YMM = range(const.UC_X86_REG_YMM0, const.UC_X86_REG_YMM31 + 1)
-    REG_RANGE_ZMM = range(const.UC_X86_REG_ZMM0, const.UC_X86_REG_ZMM31 + 1)
+    REG_RANGE_FP = range(const.UC_X86_REG_FP0, const.UC_X86_REG_FP7 + 1)
+    REG_RANGE_ST = range(const.UC_X86_REG_ST0, const.UC_X86_REG_ST7 + 1)
+
+    _REG_SPECIAL = {
+        **dict.fromkeys(REG_RANGE_MMR, UcRegMMR),
+        **dict.fromkeys(REG_RANGE_FP,  UcRegFPR),
+        **dict.fromkeys(REG_RANGE_ST,  UcRegFPR),
+        const.UC_X86_REG_MSR: UcRegMSR
+    }
 
     def hook_add(self, htype: int, callback: Callable, user_data: Any = None, begin: int = 1, end: int = 0, aux1: int = 0, aux2: int = 0) -> int:
         if htype != UC_HOOK_INSN:
@@ -125,58 +130,28 @@ class UcIntel(Uc):
 
         fptr = handler()
 
-        return getattr(self, '_Uc__do_hook_add')(htype, fptr, begin, end, insn)
-
-    @staticmethod
-    def __select_reg_class(reg_id: int):
-        """Select class for special architectural registers.
-        """
-
-        reg_class = (
-            (UcIntel.REG_RANGE_MMR, UcRegMMR),
-            (UcIntel.REG_RANGE_FP,  UcRegFPR),
-            (UcIntel.REG_RANGE_XMM, UcReg128),
-            (UcIntel.REG_RANGE_YMM, UcReg256),
-            (UcIntel.REG_RANGE_ZMM, UcReg512)
-        )
-
-        return next((cls for rng, cls in reg_class if reg_id in rng), None)
+        return self._do_hook_add(htype, fptr, begin, end, insn)
 
     def reg_read(self, reg_id: int, aux: Any = None):
-        # select register class for special cases
-        reg_cls = UcIntel.__select_reg_class(reg_id)
+        # backward compatibility: msr read through reg_read
+        if reg_id == const.UC_X86_REG_MSR:
+            if type(aux) is not int:
+                raise UcError(UC_ERR_ARG)
 
-        if reg_cls is None:
-            # backward compatibility: msr read through reg_read
-            if reg_id == const.UC_X86_REG_MSR:
-                if type(aux) is not int:
-                    raise UcError(UC_ERR_ARG)
+            return self.msr_read(aux)
 
-                value = self.msr_read(aux)
-
-            else:
-                value = super().reg_read(reg_id, aux)
-        else:
-            value = self._reg_read(reg_id, reg_cls)
-
-        return value
+        return super().reg_read(reg_id, aux)
 
     def reg_write(self, reg_id: int, value) -> None:
-        # select register class for special cases
-        reg_cls = UcIntel.__select_reg_class(reg_id)
-
-        if reg_cls is None:
-            # backward compatibility: msr write through reg_write
-            if reg_id == const.UC_X86_REG_MSR:
-                if type(value) is not tuple or len(value) != 2:
-                    raise UcError(UC_ERR_ARG)
+        # backward compatibility: msr write through reg_write
+        if reg_id == const.UC_X86_REG_MSR:
+            if type(value) is not tuple or len(value) != 2:
+                raise UcError(UC_ERR_ARG)
 
-                self.msr_write(*value)
-                return
+            self.msr_write(*value)
+            return
 
-            super().reg_write(reg_id, value)
-        else:
-            self._reg_write(reg_id, reg_cls, value)
+        super().reg_write(reg_id, value)
 
     def msr_read(self, msr_id: int) -> int:
         return self._reg_read(const.UC_X86_REG_MSR, UcRegMSR, msr_id)
@@ -184,10 +159,12 @@ class UcIntel(Uc):
     def msr_write(self, msr_id: int, value: int) -> None:
         self._reg_write(const.UC_X86_REG_MSR, UcRegMSR, (msr_id, value))
 
-    def reg_read_batch(self, reg_ids: Sequence[int]) -> Tuple:
-        reg_types = [UcIntel.__select_reg_class(rid) or self._DEFAULT_REGTYPE for rid in reg_ids]
+    def _select_reg_type(self, reg_id: int) -> Optional[Type]:
+        # registers that require auxiliary data
+        if reg_id == const.UC_X86_REG_MSR:
+            return None
 
-        return self._reg_read_batch(reg_ids, reg_types)
+        return super()._select_reg_type(reg_id)
 
 
 __all__ = ['UcRegMMR', 'UcRegMSR', 'UcRegFPR', 'UcIntel']
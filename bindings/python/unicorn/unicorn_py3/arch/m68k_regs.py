@@ -0,0 +1,46 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [m68k_regs.py]
+
+from ctypes import c_uint32
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'a0', 'a1', 'a2', 'a3', 'a4', 'a5', 'a6',
+    'a7', 'd0', 'd1', 'd2', 'd3', 'd4', 'd5', 'd6',
+    'd7', 'sr', 'pc',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'a0': 1,
+    'a1': 2,
+    'a2': 3,
+    'a3': 4,
+    'a4': 5,
+    'a5': 6,
+    'a6': 7,
+    'a7': 8,
+    'd0': 9,
+    'd1': 10,
+    'd2': 11,
+    'd3': 12,
+    'd4': 13,
+    'd5': 14,
+    'd6': 15,
+    'd7': 16,
+    'sr': 17,
+    'pc': 18,
+}
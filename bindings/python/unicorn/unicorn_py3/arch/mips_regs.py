@@ -0,0 +1,247 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [mips_regs.py]
+
+from ctypes import c_uint64
+
+from .types import UcReg128
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+    16, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128, UcReg128,
+    UcReg128, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'pc', '0', '1', '2', '3', '4', '5',
+    '6', '7', '8', '9', '10', '11', '12', '13',
+    '14', '15', '16', '17', '18', '19', '20', '21',
+    '22', '23', '24', '25', '26', '27', '28', '29',
+    '30', '31', 'dspccond', 'dspcarry', 'dspefi', 'dspoutflag', 'dspoutflag16_19', 'dspoutflag20',
+    'dspoutflag21', 'dspoutflag22', 'dspoutflag23', 'dsppos', 'dspscount', 'ac0', 'ac1', 'ac2',
+    'ac3', 'cc0', 'cc1', 'cc2', 'cc3', 'cc4', 'cc5', 'cc6',
+    'cc7', 'f0', 'f1', 'f2', 'f3', 'f4', 'f5', 'f6',
+    'f7', 'f8', 'f9', 'f10', 'f11', 'f12', 'f13', 'f14',
+    'f15', 'f16', 'f17', 'f18', 'f19', 'f20', 'f21', 'f22',
+    'f23', 'f24', 'f25', 'f26', 'f27', 'f28', 'f29', 'f30',
+    'f31', 'fcc0', 'fcc1', 'fcc2', 'fcc3', 'fcc4', 'fcc5', 'fcc6',
+    'fcc7', 'w0', 'w1', 'w2', 'w3', 'w4', 'w5', 'w6',
+    'w7', 'w8', 'w9', 'w10', 'w11', 'w12', 'w13', 'w14',
+    'w15', 'w16', 'w17', 'w18', 'w19', 'w20', 'w21', 'w22',
+    'w23', 'w24', 'w25', 'w26', 'w27', 'w28', 'w29', 'w30',
+    'w31', 'hi', 'lo', 'p0', 'p1', 'p2', 'mpl0', 'mpl1',
+    'mpl2', 'cp0_config3', 'cp0_userlocal', 'cp0_status',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'pc': 1,
+    '0': 2,
+    '1': 3,
+    '2': 4,
+    '3': 5,
+    '4': 6,
+    '5': 7,
+    '6': 8,
+    '7': 9,
+    '8': 10,
+    '9': 11,
+    '10': 12,
+    '11': 13,
+    '12': 14,
+    '13': 15,
+    '14': 16,
+    '15': 17,
+    '16': 18,
+    '17': 19,
+    '18': 20,
+    '19': 21,
+    '20': 22,
+    '21': 23,
+    '22': 24,
+    '23': 25,
+    '24': 26,
+    '25': 27,
+    '26': 28,
+    '27': 29,
+    '28': 30,
+    '29': 31,
+    '30': 32,
+    '31': 33,
+    'dspccond': 34,
+    'dspcarry': 35,
+    'dspefi': 36,
+    'dspoutflag': 37,
+    'dspoutflag16_19': 38,
+    'dspoutflag20': 39,
+    'dspoutflag21': 40,
+    'dspoutflag22': 41,
+    'dspoutflag23': 42,
+    'dsppos': 43,
+    'dspscount': 44,
+    'ac0': 45,
+    'ac1': 46,
+    'ac2': 47,
+    'ac3': 48,
+    'cc0': 49,
+    'cc1': 50,
+    'cc2': 51,
+    'cc3': 52,
+    'cc4': 53,
+    'cc5': 54,
+    'cc6': 55,
+    'cc7': 56,
+    'f0': 57,
+    'f1': 58,
+    'f2': 59,
+    'f3': 60,
+    'f4': 61,
+    'f5': 62,
+    'f6': 63,
+    'f7': 64,
+    'f8': 65,
+    'f9': 66,
+    'f10': 67,
+    'f11': 68,
+    'f12': 69,
+    'f13': 70,
+    'f14': 71,
+    'f15': 72,
+    'f16': 73,
+    'f17': 74,
+    'f18': 75,
+    'f19': 76,
+    'f20': 77,
+    'f21': 78,
+    'f22': 79,
+    'f23': 80,
+    'f24': 81,
+    'f25': 82,
+    'f26': 83,
+    'f27': 84,
+    'f28': 85,
+    'f29': 86,
+    'f30': 87,
+    'f31': 88,
+    'fcc0': 89,
+    'fcc1': 90,
+    'fcc2': 91,
+    'fcc3': 92,
+    'fcc4': 93,
+    'fcc5': 94,
+    'fcc6': 95,
+    'fcc7': 96,
+    'w0': 97,
+    'w1': 98,
+    'w2': 99,
+    'w3': 100,
+    'w4': 101,
+    'w5': 102,
+    'w6': 103,
+    'w7': 104,
+    'w8': 105,
+    'w9': 106,
+    'w10': 107,
+    'w11': 108,
+    'w12': 109,
+    'w13': 110,
+    'w14': 111,
+    'w15': 112,
+    'w16': 113,
+    'w17': 114,
+    'w18': 115,
+    'w19': 116,
+    'w20': 117,
+    'w21': 118,
+    'w22': 119,
+    'w23': 120,
+    'w24': 121,
+    'w25': 122,
+    'w26': 123,
+    'w27': 124,
+    'w28': 125,
+    'w29': 126,
+    'w30': 127,
+    'w31': 128,
+    'hi': 129,
+    'lo': 130,
+    'p0': 131,
+    'p1': 132,
+    'p2': 133,
+    'mpl0': 134,
+    'mpl1': 135,
+    'mpl2': 136,
+    'cp0_config3': 137,
+    'cp0_userlocal': 138,
+    'cp0_status': 139,
+    'zero': 2,
+    'at': 3,
+    'v0': 4,
+    'v1': 5,
+    'a0': 6,
+    'a1': 7,
+    'a2': 8,
+    'a3': 9,
+    't0': 10,
+    't1': 11,
+    't2': 12,
+    't3': 13,
+    't4': 14,
+    't5': 15,
+    't6': 16,
+    't7': 17,
+    's0': 18,
+    's1': 19,
+    's2': 20,
+    's3': 21,
+    's4': 22,
+    's5': 23,
+    's6': 24,
+    's7': 25,
+    't8': 26,
+    't9': 27,
+    'k0': 28,
+    'k1': 29,
+    'gp': 30,
+    'sp': 31,
+    'fp': 32,
+    's8': 32,
+    'ra': 33,
+    'hi0': 45,
+    'hi1': 46,
+    'hi2': 47,
+    'hi3': 48,
+    'lo0': 45,
+    'lo1': 46,
+    'lo2': 47,
+    'lo3': 48,
+}
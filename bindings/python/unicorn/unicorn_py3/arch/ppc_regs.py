@@ -0,0 +1,124 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [ppc_regs.py]
+
+from ctypes import c_uint32, c_uint64
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 4, 4, 4, 4, 4, 4, 4, 4, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 4, 8, 8, 4, 4,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint32, c_uint64, c_uint64, c_uint32, c_uint32,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'pc', '0', '1', '2', '3', '4', '5',
+    '6', '7', '8', '9', '10', '11', '12', '13',
+    '14', '15', '16', '17', '18', '19', '20', '21',
+    '22', '23', '24', '25', '26', '27', '28', '29',
+    '30', '31', 'cr0', 'cr1', 'cr2', 'cr3', 'cr4', 'cr5',
+    'cr6', 'cr7', 'fpr0', 'fpr1', 'fpr2', 'fpr3', 'fpr4', 'fpr5',
+    'fpr6', 'fpr7', 'fpr8', 'fpr9', 'fpr10', 'fpr11', 'fpr12', 'fpr13',
+    'fpr14', 'fpr15', 'fpr16', 'fpr17', 'fpr18', 'fpr19', 'fpr20', 'fpr21',
+    'fpr22', 'fpr23', 'fpr24', 'fpr25', 'fpr26', 'fpr27', 'fpr28', 'fpr29',
+    'fpr30', 'fpr31', 'lr', 'xer', 'ctr', 'msr', 'fpscr', 'cr',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'pc': 1,
+    '0': 2,
+    '1': 3,
+    '2': 4,
+    '3': 5,
+    '4': 6,
+    '5': 7,
+    '6': 8,
+    '7': 9,
+    '8': 10,
+    '9': 11,
+    '10': 12,
+    '11': 13,
+    '12': 14,
+    '13': 15,
+    '14': 16,
+    '15': 17,
+    '16': 18,
+    '17': 19,
+    '18': 20,
+    '19': 21,
+    '20': 22,
+    '21': 23,
+    '22': 24,
+    '23': 25,
+    '24': 26,
+    '25': 27,
+    '26': 28,
+    '27': 29,
+    '28': 30,
+    '29': 31,
+    '30': 32,
+    '31': 33,
+    'cr0': 34,
+    'cr1': 35,
+    'cr2': 36,
+    'cr3': 37,
+    'cr4': 38,
+    'cr5': 39,
+    'cr6': 40,
+    'cr7': 41,
+    'fpr0': 42,
+    'fpr1': 43,
+    'fpr2': 44,
+    'fpr3': 45,
+    'fpr4': 46,
+    'fpr5': 47,
+    'fpr6': 48,
+    'fpr7': 49,
+    'fpr8': 50,
+    'fpr9': 51,
+    'fpr10': 52,
+    'fpr11': 53,
+    'fpr12': 54,
+    'fpr13': 55,
+    'fpr14': 56,
+    'fpr15': 57,
+    'fpr16': 58,
+    'fpr17': 59,
+    'fpr18': 60,
+    'fpr19': 61,
+    'fpr20': 62,
+    'fpr21': 63,
+    'fpr22': 64,
+    'fpr23': 65,
+    'fpr24': 66,
+    'fpr25': 67,
+    'fpr26': 68,
+    'fpr27': 69,
+    'fpr28': 70,
+    'fpr29': 71,
+    'fpr30': 72,
+    'fpr31': 73,
+    'lr': 74,
+    'xer': 75,
+    'ctr': 76,
+    'msr': 77,
+    'fpscr': 78,
+    'cr': 79,
+}
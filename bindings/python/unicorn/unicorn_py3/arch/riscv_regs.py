@@ -0,0 +1,335 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [riscv_regs.py]
+
+from ctypes import c_uint64
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'x0', 'x1', 'x2', 'x3', 'x4', 'x5', 'x6',
+    'x7', 'x8', 'x9', 'x10', 'x11', 'x12', 'x13', 'x14',
+    'x15', 'x16', 'x17', 'x18', 'x19', 'x20', 'x21', 'x22',
+    'x23', 'x24', 'x25', 'x26', 'x27', 'x28', 'x29', 'x30',
+    'x31', 'ustatus', 'uie', 'utvec', 'uscratch', 'uepc', 'ucause', 'utval',
+    'uip', 'fflags', 'frm', 'fcsr', 'cycle', 'time', 'instret', 'hpmcounter3',
+    'hpmcounter4', 'hpmcounter5', 'hpmcounter6', 'hpmcounter7', 'hpmcounter8', 'hpmcounter9', 'hpmcounter10', 'hpmcounter11',
+    'hpmcounter12', 'hpmcounter13', 'hpmcounter14', 'hpmcounter15', 'hpmcounter16', 'hpmcounter17', 'hpmcounter18', 'hpmcounter19',
+    'hpmcounter20', 'hpmcounter21', 'hpmcounter22', 'hpmcounter23', 'hpmcounter24', 'hpmcounter25', 'hpmcounter26', 'hpmcounter27',
+    'hpmcounter28', 'hpmcounter29', 'hpmcounter30', 'hpmcounter31', 'cycleh', 'timeh', 'instreth', 'hpmcounter3h',
+    'hpmcounter4h', 'hpmcounter5h', 'hpmcounter6h', 'hpmcounter7h', 'hpmcounter8h', 'hpmcounter9h', 'hpmcounter10h', 'hpmcounter11h',
+    'hpmcounter12h', 'hpmcounter13h', 'hpmcounter14h', 'hpmcounter15h', 'hpmcounter16h', 'hpmcounter17h', 'hpmcounter18h', 'hpmcounter19h',
+    'hpmcounter20h', 'hpmcounter21h', 'hpmcounter22h', 'hpmcounter23h', 'hpmcounter24h', 'hpmcounter25h', 'hpmcounter26h', 'hpmcounter27h',
+    'hpmcounter28h', 'hpmcounter29h', 'hpmcounter30h', 'hpmcounter31h', 'mcycle', 'minstret', 'mcycleh', 'minstreth',
+    'mvendorid', 'marchid', 'mimpid', 'mhartid', 'mstatus', 'misa', 'medeleg', 'mideleg',
+    'mie', 'mtvec', 'mcounteren', 'mstatush', 'mucounteren', 'mscounteren', 'mhcounteren', 'mscratch',
+    'mepc', 'mcause', 'mtval', 'mip', 'mbadaddr', 'sstatus', 'sedeleg', 'sideleg',
+    'sie', 'stvec', 'scounteren', 'sscratch', 'sepc', 'scause', 'stval', 'sip',
+    'sbadaddr', 'sptbr', 'satp', 'hstatus', 'hedeleg', 'hideleg', 'hie', 'hcounteren',
+    'htval', 'hip', 'htinst', 'hgatp', 'htimedelta', 'htimedeltah', 'f0', 'f1',
+    'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9',
+    'f10', 'f11', 'f12', 'f13', 'f14', 'f15', 'f16', 'f17',
+    'f18', 'f19', 'f20', 'f21', 'f22', 'f23', 'f24', 'f25',
+    'f26', 'f27', 'f28', 'f29', 'f30', 'f31', 'pc',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'x0': 1,
+    'x1': 2,
+    'x2': 3,
+    'x3': 4,
+    'x4': 5,
+    'x5': 6,
+    'x6': 7,
+    'x7': 8,
+    'x8': 9,
+    'x9': 10,
+    'x10': 11,
+    'x11': 12,
+    'x12': 13,
+    'x13': 14,
+    'x14': 15,
+    'x15': 16,
+    'x16': 17,
+    'x17': 18,
+    'x18': 19,
+    'x19': 20,
+    'x20': 21,
+    'x21': 22,
+    'x22': 23,
+    'x23': 24,
+    'x24': 25,
+    'x25': 26,
+    'x26': 27,
+    'x27': 28,
+    'x28': 29,
+    'x29': 30,
+    'x30': 31,
+    'x31': 32,
+    'ustatus': 33,
+    'uie': 34,
+    'utvec': 35,
+    'uscratch': 36,
+    'uepc': 37,
+    'ucause': 38,
+    'utval': 39,
+    'uip': 40,
+    'fflags': 41,
+    'frm': 42,
+    'fcsr': 43,
+    'cycle': 44,
+    'time': 45,
+    'instret': 46,
+    'hpmcounter3': 47,
+    'hpmcounter4': 48,
+    'hpmcounter5': 49,
+    'hpmcounter6': 50,
+    'hpmcounter7': 51,
+    'hpmcounter8': 52,
+    'hpmcounter9': 53,
+    'hpmcounter10': 54,
+    'hpmcounter11': 55,
+    'hpmcounter12': 56,
+    'hpmcounter13': 57,
+    'hpmcounter14': 58,
+    'hpmcounter15': 59,
+    'hpmcounter16': 60,
+    'hpmcounter17': 61,
+    'hpmcounter18': 62,
+    'hpmcounter19': 63,
+    'hpmcounter20': 64,
+    'hpmcounter21': 65,
+    'hpmcounter22': 66,
+    'hpmcounter23': 67,
+    'hpmcounter24': 68,
+    'hpmcounter25': 69,
+    'hpmcounter26': 70,
+    'hpmcounter27': 71,
+    'hpmcounter28': 72,
+    'hpmcounter29': 73,
+    'hpmcounter30': 74,
+    'hpmcounter31': 75,
+    'cycleh': 76,
+    'timeh': 77,
+    'instreth': 78,
+    'hpmcounter3h': 79,
+    'hpmcounter4h': 80,
+    'hpmcounter5h': 81,
+    'hpmcounter6h': 82,
+    'hpmcounter7h': 83,
+    'hpmcounter8h': 84,
+    'hpmcounter9h': 85,
+    'hpmcounter10h': 86,
+    'hpmcounter11h': 87,
+    'hpmcounter12h': 88,
+    'hpmcounter13h': 89,
+    'hpmcounter14h': 90,
+    'hpmcounter15h': 91,
+    'hpmcounter16h': 92,
+    'hpmcounter17h': 93,
+    'hpmcounter18h': 94,
+    'hpmcounter19h': 95,
+    'hpmcounter20h': 96,
+    'hpmcounter21h': 97,
+    'hpmcounter22h': 98,
+    'hpmcounter23h': 99,
+    'hpmcounter24h': 100,
+    'hpmcounter25h': 101,
+    'hpmcounter26h': 102,
+    'hpmcounter27h': 103,
+    'hpmcounter28h': 104,
+    'hpmcounter29h': 105,
+    'hpmcounter30h': 106,
+    'hpmcounter31h': 107,
+    'mcycle': 108,
+    'minstret': 109,
+    'mcycleh': 110,
+    'minstreth': 111,
+    'mvendorid': 112,
+    'marchid': 113,
+    'mimpid': 114,
+    'mhartid': 115,
+    'mstatus': 116,
+    'misa': 117,
+    'medeleg': 118,
+    'mideleg': 119,
+    'mie': 120,
+    'mtvec': 121,
+    'mcounteren': 122,
+    'mstatush': 123,
+    'mucounteren': 124,
+    'mscounteren': 125,
+    'mhcounteren': 126,
+    'mscratch': 127,
+    'mepc': 128,
+    'mcause': 129,
+    'mtval': 130,
+    'mip': 131,
+    'mbadaddr': 132,
+    'sstatus': 133,
+    'sedeleg': 134,
+    'sideleg': 135,
+    'sie': 136,
+    'stvec': 137,
+    'scounteren': 138,
+    'sscratch': 139,
+    'sepc': 140,
+    'scause': 141,
+    'stval': 142,
+    'sip': 143,
+    'sbadaddr': 144,
+    'sptbr': 145,
+    'satp': 146,
+    'hstatus': 147,
+    'hedeleg': 148,
+    'hideleg': 149,
+    'hie': 150,
+    'hcounteren': 151,
+    'htval': 152,
+    'hip': 153,
+    'htinst': 154,
+    'hgatp': 155,
+    'htimedelta': 156,
+    'htimedeltah': 157,
+    'f0': 158,
+    'f1': 159,
+    'f2': 160,
+    'f3': 161,
+    'f4': 162,
+    'f5': 163,
+    'f6': 164,
+    'f7': 165,
+    'f8': 166,
+    'f9': 167,
+    'f10': 168,
+    'f11': 169,
+    'f12': 170,
+    'f13': 171,
+    'f14': 172,
+    'f15': 173,
+    'f16': 174,
+    'f17': 175,
+    'f18': 176,
+    'f19': 177,
+    'f20': 178,
+    'f21': 179,
+    'f22': 180,
+    'f23': 181,
+    'f24': 182,
+    'f25': 183,
+    'f26': 184,
+    'f27': 185,
+    'f28': 186,
+    'f29': 187,
+    'f30': 188,
+    'f31': 189,
+    'pc': 190,
+    'zero': 1,
+    'ra': 2,
+    'sp': 3,
+    'gp': 4,
+    'tp': 5,
+    't0': 6,
+    't1': 7,
+    't2': 8,
+    's0': 9,
+    'fp': 9,
+    's1': 10,
+    'a0': 11,
+    'a1': 12,
+    'a2': 13,
+    'a3': 14,
+    'a4': 15,
+    'a5': 16,
+    'a6': 17,
+    'a7': 18,
+    's2': 19,
+    's3': 20,
+    's4': 21,
+    's5': 22,
+    's6': 23,
+    's7': 24,
+    's8': 25,
+    's9': 26,
+    's10': 27,
+    's11': 28,
+    't3': 29,
+    't4': 30,
+    't5': 31,
+    't6': 32,
+    'ft0': 158,
+    'ft1': 159,
+    'ft2': 160,
+    'ft3': 161,
+    'ft4': 162,
+    'ft5': 163,
+    'ft6': 164,
+    'ft7': 165,
+    'fs0': 166,
+    'fs1': 167,
+    'fa0': 168,
+    'fa1': 169,
+    'fa2': 170,
+    'fa3': 171,
+    'fa4': 172,
+    'fa5': 173,
+    'fa6': 174,
+    'fa7': 175,
+    'fs2': 176,
+    'fs3': 177,
+    'fs4': 178,
+    'fs5': 179,
+    'fs6': 180,
+    'fs7': 181,
+    'fs8': 182,
+    'fs9': 183,
+    'fs10': 184,
+    'fs11': 185,
+    'ft8': 186,
+    'ft9': 187,
+    'ft10': 188,
+    'ft11': 189,
+}
@@ -0,0 +1,109 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [s390x_regs.py]
+
+from ctypes import c_uint32, c_uint64
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 8, 8,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint64, c_uint64,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'r0', 'r1', 'r2', 'r3', 'r4', 'r5', 'r6',
+    'r7', 'r8', 'r9', 'r10', 'r11', 'r12', 'r13', 'r14',
+    'r15', 'f0', 'f1', 'f2', 'f3', 'f4', 'f5', 'f6',
+    'f7', 'f8', 'f9', 'f10', 'f11', 'f12', 'f13', 'f14',
+    'f15', 'f16', 'f17', 'f18', 'f19', 'f20', 'f21', 'f22',
+    'f23', 'f24', 'f25', 'f26', 'f27', 'f28', 'f29', 'f30',
+    'f31', 'a0', 'a1', 'a2', 'a3', 'a4', 'a5', 'a6',
+    'a7', 'a8', 'a9', 'a10', 'a11', 'a12', 'a13', 'a14',
+    'a15', 'pc', 'pswm',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'r0': 1,
+    'r1': 2,
+    'r2': 3,
+    'r3': 4,
+    'r4': 5,
+    'r5': 6,
+    'r6': 7,
+    'r7': 8,
+    'r8': 9,
+    'r9': 10,
+    'r10': 11,
+    'r11': 12,
+    'r12': 13,
+    'r13': 14,
+    'r14': 15,
+    'r15': 16,
+    'f0': 17,
+    'f1': 18,
+    'f2': 19,
+    'f3': 20,
+    'f4': 21,
+    'f5': 22,
+    'f6': 23,
+    'f7': 24,
+    'f8': 25,
+    'f9': 26,
+    'f10': 27,
+    'f11': 28,
+    'f12': 29,
+    'f13': 30,
+    'f14': 31,
+    'f15': 32,
+    'f16': 33,
+    'f17': 34,
+    'f18': 35,
+    'f19': 36,
+    'f20': 37,
+    'f21': 38,
+    'f22': 39,
+    'f23': 40,
+    'f24': 41,
+    'f25': 42,
+    'f26': 43,
+    'f27': 44,
+    'f28': 45,
+    'f29': 46,
+    'f30': 47,
+    'f31': 48,
+    'a0': 49,
+    'a1': 50,
+    'a2': 51,
+    'a3': 52,
+    'a4': 53,
+    'a5': 54,
+    'a6': 55,
+    'a7': 56,
+    'a8': 57,
+    'a9': 58,
+    'a10': 59,
+    'a11': 60,
+    'a12': 61,
+    'a13': 62,
+    'a14': 63,
+    'a15': 64,
+    'pc': 65,
+    'pswm': 66,
+}
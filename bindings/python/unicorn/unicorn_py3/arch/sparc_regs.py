@@ -0,0 +1,140 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [sparc_regs.py]
+
+from ctypes import c_uint64
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+    8, 8, 8, 8, 8, 8, 8, 8, 8,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64, c_uint64,
+    c_uint64,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'f0', 'f1', 'f2', 'f3', 'f4', 'f5', 'f6',
+    'f7', 'f8', 'f9', 'f10', 'f11', 'f12', 'f13', 'f14',
+    'f15', 'f16', 'f17', 'f18', 'f19', 'f20', 'f21', 'f22',
+    'f23', 'f24', 'f25', 'f26', 'f27', 'f28', 'f29', 'f30',
+    'f31', 'f32', 'f34', 'f36', 'f38', 'f40', 'f42', 'f44',
+    'f46', 'f48', 'f50', 'f52', 'f54', 'f56', 'f58', 'f60',
+    'f62', 'fcc0', 'fcc1', 'fcc2', 'fcc3', 'g0', 'g1', 'g2',
+    'g3', 'g4', 'g5', 'g6', 'g7', 'i0', 'i1', 'i2',
+    'i3', 'i4', 'i5', 'fp', 'i7', 'icc', 'l0', 'l1',
+    'l2', 'l3', 'l4', 'l5', 'l6', 'l7', 'o0', 'o1',
+    'o2', 'o3', 'o4', 'o5', 'sp', 'o7', 'y', 'xcc',
+    'pc',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'f0': 1,
+    'f1': 2,
+    'f2': 3,
+    'f3': 4,
+    'f4': 5,
+    'f5': 6,
+    'f6': 7,
+    'f7': 8,
+    'f8': 9,
+    'f9': 10,
+    'f10': 11,
+    'f11': 12,
+    'f12': 13,
+    'f13': 14,
+    'f14': 15,
+    'f15': 16,
+    'f16': 17,
+    'f17': 18,
+    'f18': 19,
+    'f19': 20,
+    'f20': 21,
+    'f21': 22,
+    'f22': 23,
+    'f23': 24,
+    'f24': 25,
+    'f25': 26,
+    'f26': 27,
+    'f27': 28,
+    'f28': 29,
+    'f29': 30,
+    'f30': 31,
+    'f31': 32,
+    'f32': 33,
+    'f34': 34,
+    'f36': 35,
+    'f38': 36,
+    'f40': 37,
+    'f42': 38,
+    'f44': 39,
+    'f46': 40,
+    'f48': 41,
+    'f50': 42,
+    'f52': 43,
+    'f54': 44,
+    'f56': 45,
+    'f58': 46,
+    'f60': 47,
+    'f62': 48,
+    'fcc0': 49,
+    'fcc1': 50,
+    'fcc2': 51,
+    'fcc3': 52,
+    'g0': 53,
+    'g1': 54,
+    'g2': 55,
+    'g3': 56,
+    'g4': 57,
+    'g5': 58,
+    'g6': 59,
+    'g7': 60,
+    'i0': 61,
+    'i1': 62,
+    'i2': 63,
+    'i3': 64,
+    'i4': 65,
+    'i5': 66,
+    'fp': 67,
+    'i7': 68,
+    'icc': 69,
+    'l0': 70,
+    'l1': 71,
+    'l2': 72,
+    'l3': 73,
+    'l4': 74,
+    'l5': 75,
+    'l6': 76,
+    'l7': 77,
+    'o0': 78,
+    'o1': 79,
+    'o2': 80,
+    'o3': 81,
+    'o4': 82,
+    'o5': 83,
+    'sp': 84,
+    'o7': 85,
+    'y': 86,
+    'xcc': 87,
+    'pc': 88,
+    'o6': 84,
+    'i6': 67,
+}
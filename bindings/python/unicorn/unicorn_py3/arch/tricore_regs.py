@@ -0,0 +1,164 @@
+# For Unicorn Engine. AUTO-GENERATED FILE, DO NOT EDIT [tricore_regs.py]
+
+from ctypes import c_uint32
+
+# registers value width in bytes, indexed by register id
+REG_WIDTH = (
+    0, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    4, 4, 4, 4, 4, 4, 4, 4,
+)
+
+# registers value class, indexed by register id; None for undefined registers
+# and for registers held in an architecture-specific structure
+REG_CLASS = (
+    None, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+    c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32,
+)
+
+# registers canonical name, indexed by register id
+REG_NAME = (
+    None, 'a0', 'a1', 'a2', 'a3', 'a4', 'a5', 'a6',
+    'a7', 'a8', 'a9', 'a10', 'a11', 'a12', 'a13', 'a14',
+    'a15', 'd0', 'd1', 'd2', 'd3', 'd4', 'd5', 'd6',
+    'd7', 'd8', 'd9', 'd10', 'd11', 'd12', 'd13', 'd14',
+    'd15', 'pcxi', 'psw', 'psw_usb_c', 'psw_usb_v', 'psw_usb_sv', 'psw_usb_av', 'psw_usb_sav',
+    'pc', 'syscon', 'cpu_id', 'biv', 'btv', 'isp', 'icr', 'fcx',
+    'lcx', 'compat', 'dpr0_u', 'dpr1_u', 'dpr2_u', 'dpr3_u', 'dpr0_l', 'dpr1_l',
+    'dpr2_l', 'dpr3_l', 'cpr0_u', 'cpr1_u', 'cpr2_u', 'cpr3_u', 'cpr0_l', 'cpr1_l',
+    'cpr2_l', 'cpr3_l', 'dpm0', 'dpm1', 'dpm2', 'dpm3', 'cpm0', 'cpm1',
+    'cpm2', 'cpm3', 'mmu_con', 'mmu_asi', 'mmu_tva', 'mmu_tpa', 'mmu_tpx', 'mmu_tfa',
+    'bmacon', 'smacon', 'diear', 'dietr', 'ccdier', 'miecon', 'piear', 'pietr',
+    'ccpier', 'dbgsr', 'exevt', 'crevt', 'swevt', 'tr0evt', 'tr1evt', 'dms',
+    'dcx', 'dbgtcr', 'cctrl', 'ccnt', 'icnt', 'm1cnt', 'm2cnt', 'm3cnt',
+)
+
+# registers id by name, including aliases
+REG_ID = {
+    'a0': 1,
+    'a1': 2,
+    'a2': 3,
+    'a3': 4,
+    'a4': 5,
+    'a5': 6,
+    'a6': 7,
+    'a7': 8,
+    'a8': 9,
+    'a9': 10,
+    'a10': 11,
+    'a11': 12,
+    'a12': 13,
+    'a13': 14,
+    'a14': 15,
+    'a15': 16,
+    'd0': 17,
+    'd1': 18,
+    'd2': 19,
+    'd3': 20,
+    'd4': 21,
+    'd5': 22,
+    'd6': 23,
+    'd7': 24,
+    'd8': 25,
+    'd9': 26,
+    'd10': 27,
+    'd11': 28,
+    'd12': 29,
+    'd13': 30,
+    'd14': 31,
+    'd15': 32,
+    'pcxi': 33,
+    'psw': 34,
+    'psw_usb_c': 35,
+    'psw_usb_v': 36,
+    'psw_usb_sv': 37,
+    'psw_usb_av': 38,
+    'psw_usb_sav': 39,
+    'pc': 40,
+    'syscon': 41,
+    'cpu_id': 42,
+    'biv': 43,
+    'btv': 44,
+    'isp': 45,
+    'icr': 46,
+    'fcx': 47,
+    'lcx': 48,
+    'compat': 49,
+    'dpr0_u': 50,
+    'dpr1_u': 51,
+    'dpr2_u': 52,
+    'dpr3_u': 53,
+    'dpr0_l': 54,
+    'dpr1_l': 55,
+    'dpr2_l': 56,
+    'dpr3_l': 57,
+    'cpr0_u': 58,
+    'cpr1_u': 59,
+    'cpr2_u': 60,
+    'cpr3_u': 61,
+    'cpr0_l': 62,
+    'cpr1_l': 63,
+    'cpr2_l': 64,
+    'cpr3_l': 65,
+    'dpm0': 66,
+    'dpm1': 67,
+    'dpm2': 68,
+    'dpm3': 69,
+    'cpm0': 70,
+    'cpm1': 71,
+    'cpm2': 72,
+    'cpm3': 73,
+    'mmu_con': 74,
+    'mmu_asi': 75,
+    'mmu_tva': 76,
+    'mmu_tpa': 77,
+    'mmu_tpx': 78,
+    'mmu_tfa': 79,
+    'bmacon': 80,
+    'smacon': 81,
+    'diear': 82,
+    'dietr': 83,
+    'ccdier': 84,
+    'miecon': 85,
+    'piear': 86,
+    'pietr': 87,
+    'ccpier': 88,
+    'dbgsr': 89,
+    'exevt': 90,
+    'crevt': 91,
+    'swevt': 92,
+    'tr0evt': 93,
+    'tr1evt': 94,
+    'dms': 95,
+    'dcx': 96,
+    'dbgtcr': 97,
+    'cctrl': 98,
+    'ccnt': 99,
+    'icnt': 100,
+    'm1cnt': 101,
+    'm2cnt': 102,
+    'm3cnt': 103,
+    'ga0': 1,
+    'ga1': 2,
+    'ga8': 9,
+    'ga9': 10,
+    'sp': 11,
+    'lr': 12,
+    'ia': 16,
+    'id': 32,
+}
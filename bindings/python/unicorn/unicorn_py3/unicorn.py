@@ -3,10 +3,20 @@ based on Nguyen Anh Quynnh's work
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Optional, Sequence, Tuple, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, MutableMapping, MutableSequence, MutableSet, Optional, Sequence, Tuple, Type, TypeVar, Union
 
+import array
+import binascii
+import bisect
+import contextlib
+import copyreg
 import ctypes
 import functools
+import mmap
+import os
+import struct
+import sys
+import time
 import weakref
 
 from unicorn import unicorn_const as uc
@@ -146,6 +156,18 @@ def __load_uc_lib() -> ctypes.CDLL:
     return lib
 
 
+class uc_trace_record(ctypes.Structure):
+    """Trace record, as collected by `Uc.trace_start`
+    """
+
+    _fields_ = (
+        ('address', ctypes.c_uint64),
+        ('value',   ctypes.c_uint64),
+        ('size',    ctypes.c_uint32),
+        ('type',    ctypes.c_uint32)
+    )
+
+
 def __set_lib_prototypes(lib: ctypes.CDLL) -> None:
     """Set up library functions prototypes.
 
@@ -170,12 +192,21 @@ def __set_lib_prototypes(lib: ctypes.CDLL) -> None:
     __set_prototype('uc_errno', uc_err, uc_engine)
     __set_prototype('uc_reg_read', uc_err, uc_engine, ctypes.c_int, ctypes.c_void_p)
     __set_prototype('uc_reg_write', uc_err, uc_engine, ctypes.c_int, ctypes.c_void_p)
+    __set_prototype('uc_reg_read2', uc_err, uc_engine, ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t))
     __set_prototype('uc_reg_read_batch', uc_err, uc_engine, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_void_p), ctypes.c_int)
-    __set_prototype('uc_mem_read', uc_err, uc_engine, ctypes.c_uint64, ctypes.POINTER(ctypes.c_char), ctypes.c_size_t)
-    __set_prototype('uc_mem_write', uc_err, uc_engine, ctypes.c_uint64, ctypes.POINTER(ctypes.c_char), ctypes.c_size_t)
+    __set_prototype('uc_reg_write_batch', uc_err, uc_engine, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_void_p), ctypes.c_int)
+    __set_prototype('uc_reg_write_batch2', uc_err, uc_engine, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t), ctypes.c_int)
+    __set_prototype('uc_mem_read', uc_err, uc_engine, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_size_t)
+    __set_prototype('uc_mem_write', uc_err, uc_engine, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_size_t)
+    __set_prototype('uc_mem_read_string', uc_err, uc_engine, ctypes.c_uint64, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t))
+    __set_prototype('uc_mem_read_batch', uc_err, uc_engine, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(uc_err), ctypes.c_int)
+    __set_prototype('uc_mem_write_batch', uc_err, uc_engine, ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(uc_err), ctypes.c_int)
     __set_prototype('uc_emu_start', uc_err, uc_engine, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_size_t)
     __set_prototype('uc_emu_stop', uc_err, uc_engine)
     __set_prototype('uc_hook_del', uc_err, uc_engine, uc_hook_h)
+    __set_prototype('uc_trace_start', uc_err, uc_engine, ctypes.c_int, ctypes.c_size_t, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint64, ctypes.c_uint64)
+    __set_prototype('uc_trace_flush', uc_err, uc_engine)
+    __set_prototype('uc_trace_stop', uc_err, uc_engine)
     __set_prototype('uc_mmio_map', uc_err, uc_engine, ctypes.c_uint64, ctypes.c_size_t, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
     __set_prototype('uc_mem_map', uc_err, uc_engine, ctypes.c_uint64, ctypes.c_size_t, ctypes.c_uint32)
     __set_prototype('uc_mem_map_ptr', uc_err, uc_engine, ctypes.c_uint64, ctypes.c_size_t, ctypes.c_uint32, ctypes.c_void_p)
@@ -190,10 +221,15 @@ def __set_lib_prototypes(lib: ctypes.CDLL) -> None:
     __set_prototype('uc_context_reg_read', uc_err, uc_context, ctypes.c_int, ctypes.c_void_p)
     __set_prototype('uc_context_reg_write', uc_err, uc_context, ctypes.c_int, ctypes.c_void_p)
     __set_prototype('uc_context_reg_read_batch', uc_err, uc_context, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_void_p), ctypes.c_int)
+    __set_prototype('uc_context_reg_write_batch', uc_err, uc_context, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_void_p), ctypes.c_int)
+    __set_prototype('uc_context_reg_write_batch2', uc_err, uc_context, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t), ctypes.c_int)
     __set_prototype('uc_context_free', uc_err, uc_context)
     __set_prototype('uc_mem_regions', uc_err, uc_engine, ctypes.POINTER(ctypes.POINTER(_uc_mem_region)), ctypes.POINTER(ctypes.c_uint32))
     # https://bugs.python.org/issue42880
     __set_prototype('uc_hook_add', uc_err, uc_engine, ctypes.POINTER(uc_hook_h), ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint64, ctypes.c_uint64)
+    __set_prototype('uc_hook_add_addresses', uc_err, uc_engine, ctypes.POINTER(uc_hook_h), ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint64), ctypes.c_size_t)
+    __set_prototype('uc_hook_addresses_insert', uc_err, uc_engine, uc_hook_h, ctypes.POINTER(ctypes.c_uint64), ctypes.c_size_t)
+    __set_prototype('uc_hook_addresses_remove', uc_err, uc_engine, uc_hook_h, ctypes.POINTER(ctypes.c_uint64), ctypes.c_size_t)
     __set_prototype('uc_ctl', uc_err, uc_engine, ctypes.c_int)
 
 
@@ -210,11 +246,223 @@ HOOK_INSN_INVALID_CFUNC = ctypes.CFUNCTYPE(ctypes.c_bool, uc_engine, ctypes.c_vo
 HOOK_EDGE_GEN_CFUNC     = ctypes.CFUNCTYPE(None, uc_engine, ctypes.POINTER(uc_tb), ctypes.POINTER(uc_tb), ctypes.c_void_p)
 HOOK_TCG_OPCODE_CFUNC   = ctypes.CFUNCTYPE(None, uc_engine, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint64, ctypes.c_uint32, ctypes.c_void_p)
 
+# native hook callback signatures, by hook type
+_HOOK_CFUNCS = {
+    uc.UC_HOOK_INTR               : HOOK_INTR_CFUNC,
+    uc.UC_HOOK_CODE               : HOOK_CODE_CFUNC,
+    uc.UC_HOOK_BLOCK              : HOOK_CODE_CFUNC,
+    uc.UC_HOOK_MEM_READ_UNMAPPED  : HOOK_MEM_INVALID_CFUNC,
+    uc.UC_HOOK_MEM_WRITE_UNMAPPED : HOOK_MEM_INVALID_CFUNC,
+    uc.UC_HOOK_MEM_FETCH_UNMAPPED : HOOK_MEM_INVALID_CFUNC,
+    uc.UC_HOOK_MEM_READ_PROT      : HOOK_MEM_INVALID_CFUNC,
+    uc.UC_HOOK_MEM_WRITE_PROT     : HOOK_MEM_INVALID_CFUNC,
+    uc.UC_HOOK_MEM_FETCH_PROT     : HOOK_MEM_INVALID_CFUNC,
+    uc.UC_HOOK_MEM_READ           : HOOK_MEM_ACCESS_CFUNC,
+    uc.UC_HOOK_MEM_WRITE          : HOOK_MEM_ACCESS_CFUNC,
+    uc.UC_HOOK_MEM_FETCH          : HOOK_MEM_ACCESS_CFUNC,
+    uc.UC_HOOK_MEM_READ_AFTER     : HOOK_MEM_ACCESS_CFUNC,
+    uc.UC_HOOK_INSN_INVALID       : HOOK_INSN_INVALID_CFUNC,
+    uc.UC_HOOK_EDGE_GENERATED     : HOOK_EDGE_GEN_CFUNC,
+    uc.UC_HOOK_TCG_OPCODE         : HOOK_TCG_OPCODE_CFUNC
+}
+
+# trace consumer callback signature
+TRACE_CFUNC = ctypes.CFUNCTYPE(None, uc_engine, ctypes.POINTER(uc_trace_record), ctypes.c_size_t, ctypes.c_void_p)
+
 # mmio callback signatures
 MMIO_READ_CFUNC  = ctypes.CFUNCTYPE(ctypes.c_uint64, uc_engine, ctypes.c_uint64, ctypes.c_uint, ctypes.c_void_p)
 MMIO_WRITE_CFUNC = ctypes.CFUNCTYPE(None, uc_engine, ctypes.c_uint64, ctypes.c_uint, ctypes.c_uint64, ctypes.c_void_p)
 
 
+class _Py_buffer(ctypes.Structure):
+    """Python buffer view, as defined by the buffer protocol C API.
+    """
+
+    _fields_ = (
+        ('buf',        ctypes.c_void_p),
+        ('obj',        ctypes.c_void_p),
+        ('len',        ctypes.c_ssize_t),
+        ('itemsize',   ctypes.c_ssize_t),
+        ('readonly',   ctypes.c_int),
+        ('ndim',       ctypes.c_int),
+        ('format',     ctypes.c_char_p),
+        ('shape',      ctypes.POINTER(ctypes.c_ssize_t)),
+        ('strides',    ctypes.POINTER(ctypes.c_ssize_t)),
+        ('suboffsets', ctypes.POINTER(ctypes.c_ssize_t)),
+        ('internal',   ctypes.c_void_p)
+    )
+
+
+# buffer protocol C API; used to pin buffers and get their address without copying them
+_PyBUF_SIMPLE   = 0
+_PyBUF_WRITABLE = 1
+
+_PyObject_GetBuffer = ctypes.PYFUNCTYPE(ctypes.c_int, ctypes.py_object, ctypes.POINTER(_Py_buffer), ctypes.c_int)(('PyObject_GetBuffer', ctypes.pythonapi))
+_PyBuffer_Release = ctypes.PYFUNCTYPE(None, ctypes.POINTER(_Py_buffer))(('PyBuffer_Release', ctypes.pythonapi))
+
+
+class _PinnedBuffer:
+    """A contiguous buffer-protocol object pinned in memory until released.
+
+    While pinned, the buffer cannot be resized, closed or moved, so its address
+    may be safely handed to native code.
+    """
+
+    def __init__(self, obj, writable: bool = False) -> None:
+        self._pinned = False
+
+        with memoryview(obj) as view:
+            readonly = view.readonly
+            contiguous = view.c_contiguous
+
+        if not contiguous:
+            raise TypeError('underlying buffer is not C contiguous')
+
+        if readonly and writable:
+            raise TypeError('underlying buffer is not writable')
+
+        self._pybuf = _Py_buffer()
+        _PyObject_GetBuffer(obj, ctypes.byref(self._pybuf), _PyBUF_WRITABLE if writable else _PyBUF_SIMPLE)
+
+        self._pinned = True
+
+    @property
+    def address(self) -> int:
+        return self._pybuf.buf or 0
+
+    @property
+    def size(self) -> int:
+        return self._pybuf.len
+
+    def release(self) -> None:
+        if self._pinned:
+            _PyBuffer_Release(ctypes.byref(self._pybuf))
+
+            self._pinned = False
+
+    def __del__(self) -> None:
+        self.release()
+
+
+class _MemIndex:
+    """An index of mapped memory regions, sorted by address.
+
+    Regions are represented the same way `Uc.mem_regions` reports them: as tuples
+    of begin, end (inclusive) and perms.
+    """
+
+    def __init__(self, regions: Iterable[Tuple[int, int, int]] = ()) -> None:
+        self._regions = sorted(regions)
+        self._begins = [begin for begin, _, _ in self._regions]
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        return iter(self._regions)
+
+    def insert(self, begin: int, end: int, perms: int) -> None:
+        i = bisect.bisect_left(self._begins, begin)
+
+        self._begins.insert(i, begin)
+        self._regions.insert(i, (begin, end, perms))
+
+    def update(self, begin: int, end: int, perms: Optional[int]) -> None:
+        """Set perms of a range, splitting regions it partially covers. If perms
+        is `None`, the range is removed instead.
+        """
+
+        lo = max(bisect.bisect_right(self._begins, begin) - 1, 0)
+        hi = bisect.bisect_right(self._begins, end)
+
+        updated = []
+
+        for rbegin, rend, rperms in self._regions[lo:hi]:
+            if rend < begin:
+                updated.append((rbegin, rend, rperms))
+                continue
+
+            if rbegin < begin:
+                updated.append((rbegin, begin - 1, rperms))
+
+            if perms is not None:
+                updated.append((max(rbegin, begin), min(rend, end), perms))
+
+            if rend > end:
+                updated.append((end + 1, rend, rperms))
+
+        self._regions[lo:hi] = updated
+        self._begins[lo:hi] = [rbegin for rbegin, _, _ in updated]
+
+    def find(self, address: int) -> Optional[Tuple[int, int, int]]:
+        i = bisect.bisect_right(self._begins, address) - 1
+
+        if i >= 0 and self._regions[i][1] >= address:
+            return self._regions[i]
+
+        return None
+
+    def overlaps(self, begin: int, end: int) -> bool:
+        i = bisect.bisect_right(self._begins, end) - 1
+
+        return i >= 0 and self._regions[i][1] >= begin
+
+    def covers(self, begin: int, end: int) -> bool:
+        i = bisect.bisect_right(self._begins, begin) - 1
+
+        # follow adjacent regions till the end of the range is reached
+        while 0 <= i < len(self._regions) and self._regions[i][0] <= begin <= self._regions[i][1]:
+            if self._regions[i][1] >= end:
+                return True
+
+            begin = self._regions[i][1] + 1
+            i += 1
+
+        return False
+
+    def gaps(self, begin: int, end: int) -> Iterator[Tuple[int, int]]:
+        """Iterate through unmapped ranges between begin and end (inclusive).
+        """
+
+        i = max(bisect.bisect_right(self._begins, begin) - 1, 0)
+
+        for rbegin, rend, _ in self._regions[i:]:
+            if rbegin > end:
+                break
+
+            if rbegin > begin:
+                yield begin, rbegin - 1
+
+            begin = max(begin, rend + 1)
+
+        if begin <= end:
+            yield begin, end
+
+
+@contextlib.contextmanager
+def _buffer_ref(obj, writable: bool = False) -> Iterator[Tuple[Any, int]]:
+    """Reference the underlying memory of a buffer-protocol object without
+    copying it. The buffer is pinned for the duration of the context.
+
+    Args:
+        obj      : a contiguous buffer-protocol object
+        writable : whether the buffer is required to be writable
+
+    Returns: a ctypes-compatible pointer to the buffer data and its size in bytes
+
+    Raises: `TypeError` in case obj does not satisfy the requirements
+    """
+
+    # bytes are passed to native code as-is, with no copy
+    if type(obj) is bytes and not writable:
+        yield obj, len(obj)
+
+    else:
+        pinned = _PinnedBuffer(obj, writable)
+
+        try:
+            yield ctypes.c_void_p(pinned.address), pinned.size
+        finally:
+            pinned.release()
+
+
 class UcError(Exception):
     """Unicorn base exception.
 
@@ -314,17 +562,192 @@ def uccallback(uc: Uc, functype: Type[_CFP]):
             try:
                 return func(uc, *args, **kwargs)
             except Exception as e:
-                # If multiple hooks raise exceptions, just use the first one
-                if uc._hook_exception is None:
-                    uc._hook_exception = e
-
-                uc.emu_stop()
+                _hook_failed(uc, e)
 
         return ctypes.cast(functype(wrapper), functype)
 
     return decorate
 
 
+def _hook_failed(uc: Uc, e: Exception) -> None:
+    """Record an exception raised during hook handling and stop emulation.
+    """
+
+    # If multiple hooks raise exceptions, just use the first one
+    if uc._hook_exception is None:
+        uc._hook_exception = e
+
+    uc.emu_stop()
+
+
+def _select_hook_handler(htype: int, handlers: Mapping[int, Any]) -> Any:
+    """Pick the handler that htype refers to.
+
+    Raises: `UcError` in case of an invalid htype value
+    """
+
+    # the same callback may be registered for multiple hook types if they
+    # share the same handling method. here we iterate through htype set bits
+    # and collect all unique handlers it refers to (no duplicates)
+    matched = set(handlers.get(1 << n) for n in range(32) if htype & (1 << n))
+
+    # the set of matched handlers is expected to include exactly one element.
+    # more than one member indicates that htype refers to more than one handler
+    # at the same time, whereas callbacks cannot be assigned to different handlers.
+    # an empty set indicates a matching handler was not found, probably due to
+    # an invalid htype value
+    if len(matched) != 1:
+        raise UcError(uc.UC_ERR_ARG)
+
+    handler = matched.pop()
+
+    # a None element indicates that htype has an unrecognized bit set
+    if handler is None:
+        raise UcError(uc.UC_ERR_ARG)
+
+    return handler
+
+
+# architectures names, as used by the generated constants and registers tables modules
+_ARCH_NAMES = {
+    uc.UC_ARCH_ARM     : 'arm',
+    uc.UC_ARCH_ARM64   : 'arm64',
+    uc.UC_ARCH_MIPS    : 'mips',
+    uc.UC_ARCH_X86     : 'x86',
+    uc.UC_ARCH_PPC     : 'ppc',
+    uc.UC_ARCH_SPARC   : 'sparc',
+    uc.UC_ARCH_M68K    : 'm68k',
+    uc.UC_ARCH_RISCV   : 'riscv',
+    uc.UC_ARCH_S390X   : 's390x',
+    uc.UC_ARCH_TRICORE : 'tricore'
+}
+
+
+def _uc_subclass(arch: int) -> Type[Uc]:
+    """Get the Uc subclass that handles a specific architecture.
+    """
+
+    import importlib
+
+    def __uc_subclass(pkgname: str, clsname: str):
+        """Use a lazy subclass instantiation to avoid importing unnecessary arch
+        classes.
+        """
+
+        def __wrapped() -> Type[Uc]:
+            archmod = importlib.import_module(f'.arch.{pkgname}', 'unicorn.unicorn_py3')
+
+            return getattr(archmod, clsname)
+
+        return __wrapped
+
+    def __uc_generic():
+        return Uc
+
+    wrapped: Callable[[], Type[Uc]] = {
+        uc.UC_ARCH_ARM     : __uc_subclass('arm', 'UcAArch32'),
+        uc.UC_ARCH_ARM64   : __uc_subclass('arm64', 'UcAArch64'),
+        uc.UC_ARCH_MIPS    : __uc_generic,
+        uc.UC_ARCH_X86     : __uc_subclass('intel', 'UcIntel'),
+        uc.UC_ARCH_PPC     : __uc_generic,
+        uc.UC_ARCH_SPARC   : __uc_generic,
+        uc.UC_ARCH_M68K    : __uc_generic,
+        uc.UC_ARCH_RISCV   : __uc_generic,
+        uc.UC_ARCH_S390X   : __uc_generic,
+        uc.UC_ARCH_TRICORE : __uc_generic
+    }[arch]
+
+    return wrapped()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_reg_tables(arch: int):
+    """Get the registers metadata tables of a specific architecture, as generated
+    by const_generator.py
+    """
+
+    import importlib
+
+    return importlib.import_module(f'.arch.{_ARCH_NAMES[arch]}_regs', 'unicorn.unicorn_py3')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_reg_classes(arch: int) -> Tuple[Type, ...]:
+    """Get the registers value classes of a specific architecture, indexed by register id.
+
+    Registers held in architecture-specific structures take their classes from the
+    architecture subclass, and undefined registers fall back to the default class.
+    """
+
+    special = _uc_subclass(arch)._REG_SPECIAL
+
+    return tuple(special.get(reg_id) or regtype or RegStateManager._DEFAULT_REGTYPE for reg_id, regtype in enumerate(_load_reg_tables(arch).REG_CLASS))
+
+
+def _names(fmt: str, stop: int, start: int = 0) -> Tuple[str, ...]:
+    """Generate a sequence of numbered registers names.
+    """
+
+    return tuple(fmt.format(i) for i in range(start, stop))
+
+
+# registers included in cpu state dumps, keyed by architecture or by (architecture, mode)
+# where the registers set depends on the processor mode. each entry lists the general
+# purpose, flags, pc and sp registers, and then the fp and simd registers that are only
+# included on request
+_REG_DUMP_SETS: Mapping[Any, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    (uc.UC_ARCH_X86, uc.UC_MODE_16): (
+        ('ax', 'bx', 'cx', 'dx', 'si', 'di', 'bp', 'sp', 'ip', 'flags', 'cs', 'ds', 'es', 'fs', 'gs', 'ss'),
+        (*_names('fp{}', 8), 'fpcw', 'fpsw', 'fptag', *_names('xmm{}', 8), 'mxcsr')
+    ),
+    (uc.UC_ARCH_X86, uc.UC_MODE_32): (
+        # segment selectors are left out in protected mode, where loading them is subject to descriptor checks
+        ('eax', 'ebx', 'ecx', 'edx', 'esi', 'edi', 'ebp', 'esp', 'eip', 'eflags'),
+        (*_names('fp{}', 8), 'fpcw', 'fpsw', 'fptag', *_names('xmm{}', 8), 'mxcsr')
+    ),
+    (uc.UC_ARCH_X86, uc.UC_MODE_64): (
+        ('rax', 'rbx', 'rcx', 'rdx', 'rsi', 'rdi', 'rbp', 'rsp', *_names('r{}', 16, 8), 'rip', 'rflags', 'cs', 'ds', 'es', 'fs', 'gs', 'ss', 'fs_base', 'gs_base'),
+        (*_names('fp{}', 8), 'fpcw', 'fpsw', 'fptag', *_names('xmm{}', 16), 'mxcsr')
+    ),
+    uc.UC_ARCH_ARM: (
+        (*_names('r{}', 13), 'sp', 'lr', 'pc', 'cpsr'),
+        (*_names('d{}', 32), 'fpscr')
+    ),
+    uc.UC_ARCH_ARM64: (
+        (*_names('x{}', 31), 'sp', 'pc', 'nzcv'),
+        (*_names('q{}', 32), 'fpcr', 'fpsr')
+    ),
+    uc.UC_ARCH_MIPS: (
+        (*_names('{}', 32), 'pc', 'hi', 'lo'),
+        ()
+    ),
+    uc.UC_ARCH_PPC: (
+        (*_names('{}', 32), 'pc', 'lr', 'ctr', 'msr', 'xer', 'cr'),
+        (*_names('fpr{}', 32), 'fpscr')
+    ),
+    uc.UC_ARCH_SPARC: (
+        (*_names('g{}', 8), *_names('o{}', 8), *_names('l{}', 8), *_names('i{}', 8), 'pc'),
+        ()
+    ),
+    uc.UC_ARCH_M68K: (
+        (*_names('d{}', 8), *_names('a{}', 8), 'pc', 'sr'),
+        ()
+    ),
+    uc.UC_ARCH_RISCV: (
+        (*_names('x{}', 32), 'pc'),
+        _names('f{}', 32)
+    ),
+    uc.UC_ARCH_S390X: (
+        (*_names('r{}', 16), *_names('a{}', 16), 'pc', 'pswm'),
+        ()
+    ),
+    uc.UC_ARCH_TRICORE: (
+        (*_names('d{}', 16), *_names('a{}', 16), 'pc', 'psw', 'pcxi'),
+        ()
+    )
+}
+
+
 class RegStateManager:
     """Registers state manager.
 
@@ -334,6 +757,11 @@ class RegStateManager:
 
     _DEFAULT_REGTYPE = ctypes.c_uint64
 
+    # registers value classes and metadata tables of the emulated architecture;
+    # set by mixin instances
+    _reg_classes: Sequence[Type] = ()
+    _reg_tables: Any = None
+
     def _do_reg_read(self, reg_id: int, reg_obj) -> int:
         """Private register read implementation.
         Must be implemented by the mixin object
@@ -355,7 +783,7 @@ class RegStateManager:
 
         raise NotImplementedError
 
-    def _do_reg_write_batch(self, reglist, count) -> int:
+    def _do_reg_write_batch(self, reglist, vallist, sizelist, count) -> int:
         """Private batch register write implementation.
         Must be implemented by the mixin object
         """
@@ -410,6 +838,25 @@ class RegStateManager:
 
         return tuple(v.value for v in val_list)
 
+    def _reg_write_batch(self, reg_info: Sequence[Tuple[int, Any]], reg_types: Sequence[Type]) -> None:
+        """Batch register write helper method.
+        """
+
+        assert len(reg_info) == len(reg_types)
+
+        count = len(reg_info)
+        reg_list = (ctypes.c_int * count)(*(reg_id for reg_id, _ in reg_info))
+        val_list = [self.__get_reg_write_arg(rtype, value) for (_, value), rtype in zip(reg_info, reg_types)]
+        ptr_list = (ctypes.c_void_p * count)(*(ctypes.c_void_p(ctypes.addressof(elem)) for elem in val_list))
+
+        # let the engine verify each value is large enough to hold its register
+        size_list = (ctypes.c_size_t * count)(*(ctypes.sizeof(elem) for elem in val_list))
+
+        status = self._do_reg_write_batch(reg_list, ptr_list, size_list, ctypes.c_int(count))
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
     def reg_read(self, reg_id: int, aux: Any = None):
         """Read architectural register value.
 
@@ -422,7 +869,7 @@ class RegStateManager:
         Raises: `UcError` in case of invalid register id or auxiliary data
         """
 
-        return self._reg_read(reg_id, self._DEFAULT_REGTYPE)
+        return self._reg_read(reg_id, self._reg_class(reg_id))
 
     def reg_write(self, reg_id: int, value) -> None:
         """Write to architectural register.
@@ -434,7 +881,7 @@ class RegStateManager:
         Raises: `UcError` in case of invalid register id or value format
         """
 
-        self._reg_write(reg_id, self._DEFAULT_REGTYPE, value)
+        self._reg_write(reg_id, self._reg_class(reg_id), value)
 
     def reg_read_batch(self, reg_ids: Sequence[int]) -> Tuple:
         """Read a sequence of architectural registers.
@@ -447,10 +894,28 @@ class RegStateManager:
         Raises: `UcError` in case of invalid register id
         """
 
-        reg_types = [self._DEFAULT_REGTYPE for _ in range(len(reg_ids))]
+        reg_types = [self._reg_class(rid) for rid in reg_ids]
 
         return self._reg_read_batch(reg_ids, reg_types)
 
+    def _reg_class(self, reg_id: int) -> Type:
+        """Get the class used to hold a register value.
+        """
+
+        classes = self._reg_classes
+
+        # undefined registers are left for the engine to reject
+        return classes[reg_id] if 0 <= reg_id < len(classes) else self._DEFAULT_REGTYPE
+
+    def _select_reg_type(self, reg_id: int) -> Optional[Type]:
+        """Select the class used to hold a register value.
+
+        Returns: register class, or `None` if the register cannot be accessed
+        without auxiliary data
+        """
+
+        return self._reg_class(reg_id)
+
     def reg_write_batch(self, reg_info: Sequence[Tuple[int, Any]]) -> None:
         """Write a sequece of architectural registers.
 
@@ -460,503 +925,1887 @@ class RegStateManager:
         Raises: `UcError` in case of invalid register id or value format
         """
 
-        # TODO
-        ...
+        reg_types = [self._reg_class(rid) for rid, _ in reg_info]
 
-def ucsubclass(cls):
-    """Uc subclass decorator.
+        self._reg_write_batch(reg_info, reg_types)
 
-    Use it to decorate user-defined Uc subclasses.
+    def reg_read_vector(self, reg_id: int, lanes: Optional[str] = None) -> Union[bytes, memoryview]:
+        """Read a large register (e.g. xmm, ymm, neon) as raw bytes instead of a
+        single integer. Bytes are returned in host order, which is lane order on
+        little-endian hosts.
 
-    Example:
-    >>> @ucsubclass
-    ... class Pegasus(Uc):
-    ...     '''A Unicorn impl with wings
-    ...     '''
-    ...     pass
-    """
+        Args:
+            reg_id : register identifier (architecture-specific enumeration)
+            lanes  : lanes type code to view the value as (see `array` module type codes,
+                     e.g. 'I' for u32 lanes or 'd' for f64 lanes) [optional]
 
-    # to maintain proper inheritance for user-defined Uc subclasses, the Uc
-    # base class is replaced with the appropriate Uc pre-defined subclass on
-    # first instantiation.
-    #
-    # for example, if the Pegasus class from the example above instantiates
-    # with Intel arch and 64-bit mode, the Pegasus class will be modified to
-    # inherit from UcIntel and only then Uc, instead of Uc directly. that is:
-    # Pegasus -> UcIntel -> Uc -> RegStateManager -> object
-    #
-    # note that all Pegasus subclasses will have the same inheritence chain,
-    # regardless of the arch and mode the might use to initialize.
+        Returns: register value as bytes, or as a read-only lanes memoryview if lanes
+        type was specified
 
-    def __replace(seq: Tuple, item, repl) -> Tuple:
-        if item not in seq:
-            return seq
+        Raises: `UcError` in case of invalid register id
+        """
 
-        i = seq.index(item)
+        reg = self._reg_class(reg_id)()
+        status = self._do_reg_read(reg_id, ctypes.byref(reg))
 
-        return seq[:i] + tuple([repl]) + seq[i + 1:]
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, reg_id)
 
-    def __new_uc_subclass(cls, arch: int, mode: int):
-        # resolve the appropriate Uc subclass
-        subcls = Uc.__new__(cls, arch, mode)
+        data = bytes(reg)
 
-        # set the resolved subclass as base class instead of Uc (if there)
-        cls.__bases__ = __replace(cls.__bases__, Uc, type(subcls))
+        return data if lanes is None else memoryview(data).cast(lanes)
 
-        return object.__new__(cls)
+    def reg_write_vector(self, reg_id: int, value) -> None:
+        """Write a large register (e.g. xmm, ymm, neon) from raw bytes, in the same
+        forms `reg_read_vector` returns.
 
-    setattr(cls, '__new__', __new_uc_subclass)
+        Args:
+            reg_id : register identifier (architecture-specific enumeration)
+            value  : a contiguous buffer-protocol object (e.g. bytes, memoryview or array)
+                     whose size is the register size
 
-    return cls
+        Raises: `UcError` in case of invalid register id or value size
+        """
 
+        size = ctypes.sizeof(self._reg_class(reg_id))
 
-class Uc(RegStateManager):
-    """Unicorn Engine class.
-    """
+        with _buffer_ref(value) as (ptr, length):
+            if length != size:
+                raise UcError(uc.UC_ERR_ARG, reg_id)
 
-    @staticmethod
-    def __is_compliant() -> bool:
-        """Checks whether Unicorn binding version complies with Unicorn library.
+            status = self._do_reg_write(reg_id, ptr)
 
-        Returns: `True` if versions match, `False` otherwise
-        """
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, reg_id)
 
-        uc_maj, uc_min, _ = uc_version()
-        bnd_maj, bnd_min, _ = version_bind()
+    def reg_read_vector_batch(self, reg_ids: Sequence[int], lanes: Optional[str] = None) -> Tuple[memoryview, ...]:
+        """Read a sequence of large registers as raw bytes at once. Values are read
+        into a single buffer, and returned as views over it.
 
-        return (uc_maj, uc_min) == (bnd_maj, bnd_min)
+        Args:
+            reg_ids : a sequence of register identifiers (architecture-specific enumeration)
+            lanes   : lanes type code to view the values as (see `array` module type codes) [optional]
 
-    def __new__(cls, arch: int, mode: int, cpu: Optional[int] = None):
-        # verify version compatibility with the core before doing anything
-        if not Uc.__is_compliant():
-            raise UcError(uc.UC_ERR_VERSION)
+        Returns: a tuple of memoryviews of the registers values, as bytes or as lanes if
+        lanes type was specified
 
-        import importlib
+        Raises: `UcError` in case of invalid register id
 
-        def __uc_subclass(pkgname: str, clsname: str):
-            """Use a lazy subclass instantiation to avoid importing unnecessary arch
-            classes.
-            """
+        Example:
+            >>> uc.reg_read_vector_batch(range(UC_ARM64_REG_Q0, UC_ARM64_REG_Q31 + 1), 'I')
+        """
 
-            def __wrapped() -> Type[Uc]:
-                archmod = importlib.import_module(f'.arch.{pkgname}', 'unicorn.unicorn_py3')
+        count = len(reg_ids)
+        sizes = [ctypes.sizeof(self._reg_class(rid)) for rid in reg_ids]
+        offsets = [sum(sizes[:i]) for i in range(count)]
 
-                return getattr(archmod, clsname)
+        data = bytearray(sum(sizes))
 
-            return __wrapped
+        with _buffer_ref(data, writable=True) as (ptr, _):
+            reg_list = (ctypes.c_int * count)(*reg_ids)
+            ptr_list = (ctypes.c_void_p * count)(*(ptr.value + offset for offset in offsets))
 
-        def __uc_generic():
-            return Uc
+            status = self._do_reg_read_batch(reg_list, ptr_list, ctypes.c_int(count))
 
-        wrapped: Callable[[], Type[Uc]] = {
-            uc.UC_ARCH_ARM     : __uc_subclass('arm', 'UcAArch32'),
-            uc.UC_ARCH_ARM64   : __uc_subclass('arm64', 'UcAArch64'),
-            uc.UC_ARCH_MIPS    : __uc_generic,
-            uc.UC_ARCH_X86     : __uc_subclass('intel', 'UcIntel'),
-            uc.UC_ARCH_PPC     : __uc_generic,
-            uc.UC_ARCH_SPARC   : __uc_generic,
-            uc.UC_ARCH_M68K    : __uc_generic,
-            uc.UC_ARCH_RISCV   : __uc_generic,
-            uc.UC_ARCH_S390X   : __uc_generic,
-            uc.UC_ARCH_TRICORE : __uc_generic
-        }[arch]
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
 
-        subclass = wrapped()
+        view = memoryview(data)
 
-        # return the appropriate unicorn subclass type
-        return super(Uc, cls).__new__(subclass)
+        if lanes is not None:
+            return tuple(view[offset:offset + size].cast(lanes) for offset, size in zip(offsets, sizes))
 
-    def __init__(self, arch: int, mode: int, cpu: Optional[int] = None) -> None:
-        """Initialize a Unicorn engine instance.
+        return tuple(view[offset:offset + size] for offset, size in zip(offsets, sizes))
+
+    def reg_write_vector_batch(self, reg_info: Sequence[Tuple[int, Any]]) -> None:
+        """Write a sequence of large registers from raw bytes at once.
 
         Args:
-            arch: emulated architecture identifier (see UC_ARCH_* constants)
-            mode: emulated processor mode (see UC_MODE_* constants)
-            cpu: emulated cpu model (see UC_CPU_* constants) [optional]
+            reg_info: a sequence of tuples consisting of register identifiers and
+            contiguous buffer-protocol objects whose sizes are the registers sizes
+
+        Raises: `UcError` in case of invalid register id or value size
         """
 
-        self._arch = arch
-        self._mode = mode
+        count = len(reg_info)
+        reg_list = (ctypes.c_int * count)(*(reg_id for reg_id, _ in reg_info))
+        ptr_list = (ctypes.c_void_p * count)()
+        size_list = (ctypes.c_size_t * count)()
 
-        # initialize the unicorn instance
-        self._uch = uc_engine()
-        status = uclib.uc_open(arch, mode, ctypes.byref(self._uch))
+        with contextlib.ExitStack() as stack:
+            for i, (reg_id, value) in enumerate(reg_info):
+                ptr, length = stack.enter_context(_buffer_ref(value))
+
+                if length != ctypes.sizeof(self._reg_class(reg_id)):
+                    raise UcError(uc.UC_ERR_ARG, reg_id)
+
+                ptr_list[i] = ctypes.cast(ptr, ctypes.c_void_p).value
+                size_list[i] = length
+
+            status = self._do_reg_write_batch(reg_list, ptr_list, size_list, ctypes.c_int(count))
 
         if status != uc.UC_ERR_OK:
-            self._uch = None
             raise UcError(status)
 
-        if cpu is not None:
-            self.ctl_set_cpu_model(cpu)
+    def _make_reg_reader(self, reg_ids: Sequence[int], reg_types: Sequence[Type]) -> UcRegReader:
+        """Register reader plan factory helper method.
+        """
 
-        # we have to keep a reference to the callbacks so they do not get gc-ed
-        # see: https://docs.python.org/3/library/ctypes.html#callback-functions
-        self._callbacks: MutableMapping[int, ctypes._FuncPointer] = {}
-        self._mmio_callbacks: MutableMapping[Tuple[int, int], Tuple[Optional[MMIO_READ_CFUNC], Optional[MMIO_WRITE_CFUNC]]] = {}
+        return UcRegReader(self, reg_ids, reg_types)
 
-        self._hook_exception: Optional[Exception] = None
+    def _make_reg_writer(self, reg_ids: Sequence[int], reg_types: Sequence[Type]) -> UcRegWriter:
+        """Register writer plan factory helper method.
+        """
 
-        # create a finalizer object that will apropriately free up resources when
-        # this instance undergoes garbage collection.
-        self.__finalizer = weakref.finalize(self, Uc.release_handle, self._uch)
+        return UcRegWriter(self, reg_ids, reg_types)
 
-    @staticmethod
-    def release_handle(uch: uc_engine) -> None:
-        # this method and its arguments must not have any reference to the Uc instance being
-        # destroyed. namely, this method cannot be a bound method.
+    def make_reg_reader(self, reg_ids: Sequence[int]) -> UcRegReader:
+        """Prepare a reusable plan for reading a fixed sequence of registers.
 
-        if uch:
-            try:
-                status = uclib.uc_close(uch)
+        Register classes are resolved and all ctypes arrays are allocated once,
+        so every invocation of the plan boils down to a single batch read.
 
-            # _uc might be pulled from under our feet
-            except:
-                pass
+        Args:
+            reg_ids: a sequence of register identifiers (architecture-specific enumeration)
 
-            else:
-                if status != uc.UC_ERR_OK:
-                    raise UcError(status)
+        Returns: a callable register reader plan
+        """
 
-    ###########################
-    #  Emulation controllers  #
-    ###########################
+        reg_types = [self._reg_class(rid) for rid in reg_ids]
 
-    def emu_start(self, begin: int, until: int, timeout: int = 0, count: int = 0) -> None:
-        """Start emulation from a specified address to another.
+        return self._make_reg_reader(reg_ids, reg_types)
 
-        Args:
-            begin   : emulation starting address
-            until   : emulation ending address
-            timeout : limit emulation to a certain amount of time (milliseconds)
-            count   : limit emulation to a certain amount of instructions
+    def make_reg_writer(self, reg_ids: Sequence[int]) -> UcRegWriter:
+        """Prepare a reusable plan for writing a fixed sequence of registers.
 
-        Raises:
-            `UcError`   : in case emulation could not be started properly
-            `Exception` : in case an error has been encountered during emulation
+        Register classes are resolved and all ctypes arrays are allocated once,
+        so every invocation of the plan boils down to a single batch write.
+
+        Args:
+            reg_ids: a sequence of register identifiers (architecture-specific enumeration)
+
+        Returns: a callable register writer plan
         """
 
-        self._hook_exception = None
-        status = uclib.uc_emu_start(self._uch, begin, until, timeout, count)
+        reg_types = [self._reg_class(rid) for rid in reg_ids]
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        return self._make_reg_writer(reg_ids, reg_types)
 
-        if self._hook_exception is not None:
-            raise self._hook_exception
+    def reg_name(self, reg_id: int) -> Optional[str]:
+        """Get the canonical name of an architectural register.
 
-    def emu_stop(self) -> None:
-        """Stop emulation.
+        Args:
+            reg_id: register identifier (architecture-specific enumeration)
 
-        Raises: `UcError` in case emulation could not be stopped properly
+        Returns: lowercase register name, or `None` if register is undefined
         """
 
-        status = uclib.uc_emu_stop(self._uch)
+        names = self._reg_tables.REG_NAME
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        return names[reg_id] if 0 <= reg_id < len(names) else None
 
-    ###########################
-    #  CPU state accessors    #
-    ###########################
+    def reg_id(self, name: str) -> int:
+        """Get the identifier of an architectural register by name.
 
-    def _do_reg_read(self, reg_id: int, reg_obj) -> int:
-        """Private register read implementation.
-        Do not call directly.
-        """
+        Args:
+            name: register name or alias (case insensitive)
 
-        return uclib.uc_reg_read(self._uch, reg_id, reg_obj)
+        Returns: register identifier (architecture-specific enumeration)
 
-    def _do_reg_write(self, reg_id: int, reg_obj) -> int:
-        """Private register write implementation.
-        Do not call directly.
+        Raises: `UcError` in case of an undefined register name
         """
 
-        return uclib.uc_reg_write(self._uch, reg_id, reg_obj)
-
-    def _do_reg_read_batch(self, reglist, vallist, count) -> int:
-        """Private batch register read implementation.
-        Do not call directly.
-        """
+        reg_id = self._reg_tables.REG_ID.get(name.lower())
 
-        return uclib.uc_reg_read_batch(self._uch, reglist, vallist, count)
+        if reg_id is None:
+            raise UcError(uc.UC_ERR_ARG, name)
 
-    ###########################
-    #  Memory management      #
-    ###########################
+        return reg_id
 
-    def mem_map(self, address: int, size: int, perms: int = uc.UC_PROT_ALL) -> None:
-        """Map a memory range.
+    def reg_width(self, reg_id: int) -> int:
+        """Get the value width of an architectural register.
 
         Args:
-            address : range base address
-            size    : range size (in bytes)
-            perms   : access protection bitmask
+            reg_id: register identifier (architecture-specific enumeration)
 
-        Raises: `UcError` in case memory could not be mapped
+        Returns: register width in bytes, or 0 if register is undefined
         """
 
-        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+        widths = self._reg_tables.REG_WIDTH
 
-        status = uclib.uc_mem_map(self._uch, address, size, perms)
+        return widths[reg_id] if 0 <= reg_id < len(widths) else 0
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
 
-    def mem_map_ptr(self, address: int, size: int, perms: int, ptr: int) -> None:
-        """Map a memory range and point to existing data on host memory.
+class _UcRegPlan:
+    """A base class for precompiled register access plans.
 
-        Args:
-            address : range base address
-            size    : range size (in bytes)
-            perms   : access protection bitmask
-            ptr     : address of data on host memory
+    Registers values are laid out back to back in a single qword-aligned
+    storage buffer, each one taking as many qwords as its class requires.
 
-        Raises: `UcError` in case memory could not be mapped
-        """
+    This class is meant to be inherited, not instantiated directly.
+    """
 
-        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+    def __init__(self, owner: RegStateManager, reg_ids: Sequence[int], reg_types: Sequence[Type]) -> None:
+        assert len(reg_ids) == len(reg_types)
 
-        status = uclib.uc_mem_map_ptr(self._uch, address, size, perms, ptr)
+        count = len(reg_ids)
+        slots = [(ctypes.sizeof(rtype) + 7) // 8 for rtype in reg_types]
+        offsets = [sum(slots[:i]) * 8 for i in range(count)]
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        self._owner = owner
+        self._reg_ids = tuple(reg_ids)
+        self._offsets = tuple(offsets)
+        self._storage = (ctypes.c_uint64 * sum(slots))()
+        self._values = [rtype.from_buffer(self._storage, offset) for rtype, offset in zip(reg_types, offsets)]
 
-    def mem_unmap(self, address: int, size: int) -> None:
-        """Reclaim a mapped memory range.
+        self._reg_list = (ctypes.c_int * count)(*reg_ids)
+        self._ptr_list = (ctypes.c_void_p * count)(*(ctypes.addressof(self._storage) + offset for offset in offsets))
+        self._count = ctypes.c_int(count)
 
-        Args:
-            address : range base address
-            size    : range size (in bytes)
+        # plans made of plain registers only may skip per-register value conversion: on
+        # little-endian hosts a narrower register occupies the low bytes of its qword slot
+        self._simple = sys.byteorder == 'little' and not any(issubclass(rtype, UcReg) for rtype in reg_types)
 
-        Raises: `UcError` in case memory could not be unmapped
+    def __len__(self) -> int:
+        return len(self._reg_ids)
+
+    @property
+    def reg_ids(self) -> Tuple[int, ...]:
+        return self._reg_ids
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the plan storage in bytes; that is the minimal size of buffers
+        used with `read_into` and `write_from`.
         """
 
-        status = uclib.uc_mem_unmap(self._uch, address, size)
+        return ctypes.sizeof(self._storage)
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
 
-        # TODO: this is where mmio callbacks need to be released from cache,
-        # but we cannot tell whether this is an mmio range. also, memory ranges
-        # might be splitted by 'map_protect' after they were mapped, so the
-        # (start, end) tuple may not be suitable for retrieving the callbacks.
-        #
-        # here we try to do that on a best-effort basis:
+class UcRegReader(_UcRegPlan):
+    """A precompiled plan for reading a fixed sequence of registers.
 
-        rng = (address, address + size)
+    Plans are created through `make_reg_reader` and may be used against the
+    object that created them or any other registers state of the same
+    architecture, such as a saved `UcContext`.
+    """
 
-        if rng in self._mmio_callbacks:
-            del self._mmio_callbacks[rng]
+    def __read(self, source: Optional[RegStateManager]) -> None:
+        status = (source or self._owner)._do_reg_read_batch(self._reg_list, self._ptr_list, self._count)
 
-    def mem_protect(self, address: int, size: int, perms: int = uc.UC_PROT_ALL) -> None:
-        """Modify access protection bitmask of a mapped memory range.
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+    def __call__(self, source: Optional[RegStateManager] = None) -> Tuple:
+        """Read the planned registers.
 
         Args:
-            address : range base address
-            size    : range size (in bytes)
-            perms   : new access protection bitmask
+            source: registers state to read from (default: the plan owner)
 
-        Raises: `UcError` in case access protection bitmask could not be changed
+        Returns: a tuple of registers values (register-specific format)
+
+        Raises: `UcError` in case of invalid register id
         """
 
-        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+        self.__read(source)
 
-        status = uclib.uc_mem_protect(self._uch, address, size, perms)
+        if self._simple:
+            return tuple(self._storage)
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        return tuple(v.value for v in self._values)
 
-    def mmio_map(self, address: int, size: int,
-            read_cb: Optional[UC_MMIO_READ_TYPE], user_data_read: Any,
-            write_cb: Optional[UC_MMIO_WRITE_TYPE], user_data_write: Any) -> None:
+    def read_bytes(self, source: Optional[RegStateManager] = None) -> bytes:
+        """Read the planned registers as raw bytes, laid out as consecutive qwords.
 
-        @uccallback(self, MMIO_READ_CFUNC)
-        def __mmio_map_read_cb(uc: Uc, offset: int, size: int, key: int) -> int:
-            assert read_cb is not None
+        Args:
+            source: registers state to read from (default: the plan owner)
 
-            return read_cb(uc, offset, size, user_data_read)
+        Returns: a copy of the plan storage, `nbytes` bytes long
 
-        @uccallback(self, MMIO_WRITE_CFUNC)
-        def __mmio_map_write_cb(uc: Uc, offset: int, size: int, value: int, key: int) -> None:
-            assert write_cb is not None
+        Raises: `UcError` in case of invalid register id
+        """
 
-            write_cb(uc, offset, size, value, user_data_write)
+        self.__read(source)
 
-        read_cb_fptr = read_cb and __mmio_map_read_cb
-        write_cb_fptr = write_cb and __mmio_map_write_cb
+        return bytes(self._storage)
 
-        status = uclib.uc_mmio_map(self._uch, address, size, read_cb_fptr, 0, write_cb_fptr, 0)
+    def read_into(self, buf, source: Optional[RegStateManager] = None) -> None:
+        """Read the planned registers directly into a caller-owned buffer, laid out
+        as consecutive qwords (e.g. an `array('Q')` of `len(plan)` items for plain
+        registers).
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        Args:
+            buf    : a writable and contiguous buffer-protocol object of at least `nbytes` bytes
+            source : registers state to read from (default: the plan owner)
 
-        # hold a reference to mmio callbacks
-        rng = (address, address + size)
+        Raises:
+            `TypeError`  : in case buffer is not writable or not contiguous
+            `ValueError` : in case buffer is too small
+            `UcError`    : in case of invalid register id
+        """
 
-        self._mmio_callbacks[rng] = (read_cb_fptr, write_cb_fptr)
+        self.__read(source)
 
-    def mem_regions(self) -> Iterator[Tuple[int, int, int]]:
-        """Iterate through mapped memory regions.
+        with _buffer_ref(buf, writable=True) as (ptr, size):
+            if size < self.nbytes:
+                raise ValueError(f'buffer too small: {size} < {self.nbytes}')
 
-        Returns: an iterator whose elements contain begin, end and perms  properties of each range
+            ctypes.memmove(ptr, self._storage, self.nbytes)
 
-        Raises: `UcError` in case an itnernal error has been encountered
-        """
 
-        regions = ctypes.POINTER(_uc_mem_region)()
-        count = ctypes.c_uint32()
-        status = uclib.uc_mem_regions(self._uch, ctypes.byref(regions), ctypes.byref(count))
+class UcRegWriter(_UcRegPlan):
+    """A precompiled plan for writing a fixed sequence of registers.
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+    Plans are created through `make_reg_writer` and may be used against the
+    object that created them or any other registers state of the same
+    architecture, such as a saved `UcContext`.
+    """
 
-        try:
-            for i in range(count.value):
-                yield regions[i].value
+    def __init__(self, owner: RegStateManager, reg_ids: Sequence[int], reg_types: Sequence[Type]) -> None:
+        super().__init__(owner, reg_ids, reg_types)
 
-        finally:
-            uclib.uc_free(regions)
+        # let the engine verify each value is large enough to hold its register
+        self._size_list = (ctypes.c_size_t * len(reg_ids))(*(ctypes.sizeof(rtype) for rtype in reg_types))
 
-    def mem_read(self, address: int, size: int) -> bytearray:
-        """Read data from emulated memory subsystem.
+    def __write(self, target: Optional[RegStateManager]) -> None:
+        status = (target or self._owner)._do_reg_write_batch(self._reg_list, self._ptr_list, self._size_list, self._count)
 
-        Args:
-            address : source memory location
-            size    : amount of bytes to read
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
 
-        Returns: data bytes
+    def __call__(self, values: Sequence, target: Optional[RegStateManager] = None) -> None:
+        """Write the planned registers.
 
-        Raises: `UcError` in case of an invalid memory access
+        Args:
+            values : a sequence of registers values, in plan order (register-specific format)
+            target : registers state to write to (default: the plan owner)
+
+        Raises: `UcError` in case of invalid register id or value format
         """
 
-        data = ctypes.create_string_buffer(size)
-        status = uclib.uc_mem_read(self._uch, address, data, size)
+        if len(values) != len(self._values):
+            raise UcError(uc.UC_ERR_ARG)
+
+        if self._simple:
+            self._storage[:] = values
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status, address, size)
+        else:
+            for slot, value in zip(self._values, values):
+                reg = type(slot).from_value(value) if isinstance(slot, UcReg) else type(slot)(value)
 
-        return bytearray(data)
+                ctypes.memmove(ctypes.addressof(slot), ctypes.addressof(reg), ctypes.sizeof(reg))
 
-    def mem_write(self, address: int, data: bytes) -> None:
-        """Write data to emulated memory subsystem.
+        self.__write(target)
+
+    def write_from(self, buf, target: Optional[RegStateManager] = None) -> None:
+        """Write the planned registers directly from a caller-owned buffer, laid out
+        as consecutive qwords (e.g. an `array('Q')` of `len(plan)` items for plain
+        registers).
 
         Args:
-            address : target memory location
-            data    : data bytes to write
+            buf    : a contiguous buffer-protocol object of at least `nbytes` bytes
+            target : registers state to write to (default: the plan owner)
 
-        Raises: `UcError` in case of an invalid memory access
+        Raises:
+            `TypeError`  : in case buffer is not contiguous
+            `ValueError` : in case buffer is too small
+            `UcError`    : in case of invalid register id
         """
 
-        size = len(data)
-        status = uclib.uc_mem_write(self._uch, address, data, size)
+        with _buffer_ref(buf) as (ptr, size):
+            if size < self.nbytes:
+                raise ValueError(f'buffer too small: {size} < {self.nbytes}')
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status, address, size)
+            ctypes.memmove(self._storage, ptr, self.nbytes)
 
-    ###########################
-    #  Event hooks management #
-    ###########################
+        self.__write(target)
 
-    def __do_hook_add(self, htype: int, fptr: ctypes._FuncPointer, begin: int, end: int, *args: ctypes.c_int) -> int:
-        handle = uc_hook_h()
 
-        # TODO: we do not need a callback counter to reference the callback and user data anymore,
-        # so just pass a dummy value. that value will become the unused 'key' argument
-        dummy = 0
+class _UcRegDumpLayout:
+    """Registers layout of cpu state dumps, shared by all dumps of the same
+    registers set.
+    """
 
-        status = uclib.uc_hook_add(
-            self._uch,
-            ctypes.byref(handle),
-            htype,
-            fptr,
-            ctypes.cast(dummy, ctypes.c_void_p),
-            ctypes.c_uint64(begin),
-            ctypes.c_uint64(end),
-            *args
-        )
+    def __init__(self, owner: Uc, names: Sequence[str], fp: bool) -> None:
+        tables = owner._reg_tables
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        reg_ids = [tables.REG_ID[name] for name in names]
+        reg_types = [owner._reg_class(rid) for rid in reg_ids]
 
-        # hold a reference to the funcion pointer to prevent it from being gc-ed
-        self._callbacks[handle.value] = fptr
+        self.key = (owner._arch, tuple(names))
+        self.fp = fp
+        self.names = tuple(names)
+        self.types = tuple(reg_types)
 
-        return handle.value
+        self.reader = owner._make_reg_reader(reg_ids, reg_types)
+        self.writer = owner._make_reg_writer(reg_ids, reg_types)
+        self.offsets = self.reader._offsets
 
-    def hook_add(self, htype: int, callback: Callable, user_data: Any = None, begin: int = 1, end: int = 0, aux1: int = 0, aux2: int = 0) -> int:
-        """Hook emulated events of a certain type.
+        # registers may be looked up by id, name or any of their aliases
+        slots = {rid: i for i, rid in enumerate(reg_ids)}
 
-        Args:
-            htype     : event type(s) to hook (see UC_HOOK_* constants)
-            callback  : a method to call each time the hooked event occurs
-            user_data : an additional context to pass to the callback when it is called
-            begin     : address where hook scope starts
-            end       : address where hook scope ends
-            aux1      : auxiliary parameter; needed for some hook types
-            aux2      : auxiliary parameter; needed for some hook types
+        self.index: Mapping[Union[int, str], int] = {
+            **{name: slots[rid] for name, rid in tables.REG_ID.items() if rid in slots},
+            **slots
+        }
 
-        Returns: hook handle
 
-        Raises: `UcError` in case of an invalid htype value
-        """
+class UcRegDump:
+    """A snapshot of the processor registers, taken by `Uc.reg_dump`.
 
-        def __hook_intr():
-            @uccallback(self, HOOK_INTR_CFUNC)
-            def __hook_intr_cb(uc: Uc, intno: int, key: int):
-                callback(uc, intno, user_data)
+    Registers values are held in a single immutable buffer with a fixed layout
+    per registers set, so dumps are cheap to take, compare and hash. Values are
+    decoded only when accessed, either as attributes named after the registers
+    (e.g. `dump.rip`) or by register name or id (e.g. `dump['rip']`,
+    `dump[UC_X86_REG_RIP]`).
 
-            return __hook_intr_cb,
+    Dumps are created through `Uc.reg_dump`; not to be instantiated directly.
+    """
 
-        def __hook_insn():
-            # each arch is expected to overload hook_add and implement this handler on their own.
-            # if we got here, it means this particular architecture does not support hooking any
-            # instruction and so we fail
-            raise UcError(uc.UC_ERR_ARG)
+    __slots__ = ('_layout', '_data')
 
-        def __hook_code():
-            @uccallback(self, HOOK_CODE_CFUNC)
-            def __hook_code_cb(uc: Uc, address: int, size: int, key: int):
-                callback(uc, address, size, user_data)
+    def __init__(self, layout: _UcRegDumpLayout, data: bytes) -> None:
+        self._layout = layout
+        self._data = data
 
-            return __hook_code_cb,
+    def __value(self, index: int):
+        layout = self._layout
 
-        def __hook_invalid_mem():
-            @uccallback(self, HOOK_MEM_INVALID_CFUNC)
-            def __hook_mem_invalid_cb(uc: Uc, access: int, address: int, size: int, value: int, key: int) -> bool:
-                return callback(uc, access, address, size, value, user_data)
+        return layout.types[index].from_buffer_copy(self._data, layout.offsets[index]).value
 
-            return __hook_mem_invalid_cb,
+    def __getitem__(self, reg: Union[int, str]):
+        index = self._layout.index.get(reg.lower() if isinstance(reg, str) else reg)
 
-        def __hook_mem():
-            @uccallback(self, HOOK_MEM_ACCESS_CFUNC)
-            def __hook_mem_access_cb(uc: Uc, access: int, address: int, size: int, value: int, key: int) -> None:
-                callback(uc, access, address, size, value, user_data)
+        if index is None:
+            raise KeyError(reg)
 
-            return __hook_mem_access_cb,
+        return self.__value(index)
 
-        def __hook_invalid_insn():
-            @uccallback(self, HOOK_INSN_INVALID_CFUNC)
-            def __hook_insn_invalid_cb(uc: Uc, key: int) -> bool:
-                return callback(uc, user_data)
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
 
-            return __hook_insn_invalid_cb,
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
 
-        def __hook_edge_gen():
-            @uccallback(self, HOOK_EDGE_GEN_CFUNC)
-            def __hook_edge_gen_cb(uc: Uc, cur: ctypes._Pointer[uc_tb], prev: ctypes._Pointer[uc_tb], key: int):
-                callback(uc, cur.contents, prev.contents, user_data)
+    def __contains__(self, reg: Union[int, str]) -> bool:
+        return (reg.lower() if isinstance(reg, str) else reg) in self._layout.index
 
-            return __hook_edge_gen_cb,
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.names)
 
-        def __hook_tcg_opcode():
-            @uccallback(self, HOOK_TCG_OPCODE_CFUNC)
-            def __hook_tcg_op_cb(uc: Uc, address: int, arg1: int, arg2: int, size: int, key: int):
-                callback(uc, address, arg1, arg2, size, user_data)
+    def __len__(self) -> int:
+        return len(self._layout.names)
 
-            opcode = ctypes.c_uint64(aux1)
-            flags = ctypes.c_uint64(aux2)
+    def __bytes__(self) -> bytes:
+        return self._data
 
-            return __hook_tcg_op_cb, opcode, flags
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, UcRegDump):
+            return NotImplemented
+
+        return self._layout.key == other._layout.key and self._data == other._data
+
+    def __hash__(self) -> int:
+        return hash((self._layout.key, self._data))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({", ".join(f"{name}={value!r}" for name, value in self.items())})'
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the dumped registers names and values, in dump order.
+        """
+
+        return ((name, self.__value(i)) for i, name in enumerate(self._layout.names))
+
+    def diff(self, other: UcRegDump) -> Tuple[str, ...]:
+        """Get the names of the registers whose values differ from another dump.
+
+        Args:
+            other: a dump of the same registers set
+
+        Returns: a tuple of registers names, in dump order
+
+        Raises: `ValueError` in case dumps do not share the same registers set
+        """
+
+        layout = self._layout
+
+        if layout.key != other._layout.key:
+            raise ValueError('dumps registers sets differ')
+
+        if self._data == other._data:
+            return tuple()
+
+        ends = layout.offsets[1:] + (len(self._data),)
+
+        return tuple(name for name, beg, end in zip(layout.names, layout.offsets, ends) if self._data[beg:end] != other._data[beg:end])
+
+
+class UcRegisterFile:
+    """Attribute-style view of the emulated processor registers.
+
+    Every register listed in the architecture registers tables is exposed as
+    a lowercase attribute named after its constant (e.g. `UC_X86_REG_RIP` as
+    `regs.rip`), aliases included. Register ids and classes are resolved once, when the view is
+    created, and each register owns pre-typed scratch buffers so reading or
+    writing it through the view does not allocate.
+
+    Registers that require auxiliary data (e.g. MSRs and coprocessor registers)
+    are not exposed; use `reg_read` and `reg_write` instead.
+
+    Views are created through `Uc.regs`; not to be instantiated directly.
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def __reg_property(reg_id: int, regtype: Type, read: Callable, write: Callable) -> property:
+        # reads and writes use separate scratch buffers, so values written to the register
+        # never leak into the unused high bytes of narrower reads
+        rval = regtype()
+        rref = ctypes.byref(rval)
+
+        def __get(_):
+            status = read(reg_id, rref)
+
+            if status != uc.UC_ERR_OK:
+                raise UcError(status, reg_id)
+
+            return rval.value
+
+        if issubclass(regtype, UcReg):
+            def __set(_, value) -> None:
+                status = write(reg_id, ctypes.byref(regtype.from_value(value)))
+
+                if status != uc.UC_ERR_OK:
+                    raise UcError(status, reg_id)
+
+        else:
+            wval = regtype()
+            wref = ctypes.byref(wval)
+
+            def __set(_, value) -> None:
+                wval.value = value
+                status = write(reg_id, wref)
+
+                if status != uc.UC_ERR_OK:
+                    raise UcError(status, reg_id)
+
+        return property(__get, __set)
+
+    @classmethod
+    def _create(cls, owner: Uc) -> UcRegisterFile:
+        """Create a registers view for a specific Unicorn instance.
+        """
+
+        props: MutableMapping[int, property] = {}
+        attrs = {'__slots__': ()}
+
+        for name, reg_id in owner._reg_tables.REG_ID.items():
+            if reg_id not in props:
+                regtype = owner._select_reg_type(reg_id)
+
+                if regtype is None:
+                    continue
+
+                # aliased registers share the same property
+                props[reg_id] = cls.__reg_property(reg_id, regtype, owner._do_reg_read, owner._do_reg_write)
+
+            attrs[name] = props[reg_id]
+
+        return type(cls.__name__, (cls,), attrs)()
+
+
+def ucsubclass(cls):
+    """Uc subclass decorator.
+
+    Use it to decorate user-defined Uc subclasses.
+
+    Example:
+    >>> @ucsubclass
+    ... class Pegasus(Uc):
+    ...     '''A Unicorn impl with wings
+    ...     '''
+    ...     pass
+    """
+
+    # to maintain proper inheritance for user-defined Uc subclasses, the Uc
+    # base class is replaced with the appropriate Uc pre-defined subclass on
+    # first instantiation.
+    #
+    # for example, if the Pegasus class from the example above instantiates
+    # with Intel arch and 64-bit mode, the Pegasus class will be modified to
+    # inherit from UcIntel and only then Uc, instead of Uc directly. that is:
+    # Pegasus -> UcIntel -> Uc -> RegStateManager -> object
+    #
+    # note that all Pegasus subclasses will have the same inheritence chain,
+    # regardless of the arch and mode the might use to initialize.
+
+    def __replace(seq: Tuple, item, repl) -> Tuple:
+        if item not in seq:
+            return seq
+
+        i = seq.index(item)
+
+        return seq[:i] + tuple([repl]) + seq[i + 1:]
+
+    def __new_uc_subclass(cls, arch: int, mode: int):
+        # resolve the appropriate Uc subclass
+        subcls = Uc.__new__(cls, arch, mode)
+
+        # set the resolved subclass as base class instead of Uc (if there)
+        cls.__bases__ = __replace(cls.__bases__, Uc, type(subcls))
+
+        return object.__new__(cls)
+
+    setattr(cls, '__new__', __new_uc_subclass)
+
+    return cls
+
+
+# AFL hit counts buckets: 0, 1, 2, 3, 4-7, 8-15, 16-31, 32-127 and 128+
+_COVERAGE_BUCKETS = bytes((0, 1, 2, 4, 8, 16, 32, 64, 128)[bisect.bisect_right((1, 2, 3, 4, 8, 16, 32, 128), n)] for n in range(256))
+
+# checkpoint files start with a header, followed by the memory regions table, the pages
+# index (one byte per page of each ram region, non-zero for pages holding data), the
+# processor context and finally the memory images, in regions order
+_CKPT_MAGIC = b'UCCKPT\x00\x00'
+_CKPT_VERSION = 1
+
+# magic, version, arch, mode, cpu model, page size, compression, regions count, context size
+_CKPT_HEADER = struct.Struct('<8sIIIiIIII')
+
+# begin, size, perms, kind, image offset, image length
+_CKPT_REGION = struct.Struct('<QQIIQQ')
+
+_CKPT_KIND_RAM = 0
+_CKPT_KIND_MMIO = 1
+
+# memory images compression methods: identifier, compressor and decompressor factories names
+_CKPT_CODECS = {
+    'zlib': (1, 'compressobj', 'decompressobj'),
+    'bz2':  (2, 'BZ2Compressor', 'BZ2Decompressor'),
+    'lzma': (3, 'LZMACompressor', 'LZMADecompressor')
+}
+
+
+def _ckpt_codec(name: str):
+    """Load a checkpoint compression module. Compression modules are optional parts
+    of the standard library, hence loaded only when used.
+    """
+
+    import importlib
+
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise UcError(uc.UC_ERR_ARG) from None
+
+
+def _ckpt_runs(index, first: int, count: int) -> Iterator[Tuple[int, int]]:
+    """Iterate through runs of consecutive data pages in a checkpoint pages index.
+
+    Returns: an iterator whose elements contain the first page and pages count of each run,
+    relative to `first`
+    """
+
+    start = None
+
+    for i in range(count):
+        if index[first + i]:
+            if start is None:
+                start = i
+
+        elif start is not None:
+            yield start, i - start
+            start = None
+
+    if start is not None:
+        yield start, count - start
+
+
+class Uc(RegStateManager):
+    """Unicorn Engine class.
+    """
+
+    # classes of registers held in architecture-specific structures, by register id;
+    # set by architecture subclasses
+    _REG_SPECIAL: Mapping[int, Type] = {}
+
+    @staticmethod
+    def __is_compliant() -> bool:
+        """Checks whether Unicorn binding version complies with Unicorn library.
+
+        Returns: `True` if versions match, `False` otherwise
+        """
+
+        uc_maj, uc_min, _ = uc_version()
+        bnd_maj, bnd_min, _ = version_bind()
+
+        return (uc_maj, uc_min) == (bnd_maj, bnd_min)
+
+    def __new__(cls, arch: int, mode: int, cpu: Optional[int] = None):
+        # verify version compatibility with the core before doing anything
+        if not Uc.__is_compliant():
+            raise UcError(uc.UC_ERR_VERSION)
+
+        subclass = _uc_subclass(arch)
+
+        # return the appropriate unicorn subclass type
+        return super(Uc, cls).__new__(subclass)
+
+    def __init__(self, arch: int, mode: int, cpu: Optional[int] = None) -> None:
+        """Initialize a Unicorn engine instance.
+
+        Args:
+            arch: emulated architecture identifier (see UC_ARCH_* constants)
+            mode: emulated processor mode (see UC_MODE_* constants)
+            cpu: emulated cpu model (see UC_CPU_* constants) [optional]
+        """
+
+        self._arch = arch
+        self._mode = mode
+
+        # registers value classes and metadata tables
+        self._reg_classes = _load_reg_classes(arch)
+        self._reg_tables = _load_reg_tables(arch)
+
+        # emulated processor byte order, used by typed memory accessors
+        self._byteorder = 'big' if mode & uc.UC_MODE_BIG_ENDIAN else 'little'
+
+        # initialize the unicorn instance
+        self._uch = uc_engine()
+        status = uclib.uc_open(arch, mode, ctypes.byref(self._uch))
+
+        if status != uc.UC_ERR_OK:
+            self._uch = None
+            raise UcError(status)
+
+        if cpu is not None:
+            self.ctl_set_cpu_model(cpu)
+
+        # we have to keep a reference to the callbacks so they do not get gc-ed
+        # see: https://docs.python.org/3/library/ctypes.html#callback-functions
+        self._callbacks: MutableMapping[int, ctypes._FuncPointer] = {}
+        self._mmio_callbacks: MutableMapping[Tuple[int, int], Tuple[Optional[MMIO_READ_CFUNC], Optional[MMIO_WRITE_CFUNC]]] = {}
+
+        # buffers backing mapped memory ranges are pinned for as long as they are mapped
+        self._mapped_buffers: MutableMapping[Tuple[int, int], _PinnedBuffer] = {}
+
+        # buffers of ranges unmapped after a memory snapshot was taken. the engine keeps
+        # such ranges aside and may map them back on context restore, so their buffers
+        # remain pinned for as long as this instance lives
+        self._retained_buffers: MutableMapping[Tuple[int, int], _PinnedBuffer] = {}
+
+        # whether a context holding a memory snapshot was ever saved
+        self._snapshot_taken = False
+
+        # mapped memory regions index; built on demand
+        self._mem_index: Optional[_MemIndex] = _MemIndex()
+
+        # demand-paged memory ranges and their fault hooks handles
+        self._lazy_regions: MutableMapping[Tuple[int, int], Tuple[UcLazyRegion, int]] = {}
+
+        self._hook_exception: Optional[Exception] = None
+
+        # attribute-style registers view; created on demand
+        self._regs: Optional[UcRegisterFile] = None
+
+        # cpu state dumps layouts, by fp flag; created on demand
+        self._reg_dumps: MutableMapping[bool, _UcRegDumpLayout] = {}
+
+        # nested savepoints manager; created on demand
+        self._savepoints: Optional[UcSavepoints] = None
+
+        # state selected for contexts (see ctl_context_mode)
+        self._context_mode = uc.UC_CTL_CONTEXT_CPU
+
+        # consumer callback of the latest trace, if any
+        self._trace: Optional[TRACE_CFUNC] = None
+
+        # map edge coverage is collected into, if any
+        self._coverage: Optional[UcCoverageMap] = None
+
+        # hook multiplexers, by hook type and scope; created on demand
+        self._hook_muxes: MutableMapping[Tuple[int, int, int, int, int], UcHookMux] = {}
+
+        # create a finalizer object that will apropriately free up resources when
+        # this instance undergoes garbage collection.
+        self.__finalizer = weakref.finalize(self, Uc.release_handle, self._uch)
+
+    @staticmethod
+    def release_handle(uch: uc_engine) -> None:
+        # this method and its arguments must not have any reference to the Uc instance being
+        # destroyed. namely, this method cannot be a bound method.
+
+        if uch:
+            try:
+                status = uclib.uc_close(uch)
+
+            # _uc might be pulled from under our feet
+            except:
+                pass
+
+            else:
+                if status != uc.UC_ERR_OK:
+                    raise UcError(status)
+
+    ###########################
+    #  Emulation controllers  #
+    ###########################
+
+    def emu_start(self, begin: int, until: int, timeout: int = 0, count: int = 0) -> None:
+        """Start emulation from a specified address to another.
+
+        Args:
+            begin   : emulation starting address
+            until   : emulation ending address
+            timeout : limit emulation to a certain amount of time (milliseconds)
+            count   : limit emulation to a certain amount of instructions
+
+        Raises:
+            `UcError`   : in case emulation could not be started properly
+            `Exception` : in case an error has been encountered during emulation
+        """
+
+        self._hook_exception = None
+        status = uclib.uc_emu_start(self._uch, begin, until, timeout, count)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        if self._hook_exception is not None:
+            raise self._hook_exception
+
+    def emu_stop(self) -> None:
+        """Stop emulation.
+
+        Raises: `UcError` in case emulation could not be stopped properly
+        """
+
+        status = uclib.uc_emu_stop(self._uch)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+    ###########################
+    #  CPU state accessors    #
+    ###########################
+
+    def _do_reg_read(self, reg_id: int, reg_obj) -> int:
+        """Private register read implementation.
+        Do not call directly.
+        """
+
+        return uclib.uc_reg_read(self._uch, reg_id, reg_obj)
+
+    def _do_reg_write(self, reg_id: int, reg_obj) -> int:
+        """Private register write implementation.
+        Do not call directly.
+        """
+
+        return uclib.uc_reg_write(self._uch, reg_id, reg_obj)
+
+    def _do_reg_read_batch(self, reglist, vallist, count) -> int:
+        """Private batch register read implementation.
+        Do not call directly.
+        """
+
+        return uclib.uc_reg_read_batch(self._uch, reglist, vallist, count)
+
+    def _do_reg_write_batch(self, reglist, vallist, sizelist, count) -> int:
+        """Private batch register write implementation.
+        Do not call directly.
+        """
+
+        return uclib.uc_reg_write_batch2(self._uch, reglist, vallist, sizelist, count)
+
+    @property
+    def regs(self) -> UcRegisterFile:
+        """Attribute-style view of the processor registers, meant for hot paths
+        such as hook callbacks.
+
+        Example:
+            >>> uc.regs.rax = 0x1234
+            >>> uc.regs.rip
+        """
+
+        if self._regs is None:
+            self._regs = UcRegisterFile._create(self)
+
+        return self._regs
+
+    def __reg_dump_layout(self, fp: bool) -> _UcRegDumpLayout:
+        layout = self._reg_dumps.get(fp)
+
+        if layout is None:
+            sets = _REG_DUMP_SETS.get((self._arch, self._mode)) or _REG_DUMP_SETS[self._arch]
+            base, extra = sets
+
+            layout = self._reg_dumps[fp] = _UcRegDumpLayout(self, base + extra if fp else base, fp)
+
+        return layout
+
+    def reg_dump(self, fp: bool = False) -> UcRegDump:
+        """Take a snapshot of the processor general purpose registers, flags, pc
+        and sp in a single batch read.
+
+        Args:
+            fp: whether to include the floating-point and simd registers as well
+
+        Returns: an immutable registers dump, to be restored with `reg_load`
+
+        Example:
+            >>> dump = uc.reg_dump()
+            >>> dump.rip, dump['rsp']
+            >>> uc.reg_load(dump)
+        """
+
+        layout = self.__reg_dump_layout(fp)
+
+        return UcRegDump(layout, layout.reader.read_bytes())
+
+    def reg_load(self, dump: UcRegDump) -> None:
+        """Restore the processor registers from a dump in a single batch write.
+
+        Args:
+            dump: a registers dump previously taken by `reg_dump`
+
+        Raises: `UcError` in case dump was taken on an incompatible architecture or mode
+        """
+
+        layout = self.__reg_dump_layout(dump._layout.fp)
+
+        if layout.key != dump._layout.key:
+            raise UcError(uc.UC_ERR_ARG)
+
+        layout.writer.write_from(dump._data)
+
+    ###########################
+    #  Memory management      #
+    ###########################
+
+    def mem_map(self, address: int, size: int, perms: int = uc.UC_PROT_ALL) -> None:
+        """Map a memory range.
+
+        Args:
+            address : range base address
+            size    : range size (in bytes)
+            perms   : access protection bitmask
+
+        Raises: `UcError` in case memory could not be mapped
+        """
+
+        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+
+        status = uclib.uc_mem_map(self._uch, address, size, perms)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self.__mem_index_insert(address, size, perms)
+
+    def mem_map_ptr(self, address: int, size: int, perms: int, ptr: int) -> None:
+        """Map a memory range and point to existing data on host memory.
+
+        Args:
+            address : range base address
+            size    : range size (in bytes)
+            perms   : access protection bitmask
+            ptr     : address of data on host memory
+
+        Raises: `UcError` in case memory could not be mapped
+        """
+
+        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+
+        status = uclib.uc_mem_map_ptr(self._uch, address, size, perms, ptr)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self.__mem_index_insert(address, size, perms)
+
+    def mem_map_buffer(self, address: int, buf, perms: int = uc.UC_PROT_ALL) -> None:
+        """Map a memory range backed by a host buffer.
+
+        The buffer is used as the range memory itself, so changes made by the emulated
+        code are visible through the buffer and vice versa. It is pinned for as long as
+        any part of the range remains mapped and released afterwards. However, once a memory
+        snapshot was taken (see `ctl_context_mode`) restoring a context may map the range
+        back, so its buffer remains pinned for as long as this instance lives.
+
+        Args:
+            address : range base address
+            buf     : a writable and contiguous buffer-protocol object (e.g. bytearray, mmap,
+                      array, shared memory buffer) whose size is the range size
+            perms   : access protection bitmask
+
+        Raises:
+            `TypeError` : in case buffer is not writable or not contiguous
+            `UcError`   : in case memory could not be mapped
+        """
+
+        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+
+        pinned = _PinnedBuffer(buf, writable=True)
+        status = uclib.uc_mem_map_ptr(self._uch, address, pinned.size, perms, pinned.address)
+
+        if status != uc.UC_ERR_OK:
+            pinned.release()
+
+            raise UcError(status)
+
+        self.__mem_index_insert(address, pinned.size, perms)
+
+        self._mapped_buffers[(address, address + pinned.size)] = pinned
+
+    def mem_map_file(self, address: int, path: str, offset: int = 0, size: Optional[int] = None, perms: int = uc.UC_PROT_ALL, private: bool = True) -> None:
+        """Map a memory range backed by a file.
+
+        File contents are not read in advance, but paged in by the host as the range is
+        accessed. Identical files mapped by several instances or processes share the same
+        host pages for as long as they are not modified.
+
+        The range size is rounded up to the page size. File contents that do not fill a
+        whole page are copied into anonymous memory instead, as is the part of the range that
+        lies past the end of the file (left zeroed); that memory is never written through to
+        the file.
+
+        Args:
+            address : range base address
+            path    : path of the file to map
+            offset  : file offset to map from; must be a multiple of `mmap.ALLOCATIONGRANULARITY`
+            size    : range size (in bytes); defaults to the remainder of the file past `offset`
+            perms   : access protection bitmask
+            private : whether modifications are kept private to this range (copy-on-write),
+                      or written through to the file
+
+        Raises:
+            `OSError` : in case the file could not be mapped on the host
+            `UcError` : in case memory could not be mapped
+        """
+
+        page_size = self.ctl_get_page_size()
+        mapped = None
+
+        with open(path, 'rb' if private else 'r+b') as f:
+            available = max(os.fstat(f.fileno()).st_size - offset, 0)
+
+            if size is None:
+                size = available
+
+            # a zero length would have mmap map the entire file
+            if size <= 0:
+                raise UcError(uc.UC_ERR_ARG)
+
+            # only whole pages of the file are mapped; the rest is copied
+            backed = min(size, available) & ~(page_size - 1)
+
+            if backed:
+                mapped = mmap.mmap(f.fileno(), backed, access=mmap.ACCESS_COPY if private else mmap.ACCESS_WRITE, offset=offset)
+
+            f.seek(offset + backed)
+            tail = f.read(max(min(size, available) - backed, 0))
+
+        total = (size + page_size - 1) & ~(page_size - 1)
+
+        # the file mapping is kept alive by the buffer pin, and closed once unmapped
+        if mapped is not None:
+            self.mem_map_buffer(address, mapped, perms)
+
+        if total > backed:
+            try:
+                self.mem_map(address + backed, total - backed, perms)
+            except UcError:
+                if mapped is not None:
+                    self.mem_unmap(address, backed)
+
+                raise
+
+            self.mem_write(address + backed, tail)
+
+    def mem_map_lazy(self, address: int, size: int, perms: int, provider: UC_PAGE_PROVIDER_TYPE) -> UcLazyRegion:
+        """Map a demand-paged memory range.
+
+        Nothing is mapped in advance; instead, each page is mapped on the first time it
+        is accessed and filled by the provider, after which the faulting access resumes
+        transparently. This allows reserving large and sparse address ranges while only
+        spending memory on pages that are actually used.
+
+        Args:
+            address  : range base address
+            size     : range size (in bytes)
+            perms    : access protection bitmask
+            provider : a callable invoked with the address and size of each page being mapped,
+                       and returns the page initial content or `None` to leave it zeroed
+
+        Returns: the lazy region object, which keeps track of filled pages
+
+        Raises: `UcError` in case the range is not aligned to page size
+        """
+
+        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+
+        page_size = self.ctl_get_page_size()
+
+        if (address | size) & (page_size - 1) or not size:
+            raise UcError(uc.UC_ERR_ARG)
+
+        region = UcLazyRegion(address, size, perms, page_size, provider)
+
+        def __lazy_fault(uc: Uc, access: int, address: int, size: int, value: int, region: UcLazyRegion) -> bool:
+            return region._fault(uc, address, size)
+
+        handle = self.hook_add(uc.UC_HOOK_MEM_UNMAPPED, __lazy_fault, region, address, address + size - 1)
+
+        self._lazy_regions[(address, address + size)] = (region, handle)
+
+        return region
+
+    def mem_unmap(self, address: int, size: int) -> None:
+        """Reclaim a mapped memory range.
+
+        Args:
+            address : range base address
+            size    : range size (in bytes)
+
+        Raises: `UcError` in case memory could not be unmapped
+        """
+
+        rng = (address, address + size)
+
+        # demand-paged ranges may be only partially mapped, so they are reclaimed page
+        # by page. that is supported only for the entire range as it was mapped
+        if rng in self._lazy_regions:
+            region, handle = self._lazy_regions.pop(rng)
+
+            self.hook_del(handle)
+
+            for page in region._reclaim():
+                self.mem_unmap(page, region.page_size)
+
+            return
+
+        status = uclib.uc_mem_unmap(self._uch, address, size)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self.__mem_index_update(address, size, None)
+
+        # TODO: this is where mmio callbacks need to be released from cache,
+        # but we cannot tell whether this is an mmio range. also, memory ranges
+        # might be splitted by 'map_protect' after they were mapped, so the
+        # (start, end) tuple may not be suitable for retrieving the callbacks.
+        #
+        # here we try to do that on a best-effort basis:
+
+        # mmio ranges may be mapped back on context restore as well
+        if rng in self._mmio_callbacks and not self._snapshot_taken:
+            del self._mmio_callbacks[rng]
+
+        # release buffers whose ranges are now entirely unmapped. since a range might have
+        # been unmapped partially, one that is still mapped in part keeps its buffer pinned
+        affected = [(begin, end) for begin, end in self._mapped_buffers if begin < address + size and address < end]
+
+        for begin, end in affected:
+            if not self.__get_mem_index().overlaps(begin, end - 1):
+                pinned = self._mapped_buffers.pop((begin, end))
+
+                if self._snapshot_taken:
+                    self._retained_buffers[(begin, end)] = pinned
+                else:
+                    pinned.release()
+
+    def mem_protect(self, address: int, size: int, perms: int = uc.UC_PROT_ALL) -> None:
+        """Modify access protection bitmask of a mapped memory range.
+
+        Args:
+            address : range base address
+            size    : range size (in bytes)
+            perms   : new access protection bitmask
+
+        Raises: `UcError` in case access protection bitmask could not be changed
+        """
+
+        assert (perms & ~uc.UC_PROT_ALL) == 0, 'unexpected perms bitmask'
+
+        status = uclib.uc_mem_protect(self._uch, address, size, perms)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self.__mem_index_update(address, size, perms)
+
+    def mmio_map(self, address: int, size: int,
+            read_cb: Optional[UC_MMIO_READ_TYPE], user_data_read: Any,
+            write_cb: Optional[UC_MMIO_WRITE_TYPE], user_data_write: Any) -> None:
+
+        @uccallback(self, MMIO_READ_CFUNC)
+        def __mmio_map_read_cb(uc: Uc, offset: int, size: int, key: int) -> int:
+            assert read_cb is not None
+
+            return read_cb(uc, offset, size, user_data_read)
+
+        @uccallback(self, MMIO_WRITE_CFUNC)
+        def __mmio_map_write_cb(uc: Uc, offset: int, size: int, value: int, key: int) -> None:
+            assert write_cb is not None
+
+            write_cb(uc, offset, size, value, user_data_write)
+
+        read_cb_fptr = read_cb and __mmio_map_read_cb
+        write_cb_fptr = write_cb and __mmio_map_write_cb
+
+        status = uclib.uc_mmio_map(self._uch, address, size, read_cb_fptr, 0, write_cb_fptr, 0)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self.__mem_index_insert(address, size, (uc.UC_PROT_READ if read_cb else 0) | (uc.UC_PROT_WRITE if write_cb else 0))
+
+        # hold a reference to mmio callbacks
+        rng = (address, address + size)
+
+        self._mmio_callbacks[rng] = (read_cb_fptr, write_cb_fptr)
+
+    def mem_regions(self) -> Iterator[Tuple[int, int, int]]:
+        """Iterate through mapped memory regions.
+
+        Returns: an iterator whose elements contain begin, end and perms  properties of each range
+
+        Raises: `UcError` in case an itnernal error has been encountered
+        """
+
+        regions = ctypes.POINTER(_uc_mem_region)()
+        count = ctypes.c_uint32()
+        status = uclib.uc_mem_regions(self._uch, ctypes.byref(regions), ctypes.byref(count))
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        try:
+            for i in range(count.value):
+                yield regions[i].value
+
+        finally:
+            uclib.uc_free(regions)
+
+    def __get_mem_index(self) -> _MemIndex:
+        if self._mem_index is None:
+            self._mem_index = _MemIndex(self.mem_regions())
+
+        return self._mem_index
+
+    def __mem_index_insert(self, address: int, size: int, perms: int) -> None:
+        if self._mem_index is not None:
+            self._mem_index.insert(address, address + size - 1, perms)
+
+    def __mem_index_update(self, address: int, size: int, perms: Optional[int]) -> None:
+        if self._mem_index is not None:
+            self._mem_index.update(address, address + size - 1, perms)
+
+    def __free_gaps(self, begin: int, end: int) -> Iterator[Tuple[int, int]]:
+        # unmapped ranges between begin and end (inclusive), less the ones reserved by
+        # demand-paged ranges
+        reserved = sorted(self._lazy_regions)
+
+        for lo, hi in self.__get_mem_index().gaps(begin, end):
+            for rbegin, rend in reserved:
+                if rend <= lo or rbegin > hi:
+                    continue
+
+                if rbegin > lo:
+                    yield lo, rbegin - 1
+
+                lo = rend
+
+            if lo <= hi:
+                yield lo, hi
+
+    def is_mapped(self, address: int, size: int = 1) -> bool:
+        """Check whether a memory range is entirely mapped.
+
+        Mapping state is looked up in an index maintained by the binding, without
+        querying the engine. Demand-paged ranges count as mapped, including their
+        pages that were not filled yet.
+
+        Args:
+            address : range base address
+            size    : range size (in bytes)
+
+        Returns: `True` if every byte in range is mapped, `False` otherwise
+        """
+
+        return not any(self.__free_gaps(address, address + max(size, 1) - 1))
+
+    def region_at(self, address: int) -> Optional[Tuple[int, int, int]]:
+        """Look up the mapped memory region containing a specific address.
+
+        Mapping state is looked up in an index maintained by the binding, without
+        querying the engine.
+
+        Args:
+            address : memory location
+
+        Returns: a tuple containing begin, end and perms properties of the region,
+        or `None` if address is not mapped
+        """
+
+        return self.__get_mem_index().find(address)
+
+    def find_free(self, size: int, align: Optional[int] = None, start: int = 0) -> Optional[int]:
+        """Find the lowest unmapped memory range of a certain size.
+
+        Mapping state is looked up in an index maintained by the binding, without
+        querying the engine. Demand-paged ranges are considered taken.
+
+        Args:
+            size  : range size (in bytes)
+            align : range base address alignment (a power of 2); defaults to page size
+            start : lowest acceptable range base address
+
+        Returns: range base address, or `None` if no such range is available
+        """
+
+        if align is None:
+            align = self.ctl_get_page_size()
+
+        mask = align - 1
+        start = (start + mask) & ~mask
+
+        for begin, end in self.__free_gaps(start, (1 << 64) - 1):
+            base = (begin + mask) & ~mask
+
+            if base + size - 1 <= end:
+                return base
+
+        return None
+
+    def mem_read(self, address: int, size: int) -> bytearray:
+        """Read data from emulated memory subsystem.
+
+        Args:
+            address : source memory location
+            size    : amount of bytes to read
+
+        Returns: data bytes
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        data = bytearray(size)
+        self.mem_read_into(address, data)
+
+        return data
+
+    def mem_read_into(self, address: int, buf) -> int:
+        """Read data from emulated memory subsystem directly into a caller-owned buffer.
+
+        The buffer is filled in place, without any intermediate copies.
+
+        Args:
+            address : source memory location
+            buf     : a writable and contiguous buffer-protocol object (e.g. bytearray,
+                      memoryview, mmap, array). its entire length is filled
+
+        Returns: amount of bytes read
+
+        Raises:
+            `TypeError` : in case buffer is not writable or not contiguous
+            `UcError`   : in case of an invalid memory access
+        """
+
+        with _buffer_ref(buf, writable=True) as (data, size):
+            status = uclib.uc_mem_read(self._uch, address, data, size)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, address, size)
+
+        return size
+
+    def mem_write(self, address: int, data) -> None:
+        """Write data to emulated memory subsystem.
+
+        Data is handed to the engine as-is, without any intermediate copies.
+
+        Args:
+            address : target memory location
+            data    : data bytes to write; any contiguous buffer-protocol object (e.g. bytes,
+                      bytearray, memoryview, mmap, array) is accepted
+
+        Raises:
+            `TypeError` : in case data is not a contiguous buffer
+            `UcError`   : in case of an invalid memory access
+        """
+
+        with _buffer_ref(data) as (ptr, size):
+            status = uclib.uc_mem_write(self._uch, address, ptr, size)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, address, size)
+
+    def __mem_read_string(self, address: int, max_len: int, width: int) -> Tuple[bytes, bool]:
+        data = ctypes.create_string_buffer(max_len * width)
+        chars = ctypes.c_size_t()
+
+        status = uclib.uc_mem_read_string(self._uch, address, data, max_len, width, ctypes.byref(chars))
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, address + chars.value * width)
+
+        return data.raw[:chars.value * width], chars.value == max_len
+
+    def mem_read_cstring(self, address: int, max_len: int = 4096) -> Tuple[bytes, bool]:
+        """Read a NUL-terminated string from emulated memory subsystem.
+
+        Memory is scanned natively, in page-sized chunks.
+
+        Args:
+            address : string memory location
+            max_len : maximal amount of chars to read
+
+        Returns: a tuple containing the string bytes (without the terminator) and a flag
+        indicating whether the string was truncated; that is, whether the read stopped at
+        `max_len` before reaching a terminator
+
+        Raises: `UcError` in case the string runs into an unreadable page
+        """
+
+        return self.__mem_read_string(address, max_len, 1)
+
+    def mem_read_wstring(self, address: int, max_len: int = 4096, width: int = 2) -> Tuple[bytes, bool]:
+        """Read a NUL-terminated wide string from emulated memory subsystem.
+
+        Memory is scanned natively, in page-sized chunks.
+
+        Args:
+            address : string memory location
+            max_len : maximal amount of chars to read
+            width   : char width in bytes (e.g. 2 for UTF-16 strings, 4 for UTF-32 strings)
+
+        Returns: a tuple containing the string bytes (without the terminator) and a flag
+        indicating whether the string was truncated; that is, whether the read stopped at
+        `max_len` before reaching a terminator
+
+        Raises: `UcError` in case the string runs into an unreadable page
+        """
+
+        assert width in (1, 2, 4), 'unexpected char width'
+
+        return self.__mem_read_string(address, max_len, width)
+
+    def mem_read_batch(self, ranges: Sequence[Tuple[int, int]]) -> Tuple[bytearray, Tuple[int, ...], Tuple[int, ...]]:
+        """Read multiple ranges from emulated memory subsystem at once.
+
+        All ranges are read into a single contiguous buffer, in a single native call.
+        A range that cannot be read does not fail the others; its status is reported
+        instead and its part of the buffer is left zeroed.
+
+        Args:
+            ranges: a sequence of tuples consisting of source memory locations and amounts of bytes to read
+
+        Returns: a tuple containing the data buffer, the offset of each range within
+        the data buffer, and the status of each range read (see UC_ERR_* constants)
+        """
+
+        count = len(ranges)
+
+        if not count:
+            return bytearray(), tuple(), tuple()
+
+        addresses, sizes = zip(*ranges)
+
+        offsets = []
+        total = 0
+
+        for size in sizes:
+            offsets.append(total)
+            total += size
+
+        data = bytearray(total)
+
+        addr_list = (ctypes.c_uint64 * count)(*addresses)
+        size_list = (ctypes.c_size_t * count)(*sizes)
+        ptr_list = (ctypes.c_void_p * count)()
+        err_list = (uc_err * count)()
+
+        with _buffer_ref(data, writable=True) as (ptr, _):
+            base = ptr.value or 0
+
+            for i, offset in enumerate(offsets):
+                ptr_list[i] = base + offset
+
+            uclib.uc_mem_read_batch(self._uch, addr_list, ptr_list, size_list, err_list, count)
+
+        return data, tuple(offsets), tuple(err_list)
+
+    def mem_write_batch(self, chunks: Sequence[Tuple[int, Any]]) -> Tuple[int, ...]:
+        """Write multiple chunks of data to emulated memory subsystem at once.
+
+        All chunks are written in a single native call. A chunk that cannot be written
+        does not fail the others; its status is reported instead.
+
+        Args:
+            chunks: a sequence of tuples consisting of target memory locations and data to write;
+                    data may be any contiguous buffer-protocol object
+
+        Returns: the status of each chunk write (see UC_ERR_* constants)
+
+        Raises: `TypeError` in case some data is not a contiguous buffer
+        """
+
+        count = len(chunks)
+
+        if not count:
+            return tuple()
+
+        addr_list = (ctypes.c_uint64 * count)()
+        size_list = (ctypes.c_size_t * count)()
+        ptr_list = (ctypes.c_void_p * count)()
+        err_list = (uc_err * count)()
+
+        with contextlib.ExitStack() as stack:
+            for i, (address, data) in enumerate(chunks):
+                ptr, size = stack.enter_context(_buffer_ref(data))
+
+                addr_list[i] = address
+                size_list[i] = size
+                ptr_list[i] = ctypes.cast(ptr, ctypes.c_void_p).value
+
+            uclib.uc_mem_write_batch(self._uch, addr_list, ptr_list, size_list, err_list, count)
+
+        return tuple(err_list)
+
+    def __mem_read_scalar(self, address: int, ctype: Type[ctypes._SimpleCData]) -> int:
+        value = (ctype.__ctype_be__ if self._byteorder == 'big' else ctype.__ctype_le__)()
+        size = ctypes.sizeof(value)
+
+        status = uclib.uc_mem_read(self._uch, address, ctypes.byref(value), size)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, address, size)
+
+        return value.value
+
+    def __mem_write_scalar(self, address: int, ctype: Type[ctypes._SimpleCData], value: int) -> None:
+        value = (ctype.__ctype_be__ if self._byteorder == 'big' else ctype.__ctype_le__)(value)
+        size = ctypes.sizeof(value)
+
+        status = uclib.uc_mem_write(self._uch, address, ctypes.byref(value), size)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, address, size)
+
+    def mem_read_u8(self, address: int) -> int:
+        """Read an unsigned byte from emulated memory subsystem.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        return self.__mem_read_scalar(address, ctypes.c_uint8)
+
+    def mem_read_u16(self, address: int) -> int:
+        """Read an unsigned 16-bit value from emulated memory subsystem, in emulated
+        processor byte order.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        return self.__mem_read_scalar(address, ctypes.c_uint16)
+
+    def mem_read_u32(self, address: int) -> int:
+        """Read an unsigned 32-bit value from emulated memory subsystem, in emulated
+        processor byte order.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        return self.__mem_read_scalar(address, ctypes.c_uint32)
+
+    def mem_read_u64(self, address: int) -> int:
+        """Read an unsigned 64-bit value from emulated memory subsystem, in emulated
+        processor byte order.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        return self.__mem_read_scalar(address, ctypes.c_uint64)
+
+    def mem_write_u8(self, address: int, value: int) -> None:
+        """Write an unsigned byte to emulated memory subsystem.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        self.__mem_write_scalar(address, ctypes.c_uint8, value)
+
+    def mem_write_u16(self, address: int, value: int) -> None:
+        """Write an unsigned 16-bit value to emulated memory subsystem, in emulated
+        processor byte order.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        self.__mem_write_scalar(address, ctypes.c_uint16, value)
+
+    def mem_write_u32(self, address: int, value: int) -> None:
+        """Write an unsigned 32-bit value to emulated memory subsystem, in emulated
+        processor byte order.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        self.__mem_write_scalar(address, ctypes.c_uint32, value)
+
+    def mem_write_u64(self, address: int, value: int) -> None:
+        """Write an unsigned 64-bit value to emulated memory subsystem, in emulated
+        processor byte order.
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        self.__mem_write_scalar(address, ctypes.c_uint64, value)
+
+    def mem_read_array(self, address: int, typecode: str, count: int) -> array.array:
+        """Read an array of values from emulated memory subsystem, in emulated processor
+        byte order.
+
+        Args:
+            address  : source memory location
+            typecode : array elements type (see `array` module type codes)
+            count    : amount of elements to read
+
+        Returns: an array of elements
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        arr = array.array(typecode, [0]) * count
+        self.mem_read_into(address, arr)
+
+        if self._byteorder != sys.byteorder:
+            arr.byteswap()
+
+        return arr
+
+    def mem_write_array(self, address: int, typecode: str, values: Iterable) -> None:
+        """Write an array of values to emulated memory subsystem, in emulated processor
+        byte order.
+
+        Args:
+            address  : target memory location
+            typecode : array elements type (see `array` module type codes)
+            values   : elements to write
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        swap = self._byteorder != sys.byteorder
+
+        # arrays of the same type need no conversion and may be written as-is
+        if not swap and isinstance(values, array.array) and values.typecode == typecode:
+            arr = values
+
+        else:
+            arr = array.array(typecode, values)
+
+            if swap:
+                arr.byteswap()
+
+        self.mem_write(address, arr)
+
+    def __mem_struct_format(self, fmt: str) -> str:
+        # formats that do not specify a byte order follow the emulated processor's
+        if fmt and fmt[0] in '@=<>!':
+            return fmt
+
+        return ('>' if self._byteorder == 'big' else '<') + fmt
+
+    def mem_unpack(self, address: int, fmt: str) -> Tuple:
+        """Read and decode data from emulated memory subsystem.
+
+        Args:
+            address : source memory location
+            fmt     : data layout, as a `struct` module format string. unless specified
+                      otherwise by the format, data is decoded in emulated processor byte
+                      order and with no alignment
+
+        Returns: a tuple of decoded values
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        fmt = self.__mem_struct_format(fmt)
+
+        return struct.unpack(fmt, self.mem_read(address, struct.calcsize(fmt)))
+
+    def mem_pack(self, address: int, fmt: str, *values) -> None:
+        """Encode and write data to emulated memory subsystem.
+
+        Args:
+            address : target memory location
+            fmt     : data layout, as a `struct` module format string. unless specified
+                      otherwise by the format, data is encoded in emulated processor byte
+                      order and with no alignment
+            values  : values to encode
+
+        Raises: `UcError` in case of an invalid memory access
+        """
+
+        fmt = self.__mem_struct_format(fmt)
+
+        self.mem_write(address, struct.pack(fmt, *values))
+
+    def __is_mmio(self, address: int) -> bool:
+        return any(begin <= address < end for begin, end in self._mmio_callbacks)
+
+    def mem_dump(self) -> UcMemoryImage:
+        """Copy the emulated memory contents and layout to a memory image, which may be
+        loaded later on by this or another instance. MMIO ranges are left out.
+
+        Returns: a memory image holding a copy of every mapped memory region
+        """
+
+        regions = []
+
+        for begin, end, perms in self.mem_regions():
+            if not self.__is_mmio(begin):
+                data = bytearray(end - begin + 1)
+
+                self.mem_read_into(begin, data)
+                regions.append((begin, perms, data))
+
+        return UcMemoryImage(regions)
+
+    def mem_load(self, image: UcMemoryImage, copy: bool = True) -> None:
+        """Map the memory regions held by a memory image.
+
+        Args:
+            image : a memory image taken by `mem_dump`
+            copy  : whether regions contents are copied, or the regions are backed by the
+                    image buffers themselves (see `mem_map_buffer`). the latter spares the
+                    copy, but guest writes land in the image buffers, which must be writable
+
+        Raises:
+            `TypeError` : in case the image buffers are not writable and `copy` is off
+            `UcError`   : in case memory could not be mapped
+        """
+
+        for begin, perms, data in image._regions:
+            if copy:
+                self.mem_map(begin, memoryview(data).nbytes, perms)
+                self.mem_write(begin, data)
+            else:
+                self.mem_map_buffer(begin, data, perms)
+
+    ###########################
+    #  Event hooks management #
+    ###########################
+
+    def _do_hook_add(self, htype: int, fptr: ctypes._FuncPointer, begin: int, end: int, *args: ctypes.c_int) -> int:
+        handle = uc_hook_h()
+
+        # TODO: we do not need a callback counter to reference the callback and user data anymore,
+        # so just pass a dummy value. that value will become the unused 'key' argument
+        dummy = 0
+
+        status = uclib.uc_hook_add(
+            self._uch,
+            ctypes.byref(handle),
+            htype,
+            fptr,
+            ctypes.cast(dummy, ctypes.c_void_p),
+            ctypes.c_uint64(begin),
+            ctypes.c_uint64(end),
+            *args
+        )
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        # hold a reference to the funcion pointer to prevent it from being gc-ed
+        self._callbacks[handle.value] = fptr
+
+        return handle.value
+
+    def hook_add(self, htype: int, callback: Callable, user_data: Any = None, begin: int = 1, end: int = 0, aux1: int = 0, aux2: int = 0) -> int:
+        """Hook emulated events of a certain type.
+
+        Args:
+            htype     : event type(s) to hook (see UC_HOOK_* constants)
+            callback  : a method to call each time the hooked event occurs
+            user_data : an additional context to pass to the callback when it is called
+            begin     : address where hook scope starts
+            end       : address where hook scope ends
+            aux1      : auxiliary parameter; needed for some hook types
+            aux2      : auxiliary parameter; needed for some hook types
+
+        Returns: hook handle
+
+        Raises: `UcError` in case of an invalid htype value
+        """
+
+        def __hook_intr():
+            @uccallback(self, HOOK_INTR_CFUNC)
+            def __hook_intr_cb(uc: Uc, intno: int, key: int):
+                callback(uc, intno, user_data)
+
+            return __hook_intr_cb,
+
+        def __hook_insn():
+            # each arch is expected to overload hook_add and implement this handler on their own.
+            # if we got here, it means this particular architecture does not support hooking any
+            # instruction and so we fail
+            raise UcError(uc.UC_ERR_ARG)
+
+        def __hook_code():
+            @uccallback(self, HOOK_CODE_CFUNC)
+            def __hook_code_cb(uc: Uc, address: int, size: int, key: int):
+                callback(uc, address, size, user_data)
+
+            return __hook_code_cb,
+
+        def __hook_invalid_mem():
+            @uccallback(self, HOOK_MEM_INVALID_CFUNC)
+            def __hook_mem_invalid_cb(uc: Uc, access: int, address: int, size: int, value: int, key: int) -> bool:
+                return callback(uc, access, address, size, value, user_data)
+
+            return __hook_mem_invalid_cb,
+
+        def __hook_mem():
+            @uccallback(self, HOOK_MEM_ACCESS_CFUNC)
+            def __hook_mem_access_cb(uc: Uc, access: int, address: int, size: int, value: int, key: int) -> None:
+                callback(uc, access, address, size, value, user_data)
+
+            return __hook_mem_access_cb,
+
+        def __hook_invalid_insn():
+            @uccallback(self, HOOK_INSN_INVALID_CFUNC)
+            def __hook_insn_invalid_cb(uc: Uc, key: int) -> bool:
+                return callback(uc, user_data)
+
+            return __hook_insn_invalid_cb,
+
+        def __hook_edge_gen():
+            @uccallback(self, HOOK_EDGE_GEN_CFUNC)
+            def __hook_edge_gen_cb(uc: Uc, cur: ctypes._Pointer[uc_tb], prev: ctypes._Pointer[uc_tb], key: int):
+                callback(uc, cur.contents, prev.contents, user_data)
+
+            return __hook_edge_gen_cb,
+
+        def __hook_tcg_opcode():
+            @uccallback(self, HOOK_TCG_OPCODE_CFUNC)
+            def __hook_tcg_op_cb(uc: Uc, address: int, arg1: int, arg2: int, size: int, key: int):
+                callback(uc, address, arg1, arg2, size, user_data)
+
+            opcode = ctypes.c_uint64(aux1)
+            flags = ctypes.c_uint64(aux2)
+
+            return __hook_tcg_op_cb, opcode, flags
 
         handlers: Mapping[int, Callable[[], Tuple]] = {
             uc.UC_HOOK_INTR               : __hook_intr,
@@ -978,283 +2827,1654 @@ class Uc(RegStateManager):
             uc.UC_HOOK_TCG_OPCODE         : __hook_tcg_opcode
         }
 
-        # the same callback may be registered for multiple hook types if they
-        # share the same handling method. here we iterate through htype set bits
-        # and collect all unique handlers it refers to (no duplicates)
-        matched = set(handlers.get(1 << n) for n in range(32) if htype & (1 << n))
-
-        # the set of matched handlers is expected to include exactly one element.
-        # more than one member indicates that htype refers to more than one handler
-        # at the same time, whereas callbacks cannot be assigned to different handlers.
-        # an empty set indicates a matching handler was not found, probably due to
-        # an invalid htype value
-        if len(matched) != 1:
+        fptr, *aux = _select_hook_handler(htype, handlers)()
+
+        return self._do_hook_add(htype, fptr, begin, end, *aux)
+
+    def hook_add_raw(self, htype: int, callback: Callable, begin: int = 1, end: int = 0, aux1: int = 0, aux2: int = 0) -> int:
+        """Hook emulated events of a certain type, with a minimal dispatching overhead.
+
+        Unlike `hook_add`, the callback is called straight from the native hook with the
+        native event arguments alone: neither the Unicorn instance nor a user data are passed
+        to it, and should be bound to the callback if needed. For example, a code hook callback
+        is called as `callback(address, size)` and a memory access hook callback is called as
+        `callback(access, address, size, value)`. Exceptions raised by the callback are handled
+        the same way they are for `hook_add`.
+
+        Args:
+            htype    : event type(s) to hook (see UC_HOOK_* constants); UC_HOOK_INSN is not
+                       supported
+            callback : a method to call each time the hooked event occurs
+            begin    : address where hook scope starts
+            end      : address where hook scope ends
+            aux1     : auxiliary parameter; needed for some hook types
+            aux2     : auxiliary parameter; needed for some hook types
+
+        Returns: hook handle
+
+        Raises: `UcError` in case of an invalid htype value
+        """
+
+        # each dispatcher below is the only Python frame between the native hook and the
+        # callback, so it is written out in full rather than built from shared wrappers
+
+        def __raw_intr():
+            def __raw_intr_cb(handle: int, intno: int, key: int):
+                try:
+                    callback(intno)
+                except Exception as e:
+                    _hook_failed(self, e)
+
+            return HOOK_INTR_CFUNC(__raw_intr_cb),
+
+        def __raw_code():
+            def __raw_code_cb(handle: int, address: int, size: int, key: int):
+                try:
+                    callback(address, size)
+                except Exception as e:
+                    _hook_failed(self, e)
+
+            return HOOK_CODE_CFUNC(__raw_code_cb),
+
+        def __raw_invalid_mem():
+            def __raw_mem_invalid_cb(handle: int, access: int, address: int, size: int, value: int, key: int) -> bool:
+                try:
+                    return callback(access, address, size, value)
+                except Exception as e:
+                    _hook_failed(self, e)
+
+                return False
+
+            return HOOK_MEM_INVALID_CFUNC(__raw_mem_invalid_cb),
+
+        def __raw_mem():
+            def __raw_mem_access_cb(handle: int, access: int, address: int, size: int, value: int, key: int):
+                try:
+                    callback(access, address, size, value)
+                except Exception as e:
+                    _hook_failed(self, e)
+
+            return HOOK_MEM_ACCESS_CFUNC(__raw_mem_access_cb),
+
+        def __raw_invalid_insn():
+            def __raw_insn_invalid_cb(handle: int, key: int) -> bool:
+                try:
+                    return callback()
+                except Exception as e:
+                    _hook_failed(self, e)
+
+                return False
+
+            return HOOK_INSN_INVALID_CFUNC(__raw_insn_invalid_cb),
+
+        def __raw_edge_gen():
+            def __raw_edge_gen_cb(handle: int, cur: ctypes._Pointer[uc_tb], prev: ctypes._Pointer[uc_tb], key: int):
+                try:
+                    callback(cur, prev)
+                except Exception as e:
+                    _hook_failed(self, e)
+
+            return HOOK_EDGE_GEN_CFUNC(__raw_edge_gen_cb),
+
+        def __raw_tcg_opcode():
+            def __raw_tcg_op_cb(handle: int, address: int, arg1: int, arg2: int, size: int, key: int):
+                try:
+                    callback(address, arg1, arg2, size)
+                except Exception as e:
+                    _hook_failed(self, e)
+
+            return HOOK_TCG_OPCODE_CFUNC(__raw_tcg_op_cb), ctypes.c_uint64(aux1), ctypes.c_uint64(aux2)
+
+        handlers: Mapping[int, Callable[[], Tuple]] = {
+            uc.UC_HOOK_INTR               : __raw_intr,
+            uc.UC_HOOK_CODE               : __raw_code,
+            uc.UC_HOOK_BLOCK              : __raw_code,
+            uc.UC_HOOK_MEM_READ_UNMAPPED  : __raw_invalid_mem,
+            uc.UC_HOOK_MEM_WRITE_UNMAPPED : __raw_invalid_mem,
+            uc.UC_HOOK_MEM_FETCH_UNMAPPED : __raw_invalid_mem,
+            uc.UC_HOOK_MEM_READ_PROT      : __raw_invalid_mem,
+            uc.UC_HOOK_MEM_WRITE_PROT     : __raw_invalid_mem,
+            uc.UC_HOOK_MEM_FETCH_PROT     : __raw_invalid_mem,
+            uc.UC_HOOK_MEM_READ           : __raw_mem,
+            uc.UC_HOOK_MEM_WRITE          : __raw_mem,
+            uc.UC_HOOK_MEM_FETCH          : __raw_mem,
+            uc.UC_HOOK_MEM_READ_AFTER     : __raw_mem,
+            uc.UC_HOOK_INSN_INVALID       : __raw_invalid_insn,
+            uc.UC_HOOK_EDGE_GENERATED     : __raw_edge_gen,
+            uc.UC_HOOK_TCG_OPCODE         : __raw_tcg_opcode
+        }
+
+        fptr, *aux = _select_hook_handler(htype, handlers)()
+
+        return self._do_hook_add(htype, fptr, begin, end, *aux)
+
+    def hook_del(self, handle: int) -> None:
+        """Remove an existing hook.
+
+        Args:
+            handle: hook handle
+        """
+
+        h = uc_hook_h(handle)
+        status = uclib.uc_hook_del(self._uch, h)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        del self._callbacks[handle]
+
+        # deleting the hook of a multiplexer closes it
+        for key, mux in tuple(self._hook_muxes.items()):
+            if mux._handle == handle:
+                del self._hook_muxes[key]
+
+                mux._handle = None
+                mux._subscribers = ()
+
+    def hook_addresses(self, addresses: Iterable[int], callback: Callable, user_data: Any = None) -> UcAddressHook:
+        """Hook the execution of instructions at a set of addresses.
+
+        The set is kept natively and only the instructions it holds are instrumented, so
+        the callback is called for them alone and other instructions run at full speed.
+        Addresses may be added to or removed from the set at any time, including from
+        within callbacks, through the returned hook object. Note that updates made from
+        within a callback take effect only once the block being executed is left.
+
+        Args:
+            addresses : initial addresses to hook
+            callback  : a method to call each time a hooked address is executed; it gets the
+                        same arguments as a UC_HOOK_CODE callback
+            user_data : an additional context to pass to the callback when it is called
+
+        Returns: the address hook, whose `handle` may be passed to `hook_del`
+
+        Raises: `UcError` in case the hook could not be added
+        """
+
+        @uccallback(self, HOOK_CODE_CFUNC)
+        def __hook_addresses_cb(uc: Uc, address: int, size: int, key: int):
+            callback(uc, address, size, user_data)
+
+        initial = set(addresses)
+        addr_list = (ctypes.c_uint64 * len(initial))(*initial)
+        handle = uc_hook_h()
+
+        status = uclib.uc_hook_add_addresses(self._uch, ctypes.byref(handle), __hook_addresses_cb, None, addr_list, len(addr_list))
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        # hold a reference to the funcion pointer to prevent it from being gc-ed
+        self._callbacks[handle.value] = __hook_addresses_cb
+
+        return UcAddressHook(self, handle.value, __hook_addresses_cb, initial)
+
+    def hook_mux(self, htype: int, begin: int = 1, end: int = 0, aux1: int = 0, aux2: int = 0) -> UcHookMux:
+        """Get the hook multiplexer of a certain event type and scope, creating it on first
+        use. Callbacks subscribed to a multiplexer share a single native hook, so an event
+        is dispatched to all of them at the cost of a single call into Python.
+
+        Args:
+            htype : event type(s) to hook (see UC_HOOK_* constants); UC_HOOK_INSN is not
+                    supported
+            begin : address where hook scope starts
+            end   : address where hook scope ends
+            aux1  : auxiliary parameter; needed for some hook types
+            aux2  : auxiliary parameter; needed for some hook types
+
+        Returns: the hook multiplexer
+
+        Raises: `UcError` in case of an invalid htype value
+        """
+
+        key = (htype, begin, end, aux1, aux2)
+
+        if key not in self._hook_muxes:
+            self._hook_muxes[key] = UcHookMux(self, *key)
+
+        return self._hook_muxes[key]
+
+    def trace_start(self, kinds: int, capacity: int, consumer: UC_TRACE_CONSUMER_TYPE, user_data: Any = None,
+            begin: int = 1, end: int = 0, structured: bool = False) -> None:
+        """Start collecting emulation events into a native trace buffer.
+
+        Unlike hooks, events are recorded natively and handed to the consumer in batches:
+        once the buffer is full, when `trace_flush` or `trace_stop` are called and when
+        `emu_start` returns. This spares the costs of calling into Python on every event.
+
+        Records are handed to the consumer as a ctypes array of `uc_trace_record` structures,
+        or as a numpy structured array with the same fields. Either way they refer to the
+        trace buffer itself, which is reused afterwards: records are valid only for the
+        duration of the call and must be copied to be kept.
+
+        The consumer may call `trace_stop`, in which case the trace buffer is released once
+        the consumer returns.
+
+        Args:
+            kinds      : events to record; a combination of UC_HOOK_CODE, UC_HOOK_BLOCK,
+                         UC_HOOK_MEM_READ, UC_HOOK_MEM_WRITE and UC_HOOK_MEM_READ_AFTER
+            capacity   : trace buffer size, in records
+            consumer   : a callable invoked with this instance, a batch of records and
+                         `user_data`
+            user_data  : an additional context to pass to the consumer (default: `None`)
+            begin      : start address of the area where events are recorded
+            end        : end address of the area where events are recorded (inclusive)
+            structured : whether records are handed as a numpy structured array (requires numpy)
+
+        Raises: `UcError` in case of invalid arguments, or a trace is already active
+        """
+
+        if structured:
+            import numpy
+
+        @uccallback(self, TRACE_CFUNC)
+        def __trace_cb(uc: Uc, records: ctypes._Pointer[uc_trace_record], count: int, key: int) -> None:
+            batch = (uc_trace_record * count).from_address(ctypes.cast(records, ctypes.c_void_p).value)
+
+            consumer(uc, numpy.asarray(batch) if structured else batch, user_data)
+
+        status = uclib.uc_trace_start(self._uch, kinds, capacity, ctypes.cast(__trace_cb, ctypes.c_void_p), None, begin, end)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        # hold a reference to the consumer callback for as long as the trace is active. note
+        # that trace_stop leaves it in place, as the consumer itself may be the one calling it
+        self._trace = __trace_cb
+
+    def trace_flush(self) -> None:
+        """Hand the events recorded so far to the trace consumer.
+
+        Raises: `UcError` in case no trace is active, or any exception raised by the consumer
+        """
+
+        self._hook_exception = None
+
+        status = uclib.uc_trace_flush(self._uch)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        if self._hook_exception is not None:
+            raise self._hook_exception
+
+    def trace_stop(self) -> None:
+        """Stop collecting emulation events, after handing the events recorded so far to
+        the trace consumer.
+
+        Raises: `UcError` in case no trace is active, or any exception raised by the consumer
+        """
+
+        self._hook_exception = None
+
+        status = uclib.uc_trace_stop(self._uch)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        if self._hook_exception is not None:
+            raise self._hook_exception
+
+    def coverage_map(self, size: int = 0x10000, buffer=None) -> UcCoverageMap:
+        """Start collecting AFL-style edge coverage into a map, updated natively on each
+        block transition. Any map previously collected into is left as-is and no longer
+        updated.
+
+        Args:
+            size   : map size (in bytes); a power of 2
+            buffer : a writable and contiguous buffer-protocol object to hold the map, of
+                     at least `size` bytes (e.g. a `multiprocessing.shared_memory` buffer,
+                     to share it with other processes); allocated if not specified
+
+        Returns: the coverage map
+
+        Raises:
+            `TypeError` : in case buffer is not writable or not contiguous
+            `UcError`   : in case size is not a power of 2, or larger than the buffer
+        """
+
+        view = memoryview(bytearray(size) if buffer is None else buffer).cast('B')[:size]
+
+        if len(view) != size:
+            raise UcError(uc.UC_ERR_ARG)
+
+        pinned = _PinnedBuffer(view, writable=True)
+
+        try:
+            self.ctl_coverage_map(pinned.address, size)
+
+        except UcError:
+            pinned.release()
+
+            raise
+
+        self._coverage = UcCoverageMap(self, pinned, view)
+
+        return self._coverage
+
+    def query(self, prop: int) -> int:
+        """Query an internal Unicorn property.
+
+        Args:
+            prop: property identifier (see: UC_QUERY_* constants)
+
+        Returns: property value
+        """
+
+        result = ctypes.c_size_t()
+        status = uclib.uc_query(self._uch, prop, ctypes.byref(result))
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status, prop)
+
+        return result.value
+
+    def context_save(self) -> UcContext:
+        """Save the emulation state to a new context. By default only the processor
+        state is saved; see `ctl_context_mode` for memory snapshots.
+
+        Returns: a context holding the current state
+
+        Raises: `UcError` in case of failure
+        """
+
+        context = UcContext(self._uch, self._arch, self._mode)
+        status = uclib.uc_context_save(self._uch, context.context)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self._snapshot_taken |= bool(self._context_mode & uc.UC_CTL_CONTEXT_MEMORY)
+
+        return context
+
+    def context_update(self, context: UcContext) -> None:
+        """Save the emulation state to an existing context, overwriting its content.
+
+        Args:
+            context: a context previously created by `context_save`
+
+        Raises: `UcError` in case of failure
+        """
+
+        status = uclib.uc_context_save(self._uch, context.context)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self._snapshot_taken |= bool(self._context_mode & uc.UC_CTL_CONTEXT_MEMORY)
+
+    def context_pool(self, prealloc: int = 0, capacity: Optional[int] = None) -> UcContextPool:
+        """Create a pool of reusable contexts for this instance, meant for hot
+        save / restore cycles.
+
+        Args:
+            prealloc : number of contexts to allocate upfront
+            capacity : maximal number of idle contexts to keep for reuse (default: unbounded)
+
+        Returns: a contexts pool
+        """
+
+        return UcContextPool(self, prealloc, capacity)
+
+    def savepoints(self) -> UcSavepoints:
+        """Get the nested savepoints manager of this instance, creating it on first
+        use. Note that creating the manager makes contexts hold memory snapshots (see
+        `ctl_context_mode`).
+
+        Returns: the savepoints manager
+        """
+
+        if self._savepoints is None:
+            self._savepoints = UcSavepoints(self)
+
+        return self._savepoints
+
+    def context_restore(self, context: UcContext) -> None:
+        """Restore the emulation state from a context. With memory snapshots enabled,
+        memory is rolled back to its state at the time the context was saved, and
+        the context may be restored again later on.
+
+        Args:
+            context: a context previously saved on this instance
+
+        Raises: `UcError` in case of failure
+        """
+
+        status = uclib.uc_context_restore(self._uch, context.context)
+
+        # only memory snapshots restore the memory layout; in that case, rebuild the index on demand
+        restores_memory = bool(self._context_mode & uc.UC_CTL_CONTEXT_MEMORY)
+
+        if restores_memory:
+            self._mem_index = None
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        if not restores_memory:
+            return
+
+        # ranges mapped back by the restore are backed by their buffers again
+        for begin, end in tuple(self._retained_buffers):
+            if self.__get_mem_index().overlaps(begin, end - 1):
+                self._mapped_buffers[(begin, end)] = self._retained_buffers.pop((begin, end))
+
+        # pages filled after the snapshot was taken are gone, and unmapped ones may be back
+        for region, _ in self._lazy_regions.values():
+            region._resync(self.__get_mem_index())
+
+    def __checkpoint_context(self) -> UcContext:
+        # saving a context with memory snapshots on would take a snapshot as a side effect,
+        # so the processor state is saved on its own
+        mode = self._context_mode
+
+        if mode != uc.UC_CTL_CONTEXT_CPU:
+            self.ctl_context_mode(cpu=True, memory=False)
+
+        try:
+            return self.context_save()
+
+        finally:
+            if mode != uc.UC_CTL_CONTEXT_CPU:
+                self.ctl_context_mode(bool(mode & uc.UC_CTL_CONTEXT_CPU), bool(mode & uc.UC_CTL_CONTEXT_MEMORY))
+
+    def checkpoint(self, path: str, compression: Optional[str] = None) -> None:
+        """Save the full machine state to a checkpoint file: processor context, memory
+        layout and memory contents.
+
+        Memory is saved page by page, and pages that hold only zeros are left out. Unless
+        compressed, memory images are laid out so they can be mapped directly from the
+        file, which lets `from_checkpoint` restore them lazily. MMIO ranges are recorded,
+        but their callbacks are not.
+
+        Args:
+            path        : path of the checkpoint file to create
+            compression : memory images compression method: 'zlib', 'bz2' or 'lzma' [optional]
+
+        Raises: `UcError` in case compression method is not supported, or state could not
+        be read
+        """
+
+        if compression is None:
+            codec_id = 0
+            codec = None
+
+        elif compression in _CKPT_CODECS:
+            codec_id, compressor, _ = _CKPT_CODECS[compression]
+            codec = _ckpt_codec(compression)
+
+        else:
+            raise UcError(uc.UC_ERR_ARG)
+
+        page_size = self.ctl_get_page_size()
+        granularity = mmap.ALLOCATIONGRANULARITY
+
+        regions = []
+
+        for begin, end, perms in self.mem_regions():
+            regions.append((begin, end - begin + 1, perms, _CKPT_KIND_MMIO if self.__is_mmio(begin) else _CKPT_KIND_RAM))
+
+        npages = sum(size // page_size for _, size, _, kind in regions if kind == _CKPT_KIND_RAM)
+        context = bytes(self.__checkpoint_context())
+
+        index = bytearray(npages)
+        table = []
+
+        zero = bytes(page_size)
+        chunk = bytearray(max(page_size, 0x100000 // page_size * page_size))
+
+        metadata = _CKPT_HEADER.size + len(regions) * _CKPT_REGION.size + npages + len(context)
+        eof = (metadata + granularity - 1) // granularity * granularity
+        first = 0
+
+        with open(path, 'wb') as f:
+            for begin, size, perms, kind in regions:
+                offset = length = 0
+
+                if kind == _CKPT_KIND_RAM:
+                    offset = eof
+                    z = codec and getattr(codec, compressor)()
+
+                    f.seek(offset)
+
+                    for address in range(begin, begin + size, len(chunk)):
+                        view = memoryview(chunk)[:min(len(chunk), begin + size - address)]
+                        page = first + (address - begin) // page_size
+
+                        self.mem_read_into(address, view)
+
+                        for i in range(0, len(view), page_size):
+                            index[page + i // page_size] = chunk[i:i + page_size] != zero
+
+                        for run, count in _ckpt_runs(index, page, len(view) // page_size):
+                            data = view[run * page_size:(run + count) * page_size]
+
+                            if z:
+                                f.write(z.compress(data))
+                            else:
+                                f.seek(offset + address - begin + run * page_size)
+                                f.write(data)
+
+                    if not any(index[first:first + size // page_size]):
+                        offset = 0
+
+                    elif z:
+                        f.write(z.flush())
+
+                        length = f.tell() - offset
+                        eof = offset + length
+
+                    else:
+                        # zero pages are skipped rather than written, leaving holes in the file
+                        length = size
+                        eof = (offset + length + granularity - 1) // granularity * granularity
+
+                    first += size // page_size
+
+                table.append(_CKPT_REGION.pack(begin, size, perms, kind, offset, length))
+
+            f.truncate(eof)
+            f.seek(0)
+
+            f.write(_CKPT_HEADER.pack(_CKPT_MAGIC, _CKPT_VERSION, self._arch, self._mode, self.ctl_get_cpu_model(),
+                page_size, codec_id, len(regions), len(context)))
+
+            f.write(b''.join(table))
+            f.write(index)
+            f.write(context)
+
+    @classmethod
+    def from_checkpoint(cls, path: str, mmio: Optional[Mapping[int, Tuple[Optional[UC_MMIO_READ_TYPE], Any, Optional[UC_MMIO_WRITE_TYPE], Any]]] = None) -> Uc:
+        """Create a Unicorn engine instance from a checkpoint file.
+
+        Uncompressed memory images are mapped from the file copy-on-write rather than
+        read, so memory is paged in by the host only as it is accessed and the file is
+        never modified.
+
+        Args:
+            path : path of the checkpoint file to load
+            mmio : MMIO callbacks to re-map recorded MMIO ranges with; a mapping of range base
+                   address to a tuple of read callback, read user data, write callback and
+                   write user data (see `mmio_map`). ranges with no callbacks are mapped with
+                   none, so accessing them fails
+
+        Returns: a new Unicorn engine instance
+
+        Raises:
+            `OSError` : in case the file could not be read or mapped
+            `UcError` : in case the file is not a valid checkpoint, or could not be restored
+        """
+
+        with open(path, 'rb') as f:
+            try:
+                magic, version, arch, mode, cpu, page_size, codec_id, count, size = _CKPT_HEADER.unpack(f.read(_CKPT_HEADER.size))
+                regions = [_CKPT_REGION.unpack(f.read(_CKPT_REGION.size)) for _ in range(count)]
+
+            except struct.error:
+                raise UcError(uc.UC_ERR_ARG) from None
+
+            if magic != _CKPT_MAGIC or version != _CKPT_VERSION:
+                raise UcError(uc.UC_ERR_ARG)
+
+            codec = None
+
+            if codec_id:
+                name, decompressor = next(((k, v[2]) for k, v in _CKPT_CODECS.items() if v[0] == codec_id), (None, None))
+
+                if name is None:
+                    raise UcError(uc.UC_ERR_ARG)
+
+                codec = _ckpt_codec(name)
+
+            index = f.read(sum(rsize // page_size for _, rsize, _, kind, _, _ in regions if kind == _CKPT_KIND_RAM))
+            context = f.read(size)
+
+            instance = cls(arch, mode, cpu)
+
+            # only some architectures have a configurable page size
+            if arch == uc.UC_ARCH_ARM:
+                instance.ctl_set_page_size(page_size)
+
+            if instance.ctl_get_page_size() != page_size or uclib.uc_context_size(instance._uch) != size:
+                raise UcError(uc.UC_ERR_ARG)
+
+            first = 0
+
+            for begin, rsize, perms, kind, offset, length in regions:
+                if kind == _CKPT_KIND_MMIO:
+                    read_cb, user_data_read, write_cb, user_data_write = (mmio or {}).get(begin, (None, None, None, None))
+
+                    instance.mmio_map(begin, rsize, read_cb, user_data_read, write_cb, user_data_write)
+                    continue
+
+                if not length:
+                    instance.mem_map(begin, rsize, perms)
+
+                elif codec is None:
+                    instance.mem_map_file(begin, path, offset, rsize, perms)
+
+                else:
+                    f.seek(offset)
+
+                    data = memoryview(getattr(codec, decompressor)().decompress(f.read(length)))
+                    pos = 0
+
+                    instance.mem_map(begin, rsize, perms)
+
+                    for run, pages in _ckpt_runs(index, first, rsize // page_size):
+                        instance.mem_write(begin + run * page_size, data[pos:pos + pages * page_size])
+
+                        pos += pages * page_size
+
+                first += rsize // page_size
+
+        ctx = UcContext(instance._uch, arch, mode)
+        ctx._load(context)
+
+        instance.context_restore(ctx)
+
+        return instance
+
+    @staticmethod
+    def __ctl_encode(ctl: int, op: int, nargs: int) -> int:
+        assert (nargs & ~0b1111) == 0, f'nargs must not exceed value of 15 (got {nargs})'
+        assert op and (op & ~0b11) == 0, f'op must not exceed value of 3 (got {op})'
+
+        return (op << 30) | (nargs << 26) | ctl
+
+    def ctl(self, ctl: int, op: int, *args):
+        code = Uc.__ctl_encode(ctl, op, len(args))
+
+        status = uclib.uc_ctl(self._uch, code, *args)
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+    Arg = Tuple[Type, Optional[int]]
+
+    def __ctl_r(self, ctl: int, arg0: Arg):
+        atype, _ = arg0
+        carg = atype()
+
+        self.ctl(ctl, uc.UC_CTL_IO_READ, ctypes.byref(carg))
+
+        return carg.value
+
+    def __ctl_w(self, ctl: int, *args: Arg):
+        cargs = (atype(avalue) for atype, avalue in args)
+
+        self.ctl(ctl, uc.UC_CTL_IO_WRITE, *cargs)
+
+    def __ctl_wr(self, ctl: int, arg0: Arg, arg1: Arg):
+        atype, avalue = arg0
+        carg0 = atype(avalue)
+
+        atype, _ = arg1
+        carg1 = atype()
+
+        self.ctl(ctl, uc.UC_CTL_IO_READ_WRITE, carg0, ctypes.byref(carg1))
+
+        return carg1
+
+    def ctl_get_mode(self) -> int:
+        return self.__ctl_r(uc.UC_CTL_UC_MODE,
+            (ctypes.c_int, None)
+        )
+
+    def ctl_get_page_size(self) -> int:
+        return self.__ctl_r(uc.UC_CTL_UC_PAGE_SIZE,
+            (ctypes.c_uint32, None)
+        )
+
+    def ctl_set_page_size(self, val: int) -> None:
+        self.__ctl_w(uc.UC_CTL_UC_PAGE_SIZE,
+            (ctypes.c_uint32, val)
+        )
+
+    def ctl_get_arch(self) -> int:
+        return self.__ctl_r(uc.UC_CTL_UC_ARCH,
+            (ctypes.c_int, None)
+        )
+
+    def ctl_get_timeout(self) -> int:
+        return self.__ctl_r(uc.UC_CTL_UC_TIMEOUT,
+            (ctypes.c_uint64, None)
+        )
+
+    def ctl_exits_enabled(self, val: bool) -> None:
+        self.__ctl_w(uc.UC_CTL_UC_USE_EXITS,
+            (ctypes.c_int, val)
+        )
+
+    def ctl_get_exits_cnt(self) -> int:
+        return self.__ctl_r(uc.UC_CTL_UC_EXITS_CNT,
+            (ctypes.c_size_t, None)
+        )
+
+    def ctl_get_exits(self) -> Sequence[int]:
+        count = self.ctl_get_exits_cnt()
+        arr = (ctypes.c_uint64 * count)()
+
+        self.ctl(uc.UC_CTL_UC_EXITS, uc.UC_CTL_IO_READ, ctypes.cast(arr, ctypes.c_void_p), ctypes.c_size_t(count))
+
+        return tuple(i for i in arr)
+
+    def ctl_set_exits(self, exits: Sequence[int]) -> None:
+        arr = (ctypes.c_uint64 * len(exits))()
+
+        for idx, exit in enumerate(exits):
+            arr[idx] = exit
+
+        self.ctl(uc.UC_CTL_UC_EXITS, uc.UC_CTL_IO_WRITE, ctypes.cast(arr, ctypes.c_void_p), ctypes.c_size_t(len(exits)))
+
+    def ctl_get_cpu_model(self) -> int:
+        return self.__ctl_r(uc.UC_CTL_CPU_MODEL,
+            (ctypes.c_int, None)
+        )
+
+    def ctl_set_cpu_model(self, val: int) -> None:
+        self.__ctl_w(uc.UC_CTL_CPU_MODEL,
+            (ctypes.c_int, val)
+        )
+
+    def ctl_remove_cache(self, addr: int, end: int) -> None:
+        self.__ctl_w(uc.UC_CTL_TB_REMOVE_CACHE,
+            (ctypes.c_uint64, addr),
+            (ctypes.c_uint64, end)
+        )
+
+    def ctl_request_cache(self, addr: int):
+        return self.__ctl_wr(uc.UC_CTL_TB_REQUEST_CACHE,
+            (ctypes.c_uint64, addr),
+            (uc_tb, None)
+        )
+
+    def ctl_flush_tb(self) -> None:
+        self.__ctl_w(uc.UC_CTL_TB_FLUSH)
+
+    def ctl_tlb_mode(self, mode: int) -> None:
+        self.__ctl_w(uc.UC_CTL_TLB_TYPE,
+            (ctypes.c_uint, mode)
+        )
+
+    def ctl_flush_tlb(self) -> None:
+        self.__ctl_w(uc.UC_CTL_TLB_FLUSH)
+
+    def ctl_get_tcg_buffer_size(self) -> int:
+        return self.__ctl_r(uc.UC_CTL_TCG_BUFFER_SIZE,
+            (ctypes.c_uint32, None)
+        )
+
+    def ctl_set_tcg_buffer_size(self, size: int) -> None:
+        """Set the translation cache size. This takes effect only if set before
+        the engine is first used (e.g. before memory is mapped).
+        """
+
+        self.__ctl_w(uc.UC_CTL_TCG_BUFFER_SIZE,
+            (ctypes.c_uint32, size)
+        )
+
+    def ctl_context_mode(self, cpu: bool = True, memory: bool = True) -> None:
+        """Select the state that `context_save` and `context_restore` act on.
+
+        When memory is selected, saving a context takes a copy-on-write snapshot of
+        the memory: pages are copied only once they are written to, and restoring the
+        context rolls memory contents and mappings back to the snapshot. Constraints
+        apply for as long as a memory snapshot is in effect:
+          - memory protection cannot be changed; `mem_protect` fails with `UC_ERR_ARG`
+          - memory regions backed by host memory (`mem_map_ptr`, `mem_map_buffer`) are
+            copied on write as well, so guest writes no longer reach the host memory
+          - a context must be restored on the instance it was saved from, and restoring
+            it discards all snapshots taken after it
+
+        Args:
+            cpu    : whether contexts hold the processor state
+            memory : whether contexts hold memory snapshots
+        """
+
+        mode = (uc.UC_CTL_CONTEXT_CPU if cpu else 0) | (uc.UC_CTL_CONTEXT_MEMORY if memory else 0)
+
+        self.__ctl_w(uc.UC_CTL_CONTEXT_MODE,
+            (ctypes.c_int, mode)
+        )
+
+        self._context_mode = mode
+
+    def ctl_coverage_map(self, address: int, size: int) -> None:
+        """Set the host memory to collect edge coverage into, or stop collecting it when
+        `address` is 0. See `coverage_map` for a managed map.
+        """
+
+        self.__ctl_w(uc.UC_CTL_COVERAGE_MAP,
+            (ctypes.c_void_p, address or None),
+            (ctypes.c_size_t, size)
+        )
+
+    def ctl_context_dirty_pages(self, context: UcContext) -> int:
+        """Count the memory pages copied on write since a context was saved, when
+        contexts hold memory snapshots.
+        """
+
+        return self.__ctl_wr(uc.UC_CTL_CONTEXT_DIRTY_PAGES,
+            (uc_context, context.context.value),
+            (ctypes.c_size_t, None)
+        ).value
+
+
+class UcContext(RegStateManager):
+    def __init__(self, h, arch: int, mode: int):
+        self._context = uc_context()
+        self._size = uclib.uc_context_size(h)
+
+        status = uclib.uc_context_alloc(h, ctypes.byref(self._context))
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+        self._to_free = True
+        self._arch = arch
+        self._mode = mode
+
+        self._reg_classes = _load_reg_classes(arch)
+        self._reg_tables = _load_reg_tables(arch)
+
+    @property
+    def context(self):
+        return self._context
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def arch(self) -> int:
+        return self._arch
+
+    @property
+    def mode(self) -> int:
+        return self._mode
+
+    # RegStateManager mixin method implementation
+    def _do_reg_read(self, reg_id: int, reg_obj) -> int:
+        """Private register read implementation.
+        """
+
+        return uclib.uc_context_reg_read(self._context, reg_id, reg_obj)
+
+    # RegStateManager mixin method implementation
+    def _do_reg_write(self, reg_id: int, reg_obj) -> int:
+        """Private register write implementation.
+        """
+
+        return uclib.uc_context_reg_write(self._context, reg_id, reg_obj)
+
+    def _do_reg_read_batch(self, reglist, vallist, count) -> int:
+        """Private batch register read implementation.
+        """
+
+        return uclib.uc_context_reg_read_batch(self._context, reglist, vallist, count)
+
+    def _do_reg_write_batch(self, reglist, vallist, sizelist, count) -> int:
+        """Private batch register write implementation.
+        """
+
+        return uclib.uc_context_reg_write_batch2(self._context, reglist, vallist, sizelist, count)
+
+    def _view(self) -> memoryview:
+        """Get a read-only view of the context data, without copying it. The view
+        keeps this context alive for as long as it is referenced.
+        """
+
+        data = (ctypes.c_char * self.size).from_address(self.context.value)
+        data._owner = self
+
+        return memoryview(data).cast('B').toreadonly()
+
+    def _load(self, data) -> None:
+        """Overwrite the context data with data saved from a context of the same size.
+
+        Raises: `UcError` in case data size does not match the context size
+        """
+
+        with _buffer_ref(data) as (ptr, size):
+            if size != self.size:
+                raise UcError(uc.UC_ERR_ARG)
+
+            ctypes.memmove(self.context, ptr, size)
+
+    # Make UcContext picklable
+    def __getstate__(self):
+        return bytes(self), self.size, self.arch, self.mode
+
+    def __setstate__(self, state) -> None:
+        context, size, arch, mode = state
+
+        # __init__ won't be invoked, so the context is allocated here by an engine of the
+        # same arch and mode. this makes it a regular context that may be restored on any
+        # compatible instance, and detects data saved by an incompatible library build
+        UcContext.__init__(self, _context_allocator(arch, mode), arch, mode)
+
+        self._load(context)
+
+    def __reduce_ex__(self, protocol: int):
+        # from protocol 5 onwards, context data is handed to pickle as a buffer rather than
+        # copied into a bytes object, so it may be transferred out-of-band (see pickle's
+        # buffer_callback) without any copies
+        if protocol < 5:
+            state = self.__getstate__()
+
+        else:
+            import pickle
+
+            state = (pickle.PickleBuffer(self._view()), self.size, self.arch, self.mode)
+
+        return copyreg.__newobj__, (type(self),), state
+
+    def __bytes__(self) -> bytes:
+        return ctypes.string_at(self.context, self.size)
+
+    def __del__(self) -> None:
+        if self._to_free:
+            uclib.uc_context_free(self._context)
+
+
+def _context_allocator(arch: int, mode: int) -> uc_engine:
+    """Get an engine handle to allocate contexts that are not saved from an instance,
+    e.g. unpickled ones. Allocating engines are opened on first use and kept for the
+    lifetime of the process, one per arch and mode.
+    """
+
+    key = (arch, mode)
+
+    if key not in _context_allocators:
+        _context_allocators[key] = Uc(arch, mode)
+
+    return _context_allocators[key]._uch
+
+
+_context_allocators: MutableMapping[Tuple[int, int], Uc] = {}
+
+
+class UcMemoryImage:
+    """A copy of the emulated memory contents and layout, taken by `Uc.mem_dump` and
+    loaded by `Uc.mem_load`.
+
+    Memory images are picklable. From pickle protocol 5 onwards, regions contents are
+    handed to pickle as buffers rather than copied, so they may be transferred out-of-band
+    (e.g. through shared memory) without any copies. Buffers received out-of-band are
+    held as-is by the unpickled image.
+    """
+
+    __slots__ = ('_regions',)
+
+    def __init__(self, regions: Iterable[Tuple[int, int, Any]]) -> None:
+        # base address, perms and contents buffer of each region
+        self._regions = tuple(regions)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        """Iterate through the image memory regions.
+
+        Returns: an iterator whose elements contain begin, end and perms properties of each range
+        """
+
+        for begin, perms, data in self._regions:
+            yield begin, begin + memoryview(data).nbytes - 1, perms
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the image memory regions.
+        """
+
+        return sum(memoryview(data).nbytes for _, _, data in self._regions)
+
+    def read(self, address: int, size: int) -> memoryview:
+        """Read data from the image, without copying it.
+
+        Raises: `UcError` in case the range is not held by a single region of the image
+        """
+
+        for begin, _, data in self._regions:
+            view = memoryview(data).cast('B')
+
+            if begin <= address and address + size <= begin + view.nbytes:
+                return view[address - begin:address - begin + size]
+
+        raise UcError(uc.UC_ERR_READ_UNMAPPED, address, size)
+
+    def __reduce_ex__(self, protocol: int):
+        if protocol < 5:
+            return type(self), (tuple((begin, perms, bytearray(data)) for begin, perms, data in self._regions),)
+
+        import pickle
+
+        return type(self), (tuple((begin, perms, pickle.PickleBuffer(data)) for begin, perms, data in self._regions),)
+
+
+class UcCoverageMap:
+    """An AFL-style edge coverage map, updated natively on each block transition.
+
+    On each transition, the map byte indexed by the hashes of the previous and the
+    current block addresses is incremented. The previous block is forgotten when
+    emulation starts, so edges do not span distinct `emu_start` calls.
+
+    Coverage maps are created by `Uc.coverage_map`; not to be instantiated directly.
+    """
+
+    def __init__(self, uc: Uc, pinned: _PinnedBuffer, view: memoryview) -> None:
+        self._uc = uc
+        self._pinned = pinned
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @property
+    def view(self) -> memoryview:
+        """A writable view of the map memory.
+        """
+
+        return self._view
+
+    @property
+    def active(self) -> bool:
+        """Whether the map is the one coverage is collected into.
+        """
+
+        return self._uc._coverage is self
+
+    def reset(self) -> None:
+        """Clear all hit counts.
+        """
+
+        ctypes.memset(self._pinned.address, 0, self._pinned.size)
+
+    def classify(self) -> None:
+        """Replace hit counts with their AFL buckets, in place.
+        """
+
+        self._view[:] = self._view.tobytes().translate(_COVERAGE_BUCKETS)
+
+    def hash(self) -> int:
+        """Calculate a checksum of the map, which identifies the path taken.
+        """
+
+        return binascii.crc32(self._view)
+
+    def edges(self) -> int:
+        """Count the edges hit.
+        """
+
+        return len(self._view) - self._view.tobytes().count(0)
+
+    def close(self) -> None:
+        """Stop collecting coverage into the map if it is still active, and release the
+        map memory, which may not be accessed through the map afterwards.
+        """
+
+        if self.active:
+            self._uc.ctl_coverage_map(0, 0)
+            self._uc._coverage = None
+
+        self._pinned.release()
+        self._view.release()
+
+
+class UcAddressHook:
+    """A code hook restricted to a set of addresses, which may be updated while the hook
+    is in place.
+
+    Address hooks are created by `Uc.hook_addresses`; not to be instantiated directly.
+    """
+
+    def __init__(self, uc: Uc, handle: int, fptr: ctypes._FuncPointer, addresses: MutableSet[int]) -> None:
+        self._uc = uc
+        self._handle = handle
+        self._fptr = fptr
+        self._addresses = addresses
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __contains__(self, address: int) -> bool:
+        return address in self._addresses
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._addresses)
+
+    @property
+    def handle(self) -> int:
+        """The underlying hook handle.
+        """
+
+        return self._handle
+
+    def __update(self, func: Callable, addresses: Iterable[int]) -> None:
+        # the native hook is released once deleted, so it may not be referred anymore
+        if self._uc._callbacks.get(self._handle) is not self._fptr:
+            raise UcError(uc.UC_ERR_ARG)
+
+        addr_list = (ctypes.c_uint64 * len(addresses))(*addresses)
+
+        status = func(self._uc._uch, uc_hook_h(self._handle), addr_list, len(addr_list))
+
+        if status != uc.UC_ERR_OK:
+            raise UcError(status)
+
+    def add(self, address: int) -> None:
+        """Start hooking an address.
+
+        Raises: `UcError` in case the hook was deleted
+        """
+
+        self.update((address,))
+
+    def discard(self, address: int) -> None:
+        """Stop hooking an address, if hooked.
+
+        Raises: `UcError` in case the hook was deleted
+        """
+
+        self.difference_update((address,))
+
+    def update(self, addresses: Iterable[int]) -> None:
+        """Start hooking several addresses at once.
+
+        Raises: `UcError` in case the hook was deleted
+        """
+
+        added = set(addresses) - self._addresses
+
+        self.__update(uclib.uc_hook_addresses_insert, added)
+        self._addresses |= added
+
+    def difference_update(self, addresses: Iterable[int]) -> None:
+        """Stop hooking several addresses at once.
+
+        Raises: `UcError` in case the hook was deleted
+        """
+
+        removed = set(addresses) & self._addresses
+
+        self.__update(uclib.uc_hook_addresses_remove, removed)
+        self._addresses -= removed
+
+
+class UcHookSubscription:
+    """A callback subscribed to a hook multiplexer, along with its counters. Counters
+    are updated only while the multiplexer is timed.
+
+    Subscriptions are created by `UcHookMux.subscribe`; not to be instantiated directly.
+    """
+
+    __slots__ = ('callback', 'user_data', 'calls', 'elapsed_ns')
+
+    def __init__(self, callback: Callable, user_data: Any) -> None:
+        self.callback = callback
+        self.user_data = user_data
+
+        # number of calls and total time spent in the callback (in nanoseconds)
+        self.calls = 0
+        self.elapsed_ns = 0
+
+
+class UcHookMux:
+    """Dispatches the events of a single native hook to an ordered list of subscribers.
+
+    Subscribers are called as `hook_add` callbacks are, that is with the Unicorn instance,
+    the event arguments and their user data, except for UC_HOOK_EDGE_GENERATED where they
+    get `uc_tb` pointers rather than structures. Subscribing and unsubscribing do not
+    touch the native hook, and may be done from within subscribers: changes take effect
+    on the next event.
+
+    Events that may be handled (i.e. invalid memory accesses and invalid instructions)
+    are dispatched in order until a subscriber handles them, as native hooks are.
+
+    Multiplexers are created by `Uc.hook_mux`; not to be instantiated directly.
+
+    Example:
+        >>> mux = uc.hook_mux(UC_HOOK_CODE)
+        >>> tracer = mux.subscribe(trace_insn)
+        >>> mux.timed = True
+        >>> uc.emu_start(begin, until)
+        >>> print(tracer.calls, tracer.elapsed_ns)
+    """
+
+    def __init__(self, uc: Uc, htype: int, begin: int, end: int, aux1: int, aux2: int) -> None:
+        functype = _select_hook_handler(htype, _HOOK_CFUNCS)
+        handled = functype in (HOOK_MEM_INVALID_CFUNC, HOOK_INSN_INVALID_CFUNC)
+
+        self._uc = uc
+        self._subscribers: Tuple[UcHookSubscription, ...] = ()
+
+        # whether subscribers counters are updated
+        self.timed = False
+
+        # the subscribers tuple is replaced rather than modified, so it is safe to
+        # iterate over it while subscribers come and go
+        def __fanout(handle: int, *args):
+            native = args[:-1]
+
+            try:
+                if self.timed:
+                    for sub in self._subscribers:
+                        start = time.perf_counter_ns()
+                        result = sub.callback(uc, *native, sub.user_data)
+
+                        sub.elapsed_ns += time.perf_counter_ns() - start
+                        sub.calls += 1
+
+                        if handled and result:
+                            return True
+                else:
+                    for sub in self._subscribers:
+                        if sub.callback(uc, *native, sub.user_data) and handled:
+                            return True
+            except Exception as e:
+                _hook_failed(uc, e)
+
+        aux = (ctypes.c_uint64(aux1), ctypes.c_uint64(aux2)) if functype is HOOK_TCG_OPCODE_CFUNC else ()
+
+        self._handle: Optional[int] = uc._do_hook_add(htype, functype(__fanout), begin, end, *aux)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def handle(self) -> Optional[int]:
+        """The underlying hook handle, or `None` once closed. Deleting it with `Uc.hook_del`
+        closes the multiplexer.
+        """
+
+        return self._handle
+
+    @property
+    def subscribers(self) -> Tuple[UcHookSubscription, ...]:
+        """Current subscriptions, in dispatching order.
+        """
+
+        return self._subscribers
+
+    def subscribe(self, callback: Callable, user_data: Any = None) -> UcHookSubscription:
+        """Add a subscriber, to be called after the existing ones.
+
+        Args:
+            callback  : a method to call each time the hooked event occurs
+            user_data : an additional context to pass to the callback when it is called
+
+        Returns: the subscription, to be used for unsubscribing
+
+        Raises: `UcError` in case the multiplexer was closed
+        """
+
+        if self._handle is None:
             raise UcError(uc.UC_ERR_ARG)
 
-        handler = matched.pop()
+        subscription = UcHookSubscription(callback, user_data)
+        self._subscribers += (subscription,)
+
+        return subscription
 
-        # a None element indicates that htype has an unrecognized bit set
-        if handler is None:
+    def unsubscribe(self, subscription: UcHookSubscription) -> None:
+        """Remove a subscriber.
+
+        Raises: `UcError` in case the subscription does not belong to this multiplexer
+        """
+
+        if subscription not in self._subscribers:
             raise UcError(uc.UC_ERR_ARG)
 
-        fptr, *aux = handler()
+        self._subscribers = tuple(sub for sub in self._subscribers if sub is not subscription)
 
-        return self.__do_hook_add(htype, fptr, begin, end, *aux)
+    def reset_counters(self) -> None:
+        """Zero the counters of all subscribers.
+        """
 
-    def hook_del(self, handle: int) -> None:
-        """Remove an existing hook.
+        for sub in self._subscribers:
+            sub.calls = 0
+            sub.elapsed_ns = 0
 
-        Args:
-            handle: hook handle
+    def close(self) -> None:
+        """Remove the native hook along with all subscribers. A new multiplexer will be
+        created the next time `Uc.hook_mux` is called for this event type and scope.
         """
 
-        h = uc_hook_h(handle)
-        status = uclib.uc_hook_del(self._uch, h)
+        if self._handle is not None:
+            self._uc.hook_del(self._handle)
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
 
-        del self._callbacks[handle]
+class UcContextPool:
+    """A pool of reusable contexts bound to a Unicorn engine instance.
 
-    def query(self, prop: int) -> int:
-        """Query an internal Unicorn property.
+    Saving state through a pool refills a previously released context in place
+    rather than allocating a new one, which spares the allocation and release
+    of native context memory on hot save / restore cycles.
+
+    Pools are created through `Uc.context_pool`.
+
+    Example:
+        >>> pool = uc.context_pool(4)
+        >>> with pool.saved() as ctx:
+        ...     uc.emu_start(begin, until)
+        ...     uc.context_restore(ctx)
+    """
+
+    def __init__(self, uc: Uc, prealloc: int = 0, capacity: Optional[int] = None) -> None:
+        """Initialize a contexts pool.
 
         Args:
-            prop: property identifier (see: UC_QUERY_* constants)
+            uc       : engine instance to save contexts of
+            prealloc : number of contexts to allocate upfront
+            capacity : maximal number of idle contexts to keep for reuse (default: unbounded)
+        """
 
-        Returns: property value
+        self._uc = uc
+        self._capacity = capacity
+
+        self._free = [self.__alloc() for _ in range(prealloc)]
+        self._free_ids = set(id(ctx) for ctx in self._free)
+
+        self._hits = 0
+        self._misses = 0
+
+    def __alloc(self) -> UcContext:
+        engine = self._uc
+
+        return UcContext(engine._uch, engine._arch, engine._mode)
+
+    def __len__(self) -> int:
+        """Number of idle contexts available for reuse.
         """
 
-        result = ctypes.c_size_t()
-        status = uclib.uc_query(self._uch, prop, ctypes.byref(result))
+        return len(self._free)
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status, prop)
+    @property
+    def hits(self) -> int:
+        """Number of saves that reused an idle context.
+        """
 
-        return result.value
+        return self._hits
 
-    def context_save(self) -> UcContext:
-        context = UcContext(self._uch, self._arch, self._mode)
-        status = uclib.uc_context_save(self._uch, context.context)
+    @property
+    def misses(self) -> int:
+        """Number of saves that had to allocate a new context.
+        """
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        return self._misses
+
+    def save(self) -> UcContext:
+        """Save the engine state to a pooled context, allocating a new one only
+        if there is no idle context to reuse.
+
+        Returns: a context holding the current engine state; release it back to
+        the pool once done with it
+
+        Raises: `UcError` in case of failure
+        """
+
+        if self._free:
+            context = self._free.pop()
+            self._free_ids.discard(id(context))
+            self._hits += 1
+
+        else:
+            context = self.__alloc()
+            self._misses += 1
+
+        self._uc.context_update(context)
 
         return context
 
-    def context_update(self, context: UcContext) -> None:
-        status = uclib.uc_context_save(self._uch, context.context)
+    def release(self, context: UcContext) -> None:
+        """Return a context to the pool for reuse. The context must not be used
+        by the caller afterwards.
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        Args:
+            context: a context previously obtained from `save`
 
-    def context_restore(self, context: UcContext) -> None:
-        status = uclib.uc_context_restore(self._uch, context.context)
+        Raises: `UcError` in case context does not fit this pool engine
+        """
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        engine = self._uc
 
-    @staticmethod
-    def __ctl_encode(ctl: int, op: int, nargs: int) -> int:
-        assert nargs and (nargs & ~0b1111) == 0, f'nargs must not exceed value of 15 (got {nargs})'
-        assert op and (op & ~0b11) == 0, f'op must not exceed value of 3 (got {op})'
+        if (context.arch, context.mode) != (engine._arch, engine._mode):
+            raise UcError(uc.UC_ERR_ARG)
 
-        return (op << 30) | (nargs << 26) | ctl
+        # ignore contexts that are released twice
+        if id(context) in self._free_ids:
+            return
 
-    def ctl(self, ctl: int, op: int, *args):
-        code = Uc.__ctl_encode(ctl, op, len(args))
+        if self._capacity is None or len(self._free) < self._capacity:
+            self._free.append(context)
+            self._free_ids.add(id(context))
 
-        status = uclib.uc_ctl(self._uch, code, *args)
+    @contextlib.contextmanager
+    def saved(self) -> Iterator[UcContext]:
+        """Save the engine state to a pooled context for the duration of a
+        `with` block, and release it back to the pool when the block exits.
+        """
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        context = self.save()
 
-    Arg = Tuple[Type, Optional[int]]
+        try:
+            yield context
+        finally:
+            self.release(context)
 
-    def __ctl_r(self, ctl: int, arg0: Arg):
-        atype, _ = arg0
-        carg = atype()
+    def clear(self) -> None:
+        """Drop all idle contexts, and reset the pool counters.
+        """
 
-        self.ctl(ctl, uc.UC_CTL_IO_READ, ctypes.byref(carg))
+        self._free.clear()
+        self._free_ids.clear()
 
-        return carg.value
+        self._hits = 0
+        self._misses = 0
 
-    def __ctl_w(self, ctl: int, *args: Arg):
-        cargs = (atype(avalue) for atype, avalue in args)
 
-        self.ctl(ctl, uc.UC_CTL_IO_WRITE, *cargs)
+class UcSavepoints:
+    """A stack of nested savepoints, each pairing a processor context with a
+    memory snapshot level.
 
-    def __ctl_wr(self, ctl: int, arg0: Arg, arg1: Arg):
-        atype, avalue = arg0
-        carg0 = atype(avalue)
+    Memory is copied on write and only for pages written since the savepoint was
+    taken, so exploring and backtracking (e.g. a savepoint per branch in a search)
+    do not copy memory as a whole.
 
-        atype, _ = arg1
-        carg1 = atype()
+    Savepoints are managed through `Uc.savepoints`; not to be instantiated directly.
 
-        self.ctl(ctl, uc.UC_CTL_IO_READ_WRITE, carg0, ctypes.byref(carg1))
+    Example:
+        >>> sp = uc.savepoints()
+        >>> sp.push()
+        >>> uc.emu_start(begin, until)
+        >>> sp.rollback()
+    """
 
-        return carg1
+    def __init__(self, uc: Uc) -> None:
+        uc.ctl_context_mode(cpu=True, memory=True)
 
-    def ctl_get_mode(self) -> int:
-        return self.__ctl_r(uc.UC_CTL_UC_MODE,
-            (ctypes.c_int, None)
-        )
+        self._uc = uc
+        self._pool = uc.context_pool()
+        self._stack: MutableSequence[UcContext] = []
 
-    def ctl_get_page_size(self) -> int:
-        return self.__ctl_r(uc.UC_CTL_UC_PAGE_SIZE,
-            (ctypes.c_uint32, None)
-        )
+    def __len__(self) -> int:
+        """Number of active savepoints.
+        """
 
-    def ctl_set_page_size(self, val: int) -> None:
-        self.__ctl_w(uc.UC_CTL_UC_PAGE_SIZE,
-            (ctypes.c_uint32, val)
-        )
+        return len(self._stack)
 
-    def ctl_get_arch(self) -> int:
-        return self.__ctl_r(uc.UC_CTL_UC_ARCH,
-            (ctypes.c_int, None)
-        )
+    def __check_level(self, level: int) -> None:
+        if not (0 <= level < len(self._stack)):
+            raise UcError(uc.UC_ERR_ARG, level)
 
-    def ctl_get_timeout(self) -> int:
-        return self.__ctl_r(uc.UC_CTL_UC_TIMEOUT,
-            (ctypes.c_uint64, None)
-        )
+    def __discard_above(self, level: int) -> None:
+        while len(self._stack) > level + 1:
+            self._pool.release(self._stack.pop())
 
-    def ctl_exits_enabled(self, val: bool) -> None:
-        self.__ctl_w(uc.UC_CTL_UC_USE_EXITS,
-            (ctypes.c_int, val)
-        )
+    def push(self) -> int:
+        """Take a new savepoint of the current emulation state.
 
-    def ctl_get_exits_cnt(self) -> int:
-        return self.__ctl_r(uc.UC_CTL_UC_EXITS_CNT,
-            (ctypes.c_size_t, None)
-        )
+        Returns: level of the new savepoint
+        """
 
-    def ctl_get_exits(self) -> Sequence[int]:
-        count = self.ctl_get_exits_cnt()
-        arr = (ctypes.c_uint64 * count)()
+        self._stack.append(self._pool.save())
 
-        self.ctl(uc.UC_CTL_UC_EXITS, uc.UC_CTL_IO_READ, ctypes.cast(arr, ctypes.c_void_p), ctypes.c_size_t(count))
+        return len(self._stack) - 1
 
-        return tuple(i for i in arr)
+    def rollback(self) -> None:
+        """Roll the emulation state back to the latest savepoint. The savepoint
+        remains active, and may be rolled back to again.
 
-    def ctl_set_exits(self, exits: Sequence[int]) -> None:
-        arr = (ctypes.c_uint64 * len(exits))()
+        Raises: `UcError` in case there are no active savepoints
+        """
 
-        for idx, exit in enumerate(exits):
-            arr[idx] = exit
+        self.rollback_to(len(self._stack) - 1)
 
-        self.ctl(uc.UC_CTL_UC_EXITS, uc.UC_CTL_IO_WRITE, ctypes.cast(arr, ctypes.c_void_p), ctypes.c_size_t(len(exits)))
+    def rollback_to(self, level: int) -> None:
+        """Roll the emulation state back to a specific savepoint, discarding all
+        savepoints taken after it. The savepoint itself remains active.
 
-    def ctl_get_cpu_model(self) -> int:
-        return self.__ctl_r(uc.UC_CTL_CPU_MODEL,
-            (ctypes.c_int, None)
-        )
+        Args:
+            level: level of the savepoint to roll back to
 
-    def ctl_set_cpu_model(self, val: int) -> None:
-        self.__ctl_w(uc.UC_CTL_CPU_MODEL,
-            (ctypes.c_int, val)
-        )
+        Raises: `UcError` in case level does not refer to an active savepoint
+        """
 
-    def ctl_remove_cache(self, addr: int, end: int) -> None:
-        self.__ctl_w(uc.UC_CTL_TB_REMOVE_CACHE,
-            (ctypes.c_uint64, addr),
-            (ctypes.c_uint64, end)
-        )
+        self.__check_level(level)
+        self.__discard_above(level)
 
-    def ctl_request_cache(self, addr: int):
-        return self.__ctl_wr(uc.UC_CTL_TB_REQUEST_CACHE,
-            (ctypes.c_uint64, addr),
-            (uc_tb, None)
-        )
+        self._uc.context_restore(self._stack[level])
 
-    def ctl_flush_tb(self) -> None:
-        self.__ctl_w(uc.UC_CTL_TB_FLUSH)
+    def release(self) -> None:
+        """Drop the latest savepoint while keeping the current emulation state.
+        Changes made since then are then owned by the previous savepoint.
 
-    def ctl_tlb_mode(self, mode: int) -> None:
-        self.__ctl_w(uc.UC_CTL_TLB_TYPE,
-            (ctypes.c_uint, mode)
-        )
+        Raises: `UcError` in case there are no active savepoints
+        """
 
+        level = len(self._stack) - 1
 
-class UcContext(RegStateManager):
-    def __init__(self, h, arch: int, mode: int):
-        self._context = uc_context()
-        self._size = uclib.uc_context_size(h)
+        self.__check_level(level)
+        self._pool.release(self._stack.pop())
 
-        status = uclib.uc_context_alloc(h, ctypes.byref(self._context))
+    def dirty_pages(self) -> Tuple[int, ...]:
+        """Count the memory pages written to on each savepoint level, i.e. since
+        a savepoint was taken and up to the next one.
 
-        if status != uc.UC_ERR_OK:
-            raise UcError(status)
+        Returns: a tuple of pages count, by savepoint level
+        """
+
+        # counts are cumulative: each includes pages written on the levels above it
+        totals = [self._uc.ctl_context_dirty_pages(ctx) for ctx in self._stack] + [0]
+
+        return tuple(total - above for total, above in zip(totals, totals[1:]))
 
-        self._to_free = True
-        self._arch = arch
-        self._mode = mode
+
+class UcLazyRegion:
+    """A demand-paged memory range, whose pages are mapped and filled by a
+    provider on first access.
+
+    Instances are created by `Uc.mem_map_lazy`; not to be instantiated directly.
+    """
+
+    def __init__(self, address: int, size: int, perms: int, page_size: int, provider: UC_PAGE_PROVIDER_TYPE) -> None:
+        self._address = address
+        self._size = size
+        self._perms = perms
+        self._page_size = page_size
+        self._provider = provider
+
+        self._pages: MutableSet[int] = set()
 
     @property
-    def context(self):
-        return self._context
+    def address(self) -> int:
+        return self._address
 
     @property
     def size(self) -> int:
         return self._size
 
     @property
-    def arch(self) -> int:
-        return self._arch
+    def perms(self) -> int:
+        return self._perms
 
     @property
-    def mode(self) -> int:
-        return self._mode
+    def page_size(self) -> int:
+        return self._page_size
 
-    # RegStateManager mixin method implementation
-    def _do_reg_read(self, reg_id: int, reg_obj) -> int:
-        """Private register read implementation.
+    @property
+    def pages(self) -> Iterator[int]:
+        """Iterate through the addresses of pages filled so far.
         """
 
-        return uclib.uc_context_reg_read(self._context, reg_id, reg_obj)
+        return iter(sorted(self._pages))
 
-    # RegStateManager mixin method implementation
-    def _do_reg_write(self, reg_id: int, reg_obj) -> int:
-        """Private register write implementation.
+    @property
+    def fills(self) -> int:
+        """Amount of pages filled so far.
         """
 
-        return uclib.uc_context_reg_write(self._context, reg_id, reg_obj)
+        return len(self._pages)
 
-    def _do_reg_read_batch(self, reglist, vallist, count) -> int:
-        """Private batch register read implementation.
+    def _fault(self, uc: Uc, address: int, size: int) -> bool:
+        """Map and fill the pages covered by a faulting access.
         """
 
-        return uclib.uc_context_reg_read_batch(self._context, reglist, vallist, count)
+        mask = ~(self._page_size - 1)
 
-    # Make UcContext picklable
-    def __getstate__(self):
-        return bytes(self), self.size, self.arch, self.mode
+        # an access may cross a page boundary; map all pages it covers within this region
+        first = max(address & mask, self._address)
+        last = min((address + max(size, 1) - 1) & mask, self._address + self._size - self._page_size)
 
-    def __setstate__(self, state) -> None:
-        context, size, arch, mode = state
+        filled = False
 
-        self._context = ctypes.cast(ctypes.create_string_buffer(context, size), uc_context)
-        self._size = size
-        self._arch = arch
-        self._mode = mode
+        for page in range(first, last + 1, self._page_size):
+            # do not rely on filled pages alone: restoring a memory snapshot may have unmapped some
+            if uc.region_at(page) is None:
+                uc.mem_map(page, self._page_size, self._perms)
+                self._pages.add(page)
 
-        # __init__ won't be invoked, so we are safe to set it here.
-        self._to_free = False
+                data = self._provider(page, self._page_size)
 
-    def __bytes__(self) -> bytes:
-        return ctypes.string_at(self.context, self.size)
+                if data:
+                    uc.mem_write(page, data)
 
-    def __del__(self) -> None:
-        # We need this property since we shouldn't free it if the object is constructed from pickled bytes.
-        if self._to_free:
-            uclib.uc_context_free(self._context)
+                filled = True
+
+        # let the access fail if it could not be resolved here, rather than retrying it forever
+        return filled
+
+    def _resync(self, index: _MemIndex) -> None:
+        """Rebuild the filled pages set from the memory index.
+        """
+
+        first = self._address
+        last = self._address + self._size - 1
+
+        self._pages.clear()
+
+        for begin, end, _ in index:
+            if begin <= last and end >= first:
+                self._pages.update(range(max(begin, first), min(end, last) + 1, self._page_size))
+
+    def _reclaim(self) -> Iterator[int]:
+        """Forget about all filled pages.
+        """
+
+        pages = sorted(self._pages)
+        self._pages.clear()
+
+        return iter(pages)
 
 
+UC_PAGE_PROVIDER_TYPE = Callable[[int, int], Any]
 UC_MMIO_READ_TYPE = Callable[[Uc, int, int, Any], int]
 UC_MMIO_WRITE_TYPE = Callable[[Uc, int, int, int, Any], None]
+UC_TRACE_CONSUMER_TYPE = Callable[[Uc, Any, Any], None]
 
 
-__all__ = ['Uc', 'UcContext', 'ucsubclass', 'UcError', 'uc_version', 'version_bind', 'uc_arch_supported', 'debug']
+__all__ = ['Uc', 'UcAddressHook', 'UcContext', 'UcContextPool', 'UcCoverageMap', 'UcHookMux', 'UcHookSubscription', 'UcLazyRegion', 'UcMemoryImage', 'UcRegDump', 'UcRegReader', 'UcRegWriter', 'UcRegisterFile', 'UcSavepoints', 'ucsubclass', 'UcError', 'uc_version', 'version_bind', 'uc_arch_supported', 'debug']
 
 
@@ -277,6 +277,8 @@ pub enum ControlType {
     UC_CTL_TLB_TYPE = 12,
     UC_CTL_TCG_BUFFER_SIZE = 13,
     UC_CTL_CONTEXT_MODE = 14,
+    UC_CTL_CONTEXT_DIRTY_PAGES = 15,
+    UC_CTL_COVERAGE_MAP = 16,
     UC_CTL_IO_READ = 1 << 31,
     UC_CTL_IO_WRITE = 1 << 30,
 }
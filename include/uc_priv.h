@@ -161,6 +161,7 @@ struct hook {
     void *callback;      // a uc_cb_* type
     void *user_data;
     GHashTable *hooked_regions; // The regions this hook instrumented on
+    GHashTable *addresses; // if not NULL, only trigger if PC is in this set
 };
 
 // Add an inline hook to helper_table
@@ -238,7 +239,23 @@ typedef enum uc_hook_idx {
 #define HOOK_BOUND_CHECK(hh, addr)                                             \
     ((((addr) >= (hh)->begin && (addr) <= (hh)->end) ||                        \
       (hh)->begin > (hh)->end) &&                                              \
-     !((hh)->to_delete))
+     !((hh)->to_delete) && _hook_address_check(hh, addr))
+
+static inline guint hook_addresses_hash(const void *p)
+{
+    return qemu_xxhash2(*(const uint64_t *)p);
+}
+
+static inline gboolean hook_addresses_equal(const void *lhs, const void *rhs)
+{
+    return *(const uint64_t *)lhs == *(const uint64_t *)rhs;
+}
+
+static inline bool _hook_address_check(struct hook *hh, uint64_t addr)
+{
+    return hh->addresses == NULL ||
+           g_hash_table_lookup(hh->addresses, (void *)&addr) != NULL;
+}
 
 #define HOOK_EXISTS(uc, idx) ((uc)->hook[idx##_IDX].head != NULL)
 #define HOOK_EXISTS_BOUNDED(uc, idx, addr)                                     \
@@ -354,6 +371,14 @@ struct uc_struct {
     // hook to count number of instructions for uc_emu_start()
     uc_hook count_hook;
 
+    struct uc_trace *trace; // active trace, see uc_trace_start()
+
+    // edge coverage, see UC_CTL_COVERAGE_MAP
+    uint8_t *coverage_map;
+    size_t coverage_mask;
+    uint64_t coverage_prev;
+    uc_hook coverage_hook;
+
     size_t emu_counter; // current counter of uc_emu_start()
     size_t emu_count;   // save counter of uc_emu_start()
 
@@ -421,6 +446,18 @@ struct uc_struct {
     bool current_executable;
 };
 
+// native trace buffer, see uc_trace_start()
+typedef struct uc_trace {
+    uc_trace_record *records;
+    size_t capacity;
+    size_t count;
+    uc_cb_trace_t callback;
+    void *user_data;
+    uc_hook hooks[3]; // code, block and memory hooks recording events
+    bool flushing;    // the callback is running
+    bool stopped;     // uc_trace_stop() was called by the callback
+} uc_trace;
+
 // Metadata stub for the variable-size cpu context used with uc_context_*()
 struct uc_context {
     size_t context_size; // size of the real internal context structure
@@ -584,6 +584,17 @@ typedef enum uc_control_type {
     // controle if context_save/restore should work with snapshots
     // Write: @args = (int)
     UC_CTL_CONTEXT_MODE,
+    // Count the pages copied on write since a context was saved, when
+    // context_save/restore work with snapshots.
+    // Read: @args = (uc_context*, size_t*)
+    UC_CTL_CONTEXT_DIRTY_PAGES,
+    // Collect AFL-style edge coverage into a caller-owned map: on each block
+    // transition, the map byte indexed by the hashes of the previous and the
+    // current block addresses is incremented. The map size must be a power of
+    // 2, and the map must outlive its use. A NULL map stops the collection.
+    // The previous block is forgotten when emulation starts.
+    // Write: @args = (uint8_t *map, size_t size)
+    UC_CTL_COVERAGE_MAP,
 } uc_control_type;
 
 /*
@@ -667,6 +678,11 @@ See sample_ctl.c for a detailed example.
     uc_ctl(uc, UC_CTL_WRITE(UC_CTL_TCG_BUFFER_SIZE, 1), (size))
 #define uc_ctl_context_mode(uc, mode)                                          \
     uc_ctl(uc, UC_CTL_WRITE(UC_CTL_CONTEXT_MODE, 1), (mode))
+#define uc_ctl_context_dirty_pages(uc, context, count)                         \
+    uc_ctl(uc, UC_CTL_READ_WRITE(UC_CTL_CONTEXT_DIRTY_PAGES, 2), (context),    \
+           (count))
+#define uc_ctl_coverage_map(uc, map, size)                                     \
+    uc_ctl(uc, UC_CTL_WRITE(UC_CTL_COVERAGE_MAP, 2), (map), (size))
 
 // Opaque storage for CPU context, used with uc_context_*()
 struct uc_context;
@@ -927,6 +943,73 @@ uc_err uc_mem_write(uc_engine *uc, uint64_t address, const void *bytes,
 UNICORN_EXPORT
 uc_err uc_mem_read(uc_engine *uc, uint64_t address, void *bytes, size_t size);
 
+/*
+ Read a NUL-terminated string from memory.
+
+ The string is scanned in page-sized chunks, and the read stops at the
+ terminator, after @max_chars chars, or at the first page that cannot be read,
+ whichever comes first.
+
+ @uc: handle returned by uc_open()
+ @address: starting memory address of the string
+ @bytes: pointer to a buffer receiving the string, terminator included
+ @max_chars: maximal number of chars to read, terminator included
+ @width: char width in bytes; 1, 2 or 4
+ @chars: receives the number of chars read, terminator excluded. The string
+   was terminated if this is less than @max_chars and no error was returned.
+
+ NOTE: @bytes must be big enough to contain @max_chars * @width bytes.
+
+ @return UC_ERR_OK if the terminator was found or @max_chars chars were read,
+   or the error of the chunk read that failed (refer to uc_err enum for
+   detailed error); @chars is set either way.
+*/
+UNICORN_EXPORT
+uc_err uc_mem_read_string(uc_engine *uc, uint64_t address, void *bytes,
+                          size_t max_chars, size_t width, size_t *chars);
+
+/*
+ Read multiple ranges of bytes in memory.
+
+ Unlike uc_mem_read(), a failing range does not prevent the following ones
+ from being read.
+
+ @uc: handle returned by uc_open()
+ @addresses: array of starting memory addresses of ranges to get
+ @vals:  array of pointers to buffers receiving data copied from memory
+ @sizes: array of sizes of each range
+ @errs:  array receiving the status of each read; may be NULL
+ @count: length of *addresses, *vals, *sizes and *errs
+
+ @return UC_ERR_OK if all ranges were read successfully, or the error of the
+   first range that failed (refer to uc_err enum for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_mem_read_batch(uc_engine *uc, const uint64_t *addresses,
+                         void *const *vals, const size_t *sizes, uc_err *errs,
+                         int count);
+
+/*
+ Write to multiple ranges of bytes in memory.
+
+ Unlike uc_mem_write(), a failing range does not prevent the following ones
+ from being written.
+
+ @uc: handle returned by uc_open()
+ @addresses: array of starting memory addresses of ranges to set
+ @vals:  array of pointers to data to be written to memory
+ @sizes: array of sizes of each range
+ @errs:  array receiving the status of each write; may be NULL
+ @count: length of *addresses, *vals, *sizes and *errs
+
+ @return UC_ERR_OK if all ranges were written successfully, or the error of
+   the first range that failed (refer to uc_err enum for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_mem_write_batch(uc_engine *uc, const uint64_t *addresses,
+                          const void *const *vals, const size_t *sizes,
+                          uc_err *errs, int count);
+
 /*
  Emulate machine code in a specific duration of time.
 
@@ -1005,6 +1088,145 @@ uc_err uc_hook_add(uc_engine *uc, uc_hook *hh, int type, void *callback,
 UNICORN_EXPORT
 uc_err uc_hook_del(uc_engine *uc, uc_hook hh);
 
+/*
+ Register a UC_HOOK_CODE callback which is only run for instructions whose
+ address is in a set. The set is kept natively, so instructions outside of it
+ are not instrumented at all.
+
+ @uc: handle returned by uc_open()
+ @hh: hook handle returned from this registration. To be used in uc_hook_del()
+   and uc_hook_addresses_insert()/uc_hook_addresses_remove() API
+ @callback: a uc_cb_hookcode_t callback
+ @user_data: user-defined data. This will be passed to callback function in its
+   last argument @user_data
+ @addresses: initial addresses of the set, may be NULL if @count is 0
+ @count: number of entries in @addresses
+
+ @return UC_ERR_OK on success, or other value on failure (refer to uc_err enum
+   for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_hook_add_addresses(uc_engine *uc, uc_hook *hh, void *callback,
+                             void *user_data, const uint64_t *addresses,
+                             size_t count);
+
+/*
+ Add addresses to the set of a hook registered by uc_hook_add_addresses().
+ This may be called at any time, including from within callbacks, in which
+ case the update takes effect once the translation block being executed is
+ left.
+
+ @uc: handle returned by uc_open()
+ @hh: handle returned by uc_hook_add_addresses()
+ @addresses: addresses to add, already present ones are ignored
+ @count: number of entries in @addresses
+
+ @return UC_ERR_OK on success, or other value on failure (refer to uc_err enum
+   for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_hook_addresses_insert(uc_engine *uc, uc_hook hh,
+                                const uint64_t *addresses, size_t count);
+
+/*
+ Remove addresses from the set of a hook registered by uc_hook_add_addresses().
+ This may be called at any time, including from within callbacks, in which
+ case the update takes effect once the translation block being executed is
+ left.
+
+ @uc: handle returned by uc_open()
+ @hh: handle returned by uc_hook_add_addresses()
+ @addresses: addresses to remove, missing ones are ignored
+ @count: number of entries in @addresses
+
+ @return UC_ERR_OK on success, or other value on failure (refer to uc_err enum
+   for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_hook_addresses_remove(uc_engine *uc, uc_hook hh,
+                                const uint64_t *addresses, size_t count);
+
+/*
+  Trace record, as collected by uc_trace_start().
+
+  @address: address of the instruction, block or memory access
+  @value: value written to memory for UC_HOOK_MEM_WRITE, value read from memory
+    for UC_HOOK_MEM_READ_AFTER, 0 otherwise
+  @size: size of the instruction, block or memory access
+  @type: event type: UC_HOOK_CODE, UC_HOOK_BLOCK, UC_HOOK_MEM_READ,
+    UC_HOOK_MEM_WRITE or UC_HOOK_MEM_READ_AFTER
+*/
+typedef struct uc_trace_record {
+    uint64_t address;
+    uint64_t value;
+    uint32_t size;
+    uint32_t type;
+} uc_trace_record;
+
+/*
+  Callback function for consuming trace records (see uc_trace_start()).
+
+  @records: records collected since the previous flush, in order of occurrence.
+    The records are only valid for the duration of the call.
+  @count: number of records
+  @user_data: user data passed to uc_trace_start()
+*/
+typedef void (*uc_cb_trace_t)(uc_engine *uc, const uc_trace_record *records,
+                              size_t count, void *user_data);
+
+/*
+ Start collecting emulation events into a native trace buffer.
+ Unlike hooks registered with uc_hook_add(), events are not delivered one at a
+ time: they are recorded into a buffer, which is handed to @callback in a
+ single call once it is full, when uc_trace_flush() or uc_trace_stop() are
+ called, and when the outermost uc_emu_start() returns.
+ Only one trace may be active at a time.
+
+ @uc: handle returned by uc_open()
+ @types: events to record; a combination of UC_HOOK_CODE, UC_HOOK_BLOCK,
+   UC_HOOK_MEM_READ, UC_HOOK_MEM_WRITE and UC_HOOK_MEM_READ_AFTER
+ @capacity: trace buffer size, in records
+ @callback: callback consuming the recorded events
+ @user_data: user-defined data, passed to @callback
+ @begin: start address of the area where events are recorded
+ @end: end address of the area where events are recorded
+   NOTE 1: as with uc_hook_add(), events are recorded only if @begin <=
+   address <= @end
+   NOTE 2: if @begin > @end, events are recorded for the whole address space
+
+ @return UC_ERR_OK on success, or other value on failure (refer to uc_err enum
+   for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_trace_start(uc_engine *uc, int types, size_t capacity,
+                      uc_cb_trace_t callback, void *user_data, uint64_t begin,
+                      uint64_t end);
+
+/*
+ Hand the events recorded so far to the trace callback.
+
+ @uc: handle returned by uc_open()
+
+ @return UC_ERR_OK on success, or other value on failure (refer to uc_err enum
+   for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_trace_flush(uc_engine *uc);
+
+/*
+ Stop collecting emulation events, after handing the events recorded so far to
+ the trace callback.
+ This may be called by the trace callback itself; the trace buffer is then
+ released once the callback returns.
+
+ @uc: handle returned by uc_open()
+
+ @return UC_ERR_OK on success, or other value on failure (refer to uc_err enum
+   for detailed error).
+*/
+UNICORN_EXPORT
+uc_err uc_trace_stop(uc_engine *uc);
+
 typedef enum uc_prot {
     UC_PROT_NONE = 0,
     UC_PROT_READ = 1,
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""Measure the per-event cost of Python hooks, as dispatched by hook_add and hook_add_raw,
+and the cost of several code hooks compared to as many subscribers of a hook multiplexer.
+
+Usage: benchmark.py [iterations]
+"""
+
+import sys
+import time
+
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+DATA = 0x20000
+
+# x86-64: loop: mov rax, [rbx]; mov [rbx], rax; dec ecx; jnz loop
+CODE = b'\x48\x8b\x03\x48\x89\x03\xff\xc9\x75\xf6'
+
+# hook type, events per loop iteration, hook_add callback, hook_add_raw callback
+HOOKS = (
+    ('code',      UC_HOOK_CODE,      4, lambda uc, address, size, data: None,                lambda address, size: None),
+    ('block',     UC_HOOK_BLOCK,     1, lambda uc, address, size, data: None,                lambda address, size: None),
+    ('mem read',  UC_HOOK_MEM_READ,  1, lambda uc, access, address, size, value, data: None, lambda access, address, size, value: None),
+    ('mem write', UC_HOOK_MEM_WRITE, 1, lambda uc, access, address, size, value, data: None, lambda access, address, size, value: None)
+)
+
+REPEATS = 5
+
+# numbers of code hook callbacks to compare
+FANOUTS = (1, 4, 16)
+
+
+def measure(iterations, add=None):
+    uc = Uc(UC_ARCH_X86, UC_MODE_64)
+    uc.mem_map(ADDRESS, 0x1000)
+    uc.mem_map(DATA, 0x1000)
+    uc.mem_write(ADDRESS, CODE)
+
+    if add is not None:
+        add(uc)
+
+    best = None
+
+    for _ in range(REPEATS):
+        uc.reg_write(UC_X86_REG_RBX, DATA)
+        uc.reg_write(UC_X86_REG_RCX, iterations)
+
+        start = time.perf_counter()
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        elapsed = time.perf_counter() - start
+
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def add_hooks(uc, count):
+    for _ in range(count):
+        uc.hook_add(UC_HOOK_CODE, HOOKS[0][3])
+
+
+def add_subscribers(uc, count):
+    mux = uc.hook_mux(UC_HOOK_CODE)
+
+    for _ in range(count):
+        mux.subscribe(HOOKS[0][3])
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    # emulation cost alone, to be deducted from the hooked runs
+    baseline = measure(iterations)
+
+    print(f'{"hook":<12}{"hook_add":>16}{"hook_add_raw":>16}{"speedup":>10}')
+
+    for name, htype, per_iteration, callback, raw_callback in HOOKS:
+        events = iterations * per_iteration
+
+        wrapped = (measure(iterations, lambda uc: uc.hook_add(htype, callback)) - baseline) / events
+        raw = (measure(iterations, lambda uc: uc.hook_add_raw(htype, raw_callback)) - baseline) / events
+
+        print(f'{name:<12}{wrapped * 1e9:>13.0f} ns{raw * 1e9:>13.0f} ns{wrapped / raw:>9.2f}x')
+
+    print()
+    print(f'{"callbacks":<12}{"hook_add":>16}{"hook_mux":>16}{"speedup":>10}')
+
+    for count in FANOUTS:
+        events = iterations * HOOKS[0][2]
+
+        hooks = (measure(iterations, lambda uc: add_hooks(uc, count)) - baseline) / events
+        mux = (measure(iterations, lambda uc: add_subscribers(uc, count)) - baseline) / events
+
+        print(f'{count:<12}{hooks * 1e9:>13.0f} ns{mux * 1e9:>13.0f} ns{hooks / mux:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
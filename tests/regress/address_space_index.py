@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+import random
+
+import regress
+from unicorn import *
+
+PAGE = 0x1000
+
+
+class AddressSpaceIndex(regress.RegressTest):
+
+    def assertConsistent(self, uc):
+        self.assertEqual(sorted(uc.mem_regions()), [uc.region_at(begin) for begin, _, _ in sorted(uc.mem_regions())])
+
+    def test_queries(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        uc.mem_map(0x10000, 0x4000, UC_PROT_READ)
+        uc.mem_map(0x14000, 0x1000)
+        uc.mmio_map(0x20000, 0x1000, lambda *args: 0, None, None, None)
+
+        self.assertTrue(uc.is_mapped(0x10000))
+        self.assertTrue(uc.is_mapped(0x13ff0, 0x20))
+        self.assertFalse(uc.is_mapped(0x14ff0, 0x20))
+        self.assertFalse(uc.is_mapped(0xffff))
+
+        self.assertEqual((0x10000, 0x13fff, UC_PROT_READ), uc.region_at(0x12345))
+        self.assertEqual((0x20000, 0x20fff, UC_PROT_READ), uc.region_at(0x20000))
+        self.assertIsNone(uc.region_at(0x15000))
+
+        self.assertEqual(0, uc.find_free(0x1000))
+        self.assertEqual(0x15000, uc.find_free(0x1000, start=0x10000))
+        self.assertEqual(0x21000, uc.find_free(0xc000, start=0x10000))
+        self.assertEqual(0x30000, uc.find_free(0x1000, align=0x10000, start=0x10001))
+
+    def test_protect_and_unmap(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        uc.mem_map(0x10000, 0x8000)
+        uc.mem_protect(0x12000, 0x2000, UC_PROT_READ)
+        uc.mem_unmap(0x16000, 0x1000)
+
+        self.assertEqual((0x12000, 0x13fff, UC_PROT_READ), uc.region_at(0x13000))
+        self.assertEqual((0x14000, 0x15fff, UC_PROT_ALL), uc.region_at(0x14000))
+        self.assertFalse(uc.is_mapped(0x15000, 0x2000))
+        self.assertEqual(0x16000, uc.find_free(0x1000, start=0x10000))
+        self.assertConsistent(uc)
+
+    def test_random_layout(self):
+        rnd = random.Random(1337)
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        for _ in range(200):
+            address = rnd.randrange(0, 64) * PAGE
+            size = rnd.randrange(1, 8) * PAGE
+            op = rnd.choice((uc.mem_map, uc.mem_unmap, uc.mem_protect))
+
+            try:
+                if op == uc.mem_protect:
+                    op(address, size, rnd.choice((UC_PROT_READ, UC_PROT_ALL)))
+                else:
+                    op(address, size)
+            except UcError:
+                pass
+
+            self.assertConsistent(uc)
+
+            for page in range(0, 72 * PAGE, PAGE):
+                self.assertEqual(any(b <= page <= e for b, e, _ in uc.mem_regions()), uc.is_mapped(page))
+
+    def test_context_restore(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(0x10000, 0x1000)
+        ctx = uc.context_save()
+        uc.context_restore(ctx)
+
+        self.assertConsistent(uc)
+
+        # restoring the processor state alone leaves the index in place
+        index = uc._mem_index
+        self.assertIsNotNone(index)
+
+        uc.context_restore(ctx)
+        self.assertIs(index, uc._mem_index)
+
+    def test_snapshot_restore(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.ctl_context_mode(cpu=True, memory=True)
+        uc.mem_map(0x10000, 0x1000)
+        ctx = uc.context_save()
+
+        uc.mem_map(0x20000, 0x1000)
+        uc.mem_unmap(0x10000, 0x1000)
+        self.assertConsistent(uc)
+
+        uc.context_restore(ctx)
+
+        self.assertTrue(uc.is_mapped(0x10000))
+        self.assertFalse(uc.is_mapped(0x20000))
+        self.assertConsistent(uc)
+
+
+if __name__ == '__main__':
+    regress.main()
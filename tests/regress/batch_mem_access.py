@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+
+ADDRESS = 0x10000
+
+
+class MemBatch(regress.RegressTest):
+
+    def test_write_batch(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+
+        status = uc.mem_write_batch((
+            (ADDRESS, b'AAAA'),
+            (ADDRESS + 0x100, bytearray(b'BBBBBBBB')),
+            (ADDRESS + 0x2000, b'CCCC'),
+            (ADDRESS + 0x200, memoryview(b'xDDDDx')[1:-1])
+        ))
+
+        self.assertEqual((UC_ERR_OK, UC_ERR_OK, UC_ERR_WRITE_UNMAPPED, UC_ERR_OK), status)
+        self.assertEqual(b'AAAA', uc.mem_read(ADDRESS, 4))
+        self.assertEqual(b'BBBBBBBB', uc.mem_read(ADDRESS + 0x100, 8))
+        self.assertEqual(b'DDDD', uc.mem_read(ADDRESS + 0x200, 4))
+
+    def test_read_batch(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+
+        uc.mem_write(ADDRESS, b'0123456789')
+
+        data, offsets, status = uc.mem_read_batch((
+            (ADDRESS + 2, 3),
+            (ADDRESS + 0xffe, 4),
+            (ADDRESS + 6, 4)
+        ))
+
+        self.assertEqual((0, 3, 7), offsets)
+        self.assertEqual((UC_ERR_OK, UC_ERR_READ_UNMAPPED, UC_ERR_OK), status)
+        self.assertEqual(b'234', data[0:3])
+        self.assertEqual(b'6789', data[7:11])
+
+    def test_empty_batch(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        self.assertEqual((bytearray(), (), ()), uc.mem_read_batch([]))
+        self.assertEqual((), uc.mem_write_batch([]))
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+import os
+import tempfile
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+DATA = 0x100000
+MMIO = 0x800000
+
+# x86-64: mov qword ptr [rip + 0x100], rax; inc rax
+CODE = b'\x48\x89\x05\x00\x01\x00\x00\x48\xff\xc0'
+
+
+class Checkpoint(regress.RegressTest):
+
+    def checkpoint_path(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+
+        return os.path.join(tmpdir.name, 'machine.ckpt')
+
+    def assertRestored(self, uc, restored):
+        self.assertEqual(list(uc.mem_regions()), list(restored.mem_regions()))
+        self.assertEqual(uc.reg_dump(fp=True), restored.reg_dump(fp=True))
+
+        for begin, end, _ in uc.mem_regions():
+            self.assertEqual(uc.mem_read(begin, end - begin + 1), restored.mem_read(begin, end - begin + 1))
+
+    def test_roundtrip(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        # a mostly zero region
+        uc.mem_map(DATA, 0x400000, UC_PROT_READ | UC_PROT_WRITE)
+        uc.mem_write(DATA + 0x1000, b'\xaa' * 0x1800)
+        uc.mem_write_u64(DATA + 0x3ff000, 0x1122334455667788)
+
+        uc.reg_write(UC_X86_REG_RAX, 0x41414141)
+        uc.reg_write(UC_X86_REG_RSP, DATA + 0x8000)
+
+        path = self.checkpoint_path()
+
+        uc.checkpoint(path)
+
+        restored = Uc.from_checkpoint(path)
+        self.assertRestored(uc, restored)
+
+        restored.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual(0x41414142, restored.reg_read(UC_X86_REG_RAX))
+        self.assertEqual(0x41414141, restored.mem_read_u64(ADDRESS + 0x107))
+
+    def test_private(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        # a mostly zero region
+        uc.mem_map(DATA, 0x400000, UC_PROT_READ | UC_PROT_WRITE)
+        uc.mem_write(DATA + 0x1000, b'\xaa' * 0x1800)
+        uc.mem_write_u64(DATA + 0x3ff000, 0x1122334455667788)
+
+        path = self.checkpoint_path()
+
+        uc.checkpoint(path)
+
+        restored = Uc.from_checkpoint(path)
+        restored.mem_write(DATA + 0x1000, b'\x55' * 0x10)
+        restored.mem_write(DATA + 0x200000, b'\x55' * 0x10)
+
+        # memory is mapped from the file copy-on-write, so the checkpoint is left intact
+        self.assertRestored(uc, Uc.from_checkpoint(path))
+
+    def test_compressed(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        # a mostly zero region
+        uc.mem_map(DATA, 0x400000, UC_PROT_READ | UC_PROT_WRITE)
+        uc.mem_write(DATA + 0x1000, b'\xaa' * 0x1800)
+        uc.mem_write_u64(DATA + 0x3ff000, 0x1122334455667788)
+
+        path = self.checkpoint_path()
+
+        uc.checkpoint(path)
+        plain = os.path.getsize(path)
+
+        for compression in ('zlib', 'bz2', 'lzma'):
+            try:
+                __import__(compression)
+            except ImportError:
+                continue
+
+            uc.checkpoint(path, compression)
+
+            self.assertLess(os.path.getsize(path), plain)
+            self.assertRestored(uc, Uc.from_checkpoint(path))
+
+    def test_zero_pages(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        # a mostly zero region
+        uc.mem_map(DATA, 0x400000, UC_PROT_READ | UC_PROT_WRITE)
+        uc.mem_write(DATA + 0x1000, b'\xaa' * 0x1800)
+        uc.mem_write_u64(DATA + 0x3ff000, 0x1122334455667788)
+
+        path = self.checkpoint_path()
+        uc.checkpoint(path, 'zlib')
+
+        # only the three pages holding data are saved
+        self.assertLess(os.path.getsize(path), 0x4000)
+
+    def test_mmio(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        path = self.checkpoint_path()
+
+        uc.mmio_map(MMIO, 0x1000, lambda uc, offset, size, data: offset + data, 0x1000, None, None)
+        uc.checkpoint(path)
+
+        restored = Uc.from_checkpoint(path, {MMIO: (lambda uc, offset, size, data: offset + data, 0x2000, None, None)})
+        self.assertEqual(0x2008, restored.mem_read_u32(MMIO + 8))
+
+        # callbacks are not saved, and ranges with none are not accessible
+        self.assertEqual((MMIO, MMIO + 0xfff, UC_PROT_NONE), Uc.from_checkpoint(path).region_at(MMIO))
+
+    def test_savepoints(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(DATA, 0x1000)
+        path = self.checkpoint_path()
+
+        sp = uc.savepoints()
+        sp.push()
+
+        uc.mem_write_u64(DATA, 1)
+        uc.checkpoint(path)
+
+        # taking a checkpoint leaves snapshots untouched
+        self.assertEqual(1, len(sp))
+        self.assertEqual(1, Uc.from_checkpoint(path).mem_read_u64(DATA))
+
+        sp.rollback()
+        self.assertEqual(0, uc.mem_read_u64(DATA))
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        path = self.checkpoint_path()
+
+        with self.assertRaises(UcError):
+            uc.checkpoint(path, 'zip')
+
+        with open(path, 'wb') as f:
+            f.write(b'not a checkpoint')
+
+        with self.assertRaises(UcError):
+            Uc.from_checkpoint(path)
+
+
+if __name__ == '__main__':
+    regress.main()
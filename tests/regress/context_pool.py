@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+
+class ContextPool(regress.RegressTest):
+
+    def test_reuse(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        pool = uc.context_pool()
+
+        uc.reg_write(UC_X86_REG_RAX, 1)
+        first = pool.save()
+        pool.release(first)
+
+        uc.reg_write(UC_X86_REG_RAX, 2)
+        second = pool.save()
+
+        # released context is refilled in place
+        self.assertIs(first, second)
+        self.assertEqual(2, second.reg_read(UC_X86_REG_RAX))
+        self.assertEqual((1, 1), (pool.hits, pool.misses))
+
+        uc.reg_write(UC_X86_REG_RAX, 3)
+        uc.context_restore(second)
+        self.assertEqual(2, uc.reg_read(UC_X86_REG_RAX))
+
+    def test_prealloc(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        pool = uc.context_pool(prealloc=2)
+
+        self.assertEqual(2, len(pool))
+
+        contexts = [pool.save() for _ in range(3)]
+
+        self.assertEqual((2, 1), (pool.hits, pool.misses))
+        self.assertEqual(0, len(pool))
+
+        for ctx in contexts:
+            pool.release(ctx)
+
+        # double release is ignored
+        pool.release(contexts[0])
+
+        self.assertEqual(3, len(pool))
+
+        pool.clear()
+        self.assertEqual((0, 0, 0), (len(pool), pool.hits, pool.misses))
+
+    def test_capacity(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        pool = uc.context_pool(capacity=1)
+
+        first = pool.save()
+        second = pool.save()
+
+        pool.release(first)
+        pool.release(second)
+
+        self.assertEqual(1, len(pool))
+
+    def test_saved(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        pool = uc.context_pool()
+
+        for i in range(10):
+            with pool.saved() as ctx:
+                uc.reg_write(UC_X86_REG_RBX, i)
+                uc.context_restore(ctx)
+
+        self.assertEqual((9, 1), (pool.hits, pool.misses))
+        self.assertEqual(1, len(pool))
+
+    def test_foreign(self):
+        pool = Uc(UC_ARCH_X86, UC_MODE_64).context_pool()
+        other = Uc(UC_ARCH_X86, UC_MODE_32)
+
+        with self.assertRaises(UcError):
+            pool.release(other.context_save())
+
+
+if __name__ == '__main__':
+    regress.main()
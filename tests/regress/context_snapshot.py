@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+
+# x86-64: mov qword ptr [rip + 0x100], rax; inc rax
+CODE = b'\x48\x89\x05\x00\x01\x00\x00\x48\xff\xc0'
+
+
+class ContextSnapshot(regress.RegressTest):
+
+    def test_checkpoint(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.ctl_context_mode(cpu=True, memory=True)
+
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, CODE)
+
+        uc.reg_write(UC_X86_REG_RAX, 0x41414141)
+
+        ctx = uc.context_save()
+
+        for i in range(3):
+            uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+            self.assertEqual(0x41414142, uc.reg_read(UC_X86_REG_RAX))
+            self.assertEqual(0x41414141, uc.mem_read_u64(ADDRESS + 0x107))
+
+            # memory and registers are both rolled back, and the checkpoint may be reused
+            uc.context_restore(ctx)
+
+            self.assertEqual(0x41414141, uc.reg_read(UC_X86_REG_RAX))
+            self.assertEqual(0, uc.mem_read_u64(ADDRESS + 0x107))
+
+    def test_mappings(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.ctl_context_mode(cpu=True, memory=True)
+
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, CODE)
+
+        ctx = uc.context_save()
+
+        uc.mem_write(ADDRESS + 0x1000, b'dirty')
+        uc.mem_map(0x40000, 0x1000)
+
+        self.assertEqual([(ADDRESS, ADDRESS + 0x1fff, UC_PROT_ALL), (0x40000, 0x40fff, UC_PROT_ALL)], list(uc.mem_regions()))
+
+        uc.context_restore(ctx)
+
+        self.assertEqual([(ADDRESS, ADDRESS + 0x1fff, UC_PROT_ALL)], list(uc.mem_regions()))
+        self.assertFalse(uc.is_mapped(0x40000))
+
+    def test_protect(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.ctl_context_mode(cpu=True, memory=True)
+
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, CODE)
+
+        uc.context_save()
+
+        # snapshots and memory protection cannot be mixed
+        with self.assertRaises(UcError):
+            uc.mem_protect(ADDRESS, 0x1000, UC_PROT_READ)
+
+    def test_cpu_only(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.ctl_context_mode(cpu=True, memory=True)
+
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, CODE)
+
+        uc.ctl_context_mode(cpu=True, memory=False)
+        uc.reg_write(UC_X86_REG_RAX, 5)
+
+        ctx = uc.context_save()
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        uc.context_restore(ctx)
+
+        # only registers are rolled back
+        self.assertEqual(5, uc.reg_read(UC_X86_REG_RAX))
+        self.assertEqual(5, uc.mem_read_u64(ADDRESS + 0x107))
+
+    def test_ctl(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.ctl_set_tcg_buffer_size(8 * 1024 * 1024)
+        uc.mem_map(ADDRESS, 0x1000)
+
+        self.assertEqual(8 * 1024 * 1024, uc.ctl_get_tcg_buffer_size())
+
+        uc.ctl_flush_tlb()
+        uc.ctl_flush_tb()
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+from multiprocessing import shared_memory
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+
+# x86-32: cmp eax, 1; je 1f; inc ebx; 1: inc ecx
+CODE = b'\x83\xf8\x01\x74\x01\x43\x41'
+
+
+def edge_hash(address):
+    return ((address >> 4) ^ (address << 8)) & 0xffff
+
+
+class CoverageMap(regress.RegressTest):
+
+    def test_edges(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        cov = uc.coverage_map()
+
+        self.assertEqual(0x10000, len(cov))
+
+        uc.reg_write(UC_X86_REG_EAX, 0)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        first = edge_hash(ADDRESS)
+        second = edge_hash(ADDRESS + 5) ^ (first >> 1)
+
+        self.assertEqual((1, 1), (cov.view[first], cov.view[second]))
+        self.assertEqual(2, cov.edges())
+
+        # the branch taken leads to another path
+        taken = cov.hash()
+
+        cov.reset()
+        self.assertEqual(0, cov.edges())
+
+        uc.reg_write(UC_X86_REG_EAX, 1)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        self.assertNotEqual(taken, cov.hash())
+
+    def test_classify(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        cov = uc.coverage_map()
+
+        for _ in range(5):
+            uc.reg_write(UC_X86_REG_EAX, 0)
+            uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual(5, cov.view[edge_hash(ADDRESS)])
+
+        cov.classify()
+        self.assertEqual(8, cov.view[edge_hash(ADDRESS)])
+
+    def test_shared(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        shm = shared_memory.SharedMemory(create=True, size=0x1000)
+
+        try:
+            cov = uc.coverage_map(0x1000, shm.buf)
+            uc.reg_write(UC_X86_REG_EAX, 0)
+            uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+            other = shared_memory.SharedMemory(shm.name)
+            self.assertEqual(2, other.buf.tobytes().count(1))
+            other.close()
+
+            cov.close()
+            self.assertFalse(cov.active)
+
+            # nothing is collected once closed
+            uc.reg_write(UC_X86_REG_EAX, 0)
+            uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+            self.assertEqual(2, sum(shm.buf))
+
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_replace(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        first = uc.coverage_map()
+        second = uc.coverage_map(0x100)
+
+        self.assertFalse(first.active)
+        self.assertTrue(second.active)
+
+        uc.reg_write(UC_X86_REG_EAX, 0)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual(0, first.edges())
+        self.assertNotEqual(0, second.edges())
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+
+        with self.assertRaises(UcError):
+            uc.coverage_map(1000)
+
+        with self.assertRaises(UcError):
+            uc.coverage_map(0x1000, bytearray(0x800))
+
+        with self.assertRaises(TypeError):
+            uc.coverage_map(0x1000, bytes(0x1000))
+
+
+if __name__ == '__main__':
+    regress.main()
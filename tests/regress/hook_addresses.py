@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+
+# x86-64: inc rax; inc rbx; inc rcx; inc rdx
+CODE = b'\x48\xff\xc0\x48\xff\xc3\x48\xff\xc1\x48\xff\xc2'
+
+
+class HookAddresses(regress.RegressTest):
+
+    def test_hits(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        hits = []
+        hook = uc.hook_addresses((ADDRESS + 3, ADDRESS + 9), lambda uc, address, size, data: hits.append((address, size, data)), 'data')
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([(ADDRESS + 3, 3, 'data'), (ADDRESS + 9, 3, 'data')], hits)
+        self.assertEqual({ADDRESS + 3, ADDRESS + 9}, set(hook))
+
+    def test_update(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        hits = []
+        hook = uc.hook_addresses((ADDRESS,), lambda uc, address, size, data: hits.append(address))
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        # translated code is kept across runs, yet updates take effect
+        hook.discard(ADDRESS)
+        hook.update((ADDRESS + 6, ADDRESS + 9))
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([ADDRESS, ADDRESS + 6, ADDRESS + 9], hits)
+
+        hook.difference_update(hook)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual(0, len(hook))
+        self.assertEqual(3, len(hits))
+
+    def test_from_callback(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        hits = []
+
+        def callback(uc, address, size, data):
+            hits.append(address)
+            hook.discard(ADDRESS + 6)
+
+        hook = uc.hook_addresses((ADDRESS, ADDRESS + 6), callback)
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        del hits[:]
+
+        # the update takes effect once the running block is left
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([ADDRESS], hits)
+        self.assertNotIn(ADDRESS + 6, hook)
+
+    def test_deleted(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        hook = uc.hook_addresses((), lambda uc, address, size, data: None)
+        uc.hook_del(hook.handle)
+
+        with self.assertRaises(UcError):
+            hook.add(ADDRESS)
+
+
+if __name__ == '__main__':
+    regress.main()
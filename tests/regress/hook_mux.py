@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+
+# x86-64: inc rax; mov rbx, [0x40000]; inc rcx
+CODE = b'\x48\xff\xc0\x48\x8b\x1c\x25\x00\x00\x04\x00\x48\xff\xc1'
+
+
+class HookMux(regress.RegressTest):
+
+    def test_fanout(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        calls = []
+
+        mux = uc.hook_mux(UC_HOOK_CODE)
+        self.assertIs(mux, uc.hook_mux(UC_HOOK_CODE))
+
+        mux.subscribe(lambda uc, address, size, data: calls.append((data, address)), 'first')
+        second = mux.subscribe(lambda uc, address, size, data: calls.append((data, address)), 'second')
+
+        uc.mem_map(0x40000, 0x1000)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        # subscribers are called in order, for each event
+        self.assertEqual([
+            ('first', ADDRESS), ('second', ADDRESS),
+            ('first', ADDRESS + 3), ('second', ADDRESS + 3),
+            ('first', ADDRESS + 11), ('second', ADDRESS + 11)
+        ], calls)
+
+        mux.unsubscribe(second)
+        del calls[:]
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual(['first'] * 3, [data for data, _ in calls])
+
+        with self.assertRaises(UcError):
+            mux.unsubscribe(second)
+
+    def test_handled(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        calls = []
+
+        def declines(uc, access, address, size, value, data):
+            calls.append('declines')
+
+            return False
+
+        def handles(uc, access, address, size, value, data):
+            calls.append('handles')
+            uc.mem_map(address & ~0xfff, 0x1000)
+
+            return True
+
+        mux = uc.hook_mux(UC_HOOK_MEM_UNMAPPED)
+        mux.subscribe(declines)
+        mux.subscribe(handles)
+        mux.subscribe(handles)
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        # dispatching stops once the event is handled
+        self.assertEqual(['declines', 'handles'], calls)
+
+    def test_timed(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        uc.mem_map(0x40000, 0x1000)
+
+        mux = uc.hook_mux(UC_HOOK_CODE, ADDRESS, ADDRESS + 3)
+        sub = mux.subscribe(lambda uc, address, size, data: None)
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        self.assertEqual((0, 0), (sub.calls, sub.elapsed_ns))
+
+        mux.timed = True
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual(2, sub.calls)
+        self.assertGreater(sub.elapsed_ns, 0)
+
+        mux.reset_counters()
+        self.assertEqual((0, 0), (sub.calls, sub.elapsed_ns))
+
+    def test_exception(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        calls = []
+
+        def callback(uc, address, size, data):
+            raise ValueError(address)
+
+        mux = uc.hook_mux(UC_HOOK_CODE)
+        mux.subscribe(callback)
+        mux.subscribe(lambda uc, address, size, data: calls.append(address))
+
+        with self.assertRaises(ValueError):
+            uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([], calls)
+
+    def test_close(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        mux = uc.hook_mux(UC_HOOK_BLOCK)
+        mux.close()
+
+        with self.assertRaises(UcError):
+            mux.subscribe(lambda uc, address, size, data: None)
+
+        self.assertIsNot(mux, uc.hook_mux(UC_HOOK_BLOCK))
+
+    def test_hook_del(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        calls = []
+
+        mux = uc.hook_mux(UC_HOOK_BLOCK)
+        mux.subscribe(lambda uc, address, size, data: calls.append(address))
+
+        # deleting the native hook closes the multiplexer
+        uc.hook_del(mux.handle)
+        self.assertIsNone(mux.handle)
+
+        with self.assertRaises(UcError):
+            mux.subscribe(lambda uc, address, size, data: None)
+
+        other = uc.hook_mux(UC_HOOK_BLOCK)
+        self.assertIsNot(mux, other)
+
+        other.subscribe(lambda uc, address, size, data: calls.append(address))
+
+        uc.mem_map(0x40000, 0x1000)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([ADDRESS], calls)
+
+
+if __name__ == '__main__':
+    regress.main()
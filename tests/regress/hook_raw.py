@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+DATA = 0x20000
+
+# x86-64: mov rax, [rbx]; mov [rbx + 8], rax; int3
+CODE = b'\x48\x8b\x03\x48\x89\x43\x08\xcc'
+
+
+class HookRaw(regress.RegressTest):
+
+    def test_arguments(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_map(DATA, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+        uc.mem_write_u64(DATA, 0x1234)
+        uc.reg_write(UC_X86_REG_RBX, DATA)
+
+        events = []
+
+        uc.hook_add_raw(UC_HOOK_CODE, lambda *args: events.append(('code',) + args))
+        uc.hook_add_raw(UC_HOOK_MEM_READ | UC_HOOK_MEM_WRITE, lambda *args: events.append(('mem',) + args))
+        uc.hook_add_raw(UC_HOOK_INTR, lambda *args: events.append(('intr',) + args))
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([
+            ('code', ADDRESS, 3),
+            ('mem', UC_MEM_READ, DATA, 8, 0),
+            ('code', ADDRESS + 3, 4),
+            ('mem', UC_MEM_WRITE, DATA + 8, 8, 0x1234),
+            ('code', ADDRESS + 7, 1),
+            ('intr', 3)
+        ], events)
+
+    def test_invalid_mem(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+        uc.reg_write(UC_X86_REG_RBX, 0x40000)
+
+        def callback(access, address, size, value):
+            uc.mem_map(address & ~0xfff, 0x1000)
+
+            return True
+
+        uc.hook_add_raw(UC_HOOK_MEM_UNMAPPED, callback)
+        uc.emu_start(ADDRESS, ADDRESS + 7)
+
+        self.assertTrue(uc.is_mapped(0x40000))
+
+    def test_exception(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        def callback(address, size):
+            raise ValueError(address)
+
+        uc.hook_add_raw(UC_HOOK_CODE, callback)
+
+        with self.assertRaises(ValueError) as cm:
+            uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual((ADDRESS,), cm.exception.args)
+
+    def test_unsupported(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        with self.assertRaises(UcError):
+            uc.hook_add_raw(UC_HOOK_INSN, lambda: None, aux1=UC_X86_INS_SYSCALL)
+
+        with self.assertRaises(UcError):
+            uc.hook_add_raw(UC_HOOK_CODE | UC_HOOK_MEM_READ, lambda: None)
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+import gc
+import mmap
+
+import regress
+from unicorn import *
+
+ADDRESS = 0x10000
+
+# x86: mov dword ptr [0x20000], 0x41424344
+CODE = b'\xc7\x05\x00\x00\x02\x00\x44\x43\x42\x41'
+
+
+class MemMapBuffer(regress.RegressTest):
+
+    def test_shared_view(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        code = bytearray(0x1000)
+        data = mmap.mmap(-1, 0x1000)
+
+        code[:len(CODE)] = CODE
+
+        uc.mem_map_buffer(ADDRESS, code)
+        uc.mem_map_buffer(0x20000, data)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        # guest writes are visible through the host buffer
+        self.assertEqual(b'DCBA', data[:4])
+
+        # host writes are visible to the guest
+        data[4:8] = b'host'
+        self.assertEqual(b'host', uc.mem_read(0x20004, 4))
+
+    def test_pinned_while_mapped(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        buf = bytearray(0x2000)
+
+        uc.mem_map_buffer(ADDRESS, buf)
+
+        # a mapped buffer cannot be resized from under the guest
+        with self.assertRaises(BufferError):
+            buf.extend(b'x')
+
+        # partially unmapped buffer remains pinned
+        uc.mem_unmap(ADDRESS, 0x1000)
+
+        with self.assertRaises(BufferError):
+            buf.extend(b'x')
+
+        uc.mem_unmap(ADDRESS + 0x1000, 0x1000)
+        buf.extend(b'x')
+
+    def test_pinned_while_restorable(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.ctl_context_mode(cpu=True, memory=True)
+
+        buf = bytearray(b'A' * 0x1000)
+
+        uc.mem_map_buffer(ADDRESS, buf)
+        ctx = uc.context_save()
+        uc.mem_unmap(ADDRESS, 0x1000)
+
+        # the unmapped range may still be mapped back by restoring the context
+        with self.assertRaises(BufferError):
+            buf.extend(b'x')
+
+        uc.context_restore(ctx)
+
+        self.assertEqual([(ADDRESS, ADDRESS + 0xfff, UC_PROT_ALL)], list(uc.mem_regions()))
+        self.assertEqual(b'A' * 8, uc.mem_read(ADDRESS, 8))
+
+        buf[:4] = b'BBBB'
+        self.assertEqual(b'BBBB', uc.mem_read(ADDRESS, 4))
+
+        uc.mem_unmap(ADDRESS, 0x1000)
+
+        with self.assertRaises(BufferError):
+            buf.extend(b'x')
+
+    def test_released_on_close(self):
+        buf = bytearray(0x1000)
+
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map_buffer(ADDRESS, buf)
+
+        del uc
+        gc.collect()
+
+        buf.extend(b'x')
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        buf = bytearray(0x800)
+
+        with self.assertRaises(TypeError):
+            uc.mem_map_buffer(ADDRESS, bytes(0x1000))
+
+        with self.assertRaises(UcError):
+            uc.mem_map_buffer(ADDRESS, buf)
+
+        # buffer is not left pinned by a failed mapping
+        buf.extend(b'x')
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+import os
+import tempfile
+
+import regress
+from unicorn import *
+
+ADDRESS = 0x10000
+IMAGE = bytes(range(256)) * 64
+
+# x86: mov dword ptr [0x10000], 0x41424344
+CODE = b'\xc7\x05\x00\x00\x01\x00\x44\x43\x42\x41'
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class MemMapFile(regress.RegressTest):
+
+    def create_image(self):
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.unlink, path)
+
+        with os.fdopen(fd, 'wb') as f:
+            f.write(IMAGE)
+
+        return path
+
+    def test_private(self):
+        path = self.create_image()
+
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map_file(ADDRESS, path)
+
+        self.assertEqual(IMAGE, uc.mem_read(ADDRESS, len(IMAGE)))
+
+        uc.mem_write(ADDRESS, b'guest')
+
+        # private mappings are copy-on-write and leave the file intact
+        self.assertEqual(b'guest', uc.mem_read(ADDRESS, 5))
+        self.assertEqual(IMAGE, read_file(path))
+
+    def test_shared(self):
+        path = self.create_image()
+
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map_file(ADDRESS, path, private=False)
+        uc.mem_map(0x20000, 0x1000)
+        uc.mem_write(0x20000, CODE)
+
+        uc.emu_start(0x20000, 0x20000 + len(CODE))
+        uc.mem_unmap(ADDRESS, len(IMAGE))
+
+        self.assertEqual(b'DCBA' + IMAGE[4:], read_file(path))
+
+    def test_offset(self):
+        path = self.create_image()
+
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map_file(ADDRESS, path, offset=0x1000, size=0x1000, perms=UC_PROT_READ)
+
+        self.assertEqual(IMAGE[0x1000:0x2000], uc.mem_read(ADDRESS, 0x1000))
+        self.assertEqual([(ADDRESS, ADDRESS + 0xfff, UC_PROT_READ)], list(uc.mem_regions()))
+
+    def test_unaligned(self):
+        path = self.create_image()
+
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+
+        with open(path, 'r+b') as f:
+            f.truncate(0x1800)
+
+        # the range is rounded up to page size, with the file tail copied in
+        uc.mem_map_file(ADDRESS, path)
+
+        self.assertTrue(uc.is_mapped(ADDRESS, 0x2000))
+        self.assertEqual(IMAGE[:0x1800] + bytes(0x800), uc.mem_read(ADDRESS, 0x2000))
+
+        # a range larger than the file is zero filled past its end
+        uc.mem_map_file(0x20000, path, size=0x3000)
+
+        self.assertEqual(IMAGE[:0x1800] + bytes(0x1800), uc.mem_read(0x20000, 0x3000))
+
+        # a range smaller than a page
+        uc.mem_map_file(0x30000, path, size=0x10)
+
+        self.assertEqual((0x30000, 0x30fff, UC_PROT_ALL), uc.region_at(0x30000))
+        self.assertEqual(IMAGE[:0x10] + bytes(0xff0), uc.mem_read(0x30000, 0x1000))
+
+    def test_invalid(self):
+        path = self.create_image()
+
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+
+        with self.assertRaises(UcError):
+            uc.mem_map_file(ADDRESS, path, offset=len(IMAGE))
+
+
+if __name__ == '__main__':
+    regress.main()
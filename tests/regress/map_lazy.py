@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+BASE = 0x7f0000000000
+SIZE = 0x100000000
+
+# x86-64:
+#   mov rax, qword ptr [rbx]
+#   mov qword ptr [rcx], rax
+#   mov rdx, qword ptr [rcx - 4]
+CODE = b'\x48\x8b\x03\x48\x89\x01\x48\x8b\x51\xfc'
+CODE_ADDR = 0x1000
+
+
+def provider(address, size):
+    return address.to_bytes(8, 'little') * (size // 8)
+
+
+class MemMapLazy(regress.RegressTest):
+
+    def test_demand_paging(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(CODE_ADDR, 0x1000)
+        uc.mem_write(CODE_ADDR, CODE)
+
+        region = uc.mem_map_lazy(BASE, SIZE, UC_PROT_READ | UC_PROT_WRITE, provider)
+        self.assertEqual(0, region.fills)
+
+        src = BASE + 0x1230000
+        dst = BASE + 0x8000000
+
+        uc.reg_write(UC_X86_REG_RBX, src)
+        uc.reg_write(UC_X86_REG_RCX, dst)
+        uc.emu_start(CODE_ADDR, CODE_ADDR + len(CODE))
+
+        # the last access crosses a page boundary, and maps the previous page too
+        self.assertEqual(3, region.fills)
+        self.assertEqual([src, dst - 0x1000, dst], list(region.pages))
+
+        self.assertEqual(src, uc.reg_read(UC_X86_REG_RAX))
+        self.assertEqual(src, uc.mem_read_u64(dst))
+        self.assertEqual((src & 0xffffffff) << 32 | ((dst - 0x1000) >> 32), uc.reg_read(UC_X86_REG_RDX))
+
+    def test_host_access(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        region = uc.mem_map_lazy(BASE, SIZE, UC_PROT_ALL, lambda address, size: None)
+
+        # pages are only filled on guest accesses
+        with self.assertRaises(UcError):
+            uc.mem_read(BASE, 8)
+
+        self.assertEqual(0, region.fills)
+
+    def test_unmap(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(CODE_ADDR, 0x1000)
+        uc.mem_write(CODE_ADDR, CODE)
+
+        uc.mem_map_lazy(BASE, SIZE, UC_PROT_ALL, provider)
+        uc.reg_write(UC_X86_REG_RBX, BASE)
+        uc.reg_write(UC_X86_REG_RCX, BASE + 0x10)
+        uc.emu_start(CODE_ADDR, CODE_ADDR + len(CODE))
+
+        uc.mem_unmap(BASE, SIZE)
+
+        self.assertEqual([(CODE_ADDR, CODE_ADDR + 0xfff, UC_PROT_ALL)], list(uc.mem_regions()))
+
+    def test_snapshot_restore(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(CODE_ADDR, 0x1000)
+        uc.mem_write(CODE_ADDR, CODE)
+        uc.ctl_context_mode(cpu=True, memory=True)
+
+        region = uc.mem_map_lazy(BASE, SIZE, UC_PROT_READ | UC_PROT_WRITE, provider)
+        context = uc.context_save()
+
+        uc.reg_write(UC_X86_REG_RBX, BASE)
+        uc.reg_write(UC_X86_REG_RCX, BASE + 0x10)
+        uc.emu_start(CODE_ADDR, CODE_ADDR + len(CODE))
+        self.assertEqual(1, region.fills)
+
+        # the restore unmaps the page filled after the snapshot, which is filled again on access
+        uc.context_restore(context)
+        self.assertEqual(0, region.fills)
+
+        uc.reg_write(UC_X86_REG_RBX, BASE)
+        uc.reg_write(UC_X86_REG_RCX, BASE + 0x10)
+        uc.emu_start(CODE_ADDR, CODE_ADDR + len(CODE))
+
+        self.assertEqual([BASE], list(region.pages))
+        self.assertEqual(BASE, uc.reg_read(UC_X86_REG_RAX))
+
+    def test_reserved(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(0, 0x1000)
+        uc.mem_map_lazy(0x1000, 0x2000, UC_PROT_ALL, provider)
+
+        # the whole range is reserved, even though no page was filled yet
+        self.assertTrue(uc.is_mapped(0, 0x3000))
+        self.assertFalse(uc.is_mapped(0, 0x3001))
+        self.assertEqual(0x3000, uc.find_free(0x1000))
+
+    def test_unaligned(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        with self.assertRaises(UcError):
+            uc.mem_map_lazy(BASE + 1, SIZE, UC_PROT_ALL, provider)
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+import pickle
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+
+# x86-64: inc rax
+CODE = b'\x48\xff\xc0'
+
+
+class PickleBuffers(regress.RegressTest):
+
+    def test_context_out_of_band(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.reg_write(UC_X86_REG_RAX, 0x1234)
+
+        ctx = uc.context_save()
+        buffers = []
+
+        data = pickle.dumps(ctx, protocol=5, buffer_callback=buffers.append)
+
+        # context data is not copied, but referred to by the pickle buffer
+        self.assertEqual(1, len(buffers))
+        self.assertEqual(ctx.size, buffers[0].raw().nbytes)
+        self.assertLess(len(data), ctx.size)
+
+        ctx.reg_write(UC_X86_REG_RBX, 0x5678)
+        restored = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(0x5678, restored.reg_read(UC_X86_REG_RBX))
+
+        # unpickled contexts are regular ones, so they may be saved to and restored on any engine
+        other = Uc(UC_ARCH_X86, UC_MODE_64)
+        other.context_restore(restored)
+
+        self.assertEqual(0x1234, other.reg_read(UC_X86_REG_RAX))
+
+        other.reg_write(UC_X86_REG_RAX, 1)
+        other.context_update(restored)
+
+        self.assertEqual(1, restored.reg_read(UC_X86_REG_RAX))
+
+    def test_context_in_band(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.reg_write(UC_X86_REG_ECX, 7)
+
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(uc.context_save(), protocol))
+
+            self.assertEqual(UC_MODE_32, restored.mode)
+            self.assertEqual(7, restored.reg_read(UC_X86_REG_ECX))
+
+    def test_context_mismatch(self):
+        ctx = Uc(UC_ARCH_X86, UC_MODE_64).context_save()
+        buffers = []
+
+        data = pickle.dumps(ctx, protocol=5, buffer_callback=buffers.append)
+
+        with self.assertRaises(UcError):
+            pickle.loads(data, buffers=[bytes(8)])
+
+    def test_memory_image(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_map(ADDRESS + 0x4000, 0x2000, UC_PROT_READ)
+        uc.mem_write(ADDRESS, CODE)
+        uc.mem_write(ADDRESS + 0x5000, b'data')
+
+        image = uc.mem_dump()
+        buffers = []
+
+        data = pickle.dumps(image, protocol=5, buffer_callback=buffers.append)
+
+        self.assertEqual(2, len(buffers))
+        self.assertEqual(0x3000, image.nbytes)
+        self.assertLess(len(data), 0x1000)
+
+        restored = pickle.loads(data, buffers=buffers)
+
+        self.assertEqual(list(uc.mem_regions()), list(restored))
+        self.assertEqual(b'data', restored.read(ADDRESS + 0x5000, 4))
+
+        other = Uc(UC_ARCH_X86, UC_MODE_64)
+        other.mem_load(restored)
+
+        self.assertEqual(list(uc.mem_regions()), list(other.mem_regions()))
+        self.assertEqual(b'data', other.mem_read(ADDRESS + 0x5000, 4))
+
+        other.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        # the image is left untouched when copied
+        self.assertEqual(CODE, restored.read(ADDRESS, len(CODE)))
+
+    def test_memory_image_shared(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+
+        image = pickle.loads(pickle.dumps(uc.mem_dump(), protocol=5))
+
+        other = Uc(UC_ARCH_X86, UC_MODE_64)
+        other.mem_load(image, copy=False)
+        other.mem_write(ADDRESS, b'shared')
+
+        # regions are backed by the image buffers
+        self.assertEqual(b'shared', image.read(ADDRESS, 6))
+
+        with self.assertRaises(UcError):
+            image.read(ADDRESS + 0x800, 0x1000)
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+
+ADDRESS = 0x10000
+
+
+class MemReadString(regress.RegressTest):
+
+    def test_cstring(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+
+        uc.mem_write(ADDRESS, b'/bin/sh\x00garbage')
+
+        self.assertEqual((b'/bin/sh', False), uc.mem_read_cstring(ADDRESS))
+        self.assertEqual((b'/bin', True), uc.mem_read_cstring(ADDRESS, 4))
+        self.assertEqual((b'', False), uc.mem_read_cstring(ADDRESS + 7))
+
+    def test_cstring_across_pages(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+
+        uc.mem_write(ADDRESS + 0xffc, b'abcdefgh\x00')
+
+        self.assertEqual((b'abcdefgh', False), uc.mem_read_cstring(ADDRESS + 0xffc))
+
+    def test_cstring_unmapped(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+
+        uc.mem_write(ADDRESS + 0x1ffc, b'abcd')
+
+        with self.assertRaises(UcError) as ex:
+            uc.mem_read_cstring(ADDRESS + 0x1ffc)
+
+        self.assertEqual(UC_ERR_READ_UNMAPPED, ex.exception.errno)
+        self.assertEqual(ADDRESS + 0x2000, ex.exception.args[0])
+
+        with self.assertRaises(UcError) as ex:
+            uc.mem_read_cstring(ADDRESS + 0x3000)
+
+        self.assertEqual(UC_ERR_READ_UNMAPPED, ex.exception.errno)
+
+        # the limit is reached before the unmapped page
+        self.assertEqual((b'abcd', True), uc.mem_read_cstring(ADDRESS + 0x1ffc, 4))
+
+    def test_wstring(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+
+        # an unaligned NUL pair must not be taken as a terminator
+        uc.mem_write(ADDRESS + 0xffe, 'aĀb'.encode('utf-16-le') + b'\x00\x00')
+
+        self.assertEqual(('aĀb'.encode('utf-16-le'), False), uc.mem_read_wstring(ADDRESS + 0xffe))
+
+        uc.mem_write(ADDRESS, 'xyz\x00'.encode('utf-32-le'))
+
+        self.assertEqual(('xyz'.encode('utf-32-le'), False), uc.mem_read_wstring(ADDRESS, width=4))
+        self.assertEqual(('xy'.encode('utf-32-le'), True), uc.mem_read_wstring(ADDRESS, 2, width=4))
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import array
+import mmap
+
+import regress
+from unicorn import *
+
+ADDRESS = 0x10000
+DATA = bytes(range(256)) * 16
+
+
+class MemReadInto(regress.RegressTest):
+
+    def test_bytearray(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, DATA)
+
+        buf = bytearray(len(DATA))
+
+        self.assertEqual(len(DATA), uc.mem_read_into(ADDRESS, buf))
+        self.assertEqual(DATA, buf)
+
+    def test_memoryview_slice(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, DATA)
+
+        buf = bytearray(b'\xff' * 32)
+        uc.mem_read_into(ADDRESS + 8, memoryview(buf)[8:24])
+
+        self.assertEqual(b'\xff' * 8 + DATA[8:24] + b'\xff' * 8, buf)
+
+    def test_typed_buffers(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, DATA)
+
+        arr = array.array('I', [0] * 4)
+        uc.mem_read_into(ADDRESS, arr)
+        self.assertEqual(array.array('I', DATA[:16]), arr)
+
+        mm = mmap.mmap(-1, 0x1000)
+        uc.mem_read_into(ADDRESS, mm)
+        self.assertEqual(DATA[:0x1000], mm[:])
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, DATA)
+
+        with self.assertRaises(TypeError):
+            uc.mem_read_into(ADDRESS, bytes(16))
+
+        with self.assertRaises(UcError):
+            uc.mem_read_into(ADDRESS + 0x1ff8, bytearray(16))
+
+    def test_mem_read(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+        uc.mem_write(ADDRESS, DATA)
+
+        data = uc.mem_read(ADDRESS, len(DATA))
+
+        self.assertIsInstance(data, bytearray)
+        self.assertEqual(DATA, data)
+
+
+if __name__ == '__main__':
+    regress.main()
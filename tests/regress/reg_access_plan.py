@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+import array
+
+import regress
+from unicorn import *
+from unicorn.arm64_const import *
+from unicorn.x86_const import *
+
+
+class RegAccessPlan(regress.RegressTest):
+
+    def test_plain_registers(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        regs = (UC_X86_REG_RAX, UC_X86_REG_RBX, UC_X86_REG_RCX, UC_X86_REG_RIP)
+
+        writer = uc.make_reg_writer(regs)
+        reader = uc.make_reg_reader(regs)
+
+        writer((1, 2, 3, 0x1000))
+        self.assertEqual((1, 2, 3, 0x1000), reader())
+
+        # plans are reusable
+        writer(array.array('Q', [4, 5, 6, 0x2000]))
+        self.assertEqual((4, 5, 6, 0x2000), reader())
+
+        buf = array.array('Q', bytes(reader.nbytes))
+        reader.read_into(buf)
+        self.assertEqual(array.array('Q', [4, 5, 6, 0x2000]), buf)
+
+        writer.write_from(array.array('Q', [7, 8, 9, 0x3000]))
+        self.assertEqual((7, 8, 9, 0x3000), uc.reg_read_batch(regs))
+
+    def test_wide_registers(self):
+        uc = Uc(UC_ARCH_ARM64, UC_MODE_ARM)
+        regs = (UC_ARM64_REG_X0, UC_ARM64_REG_Q1, UC_ARM64_REG_X2)
+
+        writer = uc.make_reg_writer(regs)
+        reader = uc.make_reg_reader(regs)
+
+        writer((0x11, (1 << 127) | 0x22, 0x33))
+        self.assertEqual((0x11, (1 << 127) | 0x22, 0x33), reader())
+
+        # wide registers take as many qwords as they need
+        buf = array.array('Q', bytes(reader.nbytes))
+        reader.read_into(buf)
+        self.assertEqual(array.array('Q', [0x11, 0x22, 1 << 63, 0x33]), buf)
+
+    def test_context(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        regs = (UC_X86_REG_RAX, UC_X86_REG_XMM0)
+
+        writer = uc.make_reg_writer(regs)
+        reader = uc.make_reg_reader(regs)
+
+        writer((1, 2))
+        ctx = uc.context_save()
+
+        writer((3, 4), ctx)
+        self.assertEqual((1, 2), reader())
+        self.assertEqual((3, 4), reader(ctx))
+
+        uc.context_restore(ctx)
+        self.assertEqual((3, 4), reader())
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        reader = uc.make_reg_reader((UC_X86_REG_RAX, UC_X86_REG_ENDING))
+        writer = uc.make_reg_writer((UC_X86_REG_RAX,))
+
+        with self.assertRaises(UcError):
+            reader()
+
+        with self.assertRaises(UcError):
+            writer((1, 2))
+
+        with self.assertRaises(ValueError):
+            uc.make_reg_reader((UC_X86_REG_RAX, UC_X86_REG_RBX)).read_into(array.array('Q', [0]))
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.arm64_const import *
+from unicorn.x86_const import *
+
+ADDRESS = 0x10000
+
+# x86-64: inc rax; add rsp, 8; inc rax
+CODE = b'\x48\xff\xc0\x48\x83\xc4\x08\x48\xff\xc0'
+
+
+class RegDump(regress.RegressTest):
+
+    def test_roundtrip(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        uc.reg_write(UC_X86_REG_RAX, 0x1000)
+        uc.reg_write(UC_X86_REG_RSP, 0x8000)
+
+        before = uc.reg_dump()
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        after = uc.reg_dump()
+
+        self.assertEqual(('rax', 'rsp', 'rip'), before.diff(after))
+        self.assertEqual(0x1002, after.rax)
+        self.assertEqual(0x8008, after['rsp'])
+        self.assertEqual(ADDRESS + len(CODE), after[UC_X86_REG_RIP])
+
+        uc.reg_load(before)
+
+        self.assertEqual(0x1000, uc.reg_read(UC_X86_REG_RAX))
+        self.assertEqual(before, uc.reg_dump())
+
+    def test_compare(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        first = uc.reg_dump()
+        second = uc.reg_dump()
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(1, len({first, second}))
+        self.assertEqual(bytes(first), bytes(second))
+
+        uc.reg_write(UC_X86_REG_R12, 1)
+
+        self.assertNotEqual(first, uc.reg_dump())
+        self.assertEqual(('r12',), first.diff(uc.reg_dump()))
+
+        # the base and fp dumps hold different registers sets
+        self.assertNotEqual(first, uc.reg_dump(fp=True))
+
+        with self.assertRaises(ValueError):
+            first.diff(uc.reg_dump(fp=True))
+
+    def test_fp(self):
+        uc = Uc(UC_ARCH_ARM64, UC_MODE_ARM)
+        uc.reg_write(UC_ARM64_REG_Q7, 0x0123456789abcdeffedcba9876543210)
+        uc.reg_write(UC_ARM64_REG_X29, 0xdead)
+
+        dump = uc.reg_dump(fp=True)
+
+        self.assertNotIn('q7', uc.reg_dump())
+        self.assertEqual(0x0123456789abcdeffedcba9876543210, dump.q7)
+
+        # registers aliases are resolved
+        self.assertEqual(0xdead, dump.fp)
+        self.assertEqual(0xdead, dump['X29'])
+
+        uc.reg_write(UC_ARM64_REG_Q7, 0)
+        uc.reg_load(dump)
+
+        self.assertEqual(0x0123456789abcdeffedcba9876543210, uc.reg_read(UC_ARM64_REG_Q7))
+
+    def test_portable(self):
+        src = Uc(UC_ARCH_X86, UC_MODE_64)
+        src.reg_write(UC_X86_REG_RBX, 0x1234)
+
+        dst = Uc(UC_ARCH_X86, UC_MODE_64)
+        dst.reg_load(src.reg_dump())
+
+        self.assertEqual(0x1234, dst.reg_read(UC_X86_REG_RBX))
+
+        with self.assertRaises(UcError):
+            Uc(UC_ARCH_X86, UC_MODE_32).reg_load(src.reg_dump())
+
+    def test_invalid(self):
+        dump = Uc(UC_ARCH_X86, UC_MODE_64).reg_dump()
+
+        with self.assertRaises(KeyError):
+            dump['xmm0']
+
+        with self.assertRaises(AttributeError):
+            dump.eax
+
+
+if __name__ == '__main__':
+    regress.main()
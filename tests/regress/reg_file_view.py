@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.arm_const import *
+from unicorn.x86_const import *
+
+
+class RegFileView(regress.RegressTest):
+
+    def test_x86(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        uc.regs.rax = 0x1122334455667788
+        uc.regs.xmm3 = (1 << 127) | 1
+
+        self.assertEqual(0x1122334455667788, uc.reg_read(UC_X86_REG_RAX))
+        self.assertEqual(0x55667788, uc.regs.eax)
+        self.assertEqual((1 << 127) | 1, uc.reg_read(UC_X86_REG_XMM3))
+
+        uc.reg_write(UC_X86_REG_RIP, 0x1000)
+        self.assertEqual(0x1000, uc.regs.rip)
+
+        # the view is created once
+        self.assertIs(uc.regs, uc.regs)
+
+    def test_narrow_registers(self):
+        uc = Uc(UC_ARCH_ARM, UC_MODE_ARM)
+
+        # a wide value written to the register must not leak into later reads
+        uc.regs.r0 = 0xffffffff12345678
+        self.assertEqual(0x12345678, uc.regs.r0)
+
+        uc.regs.r0 = 1
+        self.assertEqual(1, uc.regs.r0)
+
+    def test_aliases(self):
+        uc = Uc(UC_ARCH_ARM, UC_MODE_ARM)
+
+        uc.regs.sp = 0x7fff0000
+        self.assertEqual(0x7fff0000, uc.regs.r13)
+        self.assertEqual(0x7fff0000, uc.reg_read(UC_ARM_REG_SP))
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        with self.assertRaises(AttributeError):
+            uc.regs.nosuchreg
+
+        with self.assertRaises(AttributeError):
+            uc.regs.nosuchreg = 0
+
+        # registers that require auxiliary data are not exposed
+        self.assertFalse(hasattr(uc.regs, 'msr'))
+
+
+if __name__ == '__main__':
+    regress.main()
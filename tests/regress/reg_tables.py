@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+import ctypes
+
+import regress
+from unicorn import *
+from unicorn.unicorn_py3.unicorn import uclib
+from unicorn.arm_const import *
+from unicorn.x86_const import *
+
+
+class RegTables(regress.RegressTest):
+
+    def test_names(self):
+        uc = Uc(UC_ARCH_ARM, UC_MODE_ARM)
+
+        self.assertEqual('r0', uc.reg_name(UC_ARM_REG_R0))
+        self.assertEqual('sp', uc.reg_name(UC_ARM_REG_R13))
+        self.assertEqual(UC_ARM_REG_SP, uc.reg_id('r13'))
+        self.assertEqual(UC_ARM_REG_PC, uc.reg_id('PC'))
+        self.assertIsNone(uc.reg_name(UC_ARM_REG_ENDING))
+
+        with self.assertRaises(UcError):
+            uc.reg_id('nosuchreg')
+
+    def test_widths(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+
+        self.assertEqual(1, uc.reg_width(UC_X86_REG_AL))
+        self.assertEqual(2, uc.reg_width(UC_X86_REG_CS))
+        self.assertEqual(4, uc.reg_width(UC_X86_REG_EAX))
+        self.assertEqual(8, uc.reg_width(UC_X86_REG_RAX))
+        self.assertEqual(10, uc.reg_width(UC_X86_REG_ST0))
+        self.assertEqual(16, uc.reg_width(UC_X86_REG_XMM0))
+        self.assertEqual(0, uc.reg_width(UC_X86_REG_ENDING))
+
+    def test_narrow_registers(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+
+        uc.reg_write(UC_X86_REG_EAX, 0xffffffff)
+        uc.reg_write_batch(((UC_X86_REG_BX, 0x1234), (UC_X86_REG_CL, 0x56)))
+
+        self.assertEqual(0xffffffff, uc.reg_read(UC_X86_REG_EAX))
+        self.assertEqual((0xffff, 0xff, 0x1234, 0x56), uc.reg_read_batch((UC_X86_REG_AX, UC_X86_REG_AH, UC_X86_REG_BX, UC_X86_REG_CL)))
+
+    def test_fp_registers(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        # st registers are held in 80-bit structures just like fp registers are
+        self.assertEqual(uc.reg_read(UC_X86_REG_FP0), uc.reg_read(UC_X86_REG_ST0))
+
+        ctx = uc.context_save()
+        self.assertEqual(uc.reg_read(UC_X86_REG_FP0), ctx.reg_read(UC_X86_REG_FP0))
+
+    def test_all_registers(self):
+        for arch, mode in ((UC_ARCH_X86, UC_MODE_16), (UC_ARCH_X86, UC_MODE_32), (UC_ARCH_X86, UC_MODE_64), (UC_ARCH_ARM, UC_MODE_ARM), (UC_ARCH_ARM64, UC_MODE_ARM)):
+            uc = Uc(arch, mode)
+            readable = 0
+
+            # every register the engine can read fits in its table width and class
+            for reg_id in range(1, 512):
+                if uc.reg_name(reg_id) in (None, 'msr', 'cp_reg'):
+                    continue
+
+                buf = ctypes.create_string_buffer(128)
+                size = ctypes.c_size_t(len(buf))
+
+                if uclib.uc_reg_read2(uc._uch, reg_id, buf, ctypes.byref(size)) != UC_ERR_OK:
+                    continue
+
+                readable += 1
+
+                self.assertGreaterEqual(uc.reg_width(reg_id), size.value, uc.reg_name(reg_id))
+                self.assertGreaterEqual(ctypes.sizeof(uc._reg_class(reg_id)), size.value, uc.reg_name(reg_id))
+
+            self.assertGreater(readable, 0)
+
+
+if __name__ == '__main__':
+    regress.main()
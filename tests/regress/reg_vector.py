@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import array
+
+import regress
+from unicorn import *
+from unicorn.arm64_const import *
+from unicorn.x86_const import *
+
+VALUE = 0x0f0e0d0c0b0a09080706050403020100
+
+
+class RegVector(regress.RegressTest):
+
+    def test_read(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.reg_write(UC_X86_REG_XMM0, VALUE)
+
+        self.assertEqual(bytes(range(16)), uc.reg_read_vector(UC_X86_REG_XMM0))
+        self.assertEqual([0x03020100, 0x07060504, 0x0b0a0908, 0x0f0e0d0c], uc.reg_read_vector(UC_X86_REG_XMM0, 'I').tolist())
+        self.assertEqual(32, len(uc.reg_read_vector(UC_X86_REG_YMM0)))
+
+    def test_write(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        uc.reg_write_vector(UC_X86_REG_XMM1, bytes(range(16)))
+        self.assertEqual(VALUE, uc.reg_read(UC_X86_REG_XMM1))
+
+        uc.reg_write_vector(UC_X86_REG_YMM2, array.array('d', [0.5, 1.5, 2.5, 3.5]))
+        self.assertEqual([0.5, 1.5, 2.5, 3.5], uc.reg_read_vector(UC_X86_REG_YMM2, 'd').tolist())
+
+        # values read in lanes form may be written back as-is
+        lanes = uc.reg_read_vector(UC_X86_REG_XMM1, 'H')
+        uc.reg_write_vector(UC_X86_REG_XMM3, lanes)
+        self.assertEqual(VALUE, uc.reg_read(UC_X86_REG_XMM3))
+
+    def test_batch(self):
+        uc = Uc(UC_ARCH_ARM64, UC_MODE_ARM)
+        regs = range(UC_ARM64_REG_Q0, UC_ARM64_REG_Q31 + 1)
+
+        uc.reg_write_vector_batch([(reg, array.array('I', [i] * 4)) for i, reg in enumerate(regs)])
+
+        values = uc.reg_read_vector_batch(regs, 'I')
+
+        self.assertEqual(32, len(values))
+        self.assertEqual([[i] * 4 for i in range(32)], [v.tolist() for v in values])
+        self.assertEqual(bytes(array.array('I', [7] * 4)), bytes(uc.reg_read_vector_batch([UC_ARM64_REG_V7])[0]))
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        with self.assertRaises(UcError):
+            uc.reg_write_vector(UC_X86_REG_XMM0, bytes(15))
+
+        with self.assertRaises(UcError):
+            uc.reg_write_vector_batch([(UC_X86_REG_XMM0, bytes(16)), (UC_X86_REG_XMM1, bytes(32))])
+
+
+if __name__ == '__main__':
+    regress.main()
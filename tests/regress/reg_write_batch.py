@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.arm64_const import *
+from unicorn.x86_const import *
+
+
+class RegWriteBatch(regress.RegressTest):
+
+    def test_x86(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        uc.reg_write_batch((
+            (UC_X86_REG_RAX, 0x1122334455667788),
+            (UC_X86_REG_RBX, 0xdeadbeef),
+            (UC_X86_REG_XMM0, (1 << 127) | 0x42),
+            (UC_X86_REG_YMM1, (1 << 255) | 0x43)
+        ))
+
+        self.assertEqual((0x1122334455667788, 0xdeadbeef, (1 << 127) | 0x42, (1 << 255) | 0x43), uc.reg_read_batch((
+            UC_X86_REG_RAX,
+            UC_X86_REG_RBX,
+            UC_X86_REG_XMM0,
+            UC_X86_REG_YMM1
+        )))
+
+    def test_arm64(self):
+        uc = Uc(UC_ARCH_ARM64, UC_MODE_ARM)
+
+        uc.reg_write_batch((
+            (UC_ARM64_REG_X0, 0x1234),
+            (UC_ARM64_REG_Q1, (1 << 127) | 0x5678),
+            (UC_ARM64_REG_V2, 0x9abc << 64)
+        ))
+
+        self.assertEqual((0x1234, (1 << 127) | 0x5678, 0x9abc << 64), uc.reg_read_batch((
+            UC_ARM64_REG_X0,
+            UC_ARM64_REG_Q1,
+            UC_ARM64_REG_V2
+        )))
+
+    def test_context(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        ctx = uc.context_save()
+
+        ctx.reg_write_batch(((UC_X86_REG_RCX, 0x100), (UC_X86_REG_RDX, 0x200)))
+        uc.context_restore(ctx)
+
+        self.assertEqual((0x100, 0x200), uc.reg_read_batch((UC_X86_REG_RCX, UC_X86_REG_RDX)))
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+
+        with self.assertRaises(UcError):
+            uc.reg_write_batch(((UC_X86_REG_RAX, 0), (UC_X86_REG_ENDING, 0)))
+
+
+if __name__ == '__main__':
+    regress.main()
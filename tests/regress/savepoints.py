@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+
+DATA = 0x20000
+
+
+class Savepoints(regress.RegressTest):
+
+    def test_nested(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(DATA, 0x4000)
+
+        sp = uc.savepoints()
+
+        self.assertIs(sp, uc.savepoints())
+
+        for level in range(3):
+            self.assertEqual(level, sp.push())
+
+            uc.reg_write(UC_X86_REG_RAX, level + 1)
+            uc.mem_write_u64(DATA, level + 1)
+
+        self.assertEqual(3, len(sp))
+
+        sp.rollback()
+        self.assertEqual((2, 2), (uc.reg_read(UC_X86_REG_RAX), uc.mem_read_u64(DATA)))
+
+        sp.rollback_to(1)
+        self.assertEqual(2, len(sp))
+        self.assertEqual((1, 1), (uc.reg_read(UC_X86_REG_RAX), uc.mem_read_u64(DATA)))
+
+        sp.rollback_to(0)
+        self.assertEqual(1, len(sp))
+        self.assertEqual((0, 0), (uc.reg_read(UC_X86_REG_RAX), uc.mem_read_u64(DATA)))
+
+        # a savepoint may be rolled back to repeatedly
+        uc.mem_write_u64(DATA, 0xdead)
+        sp.rollback()
+        self.assertEqual(0, uc.mem_read_u64(DATA))
+
+    def test_release(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(DATA, 0x4000)
+
+        sp = uc.savepoints()
+
+        sp.push()
+        uc.mem_write_u64(DATA, 1)
+
+        sp.push()
+        uc.mem_write_u64(DATA + 0x1000, 2)
+
+        # released changes are kept, and owned by the previous savepoint
+        sp.release()
+        self.assertEqual(1, len(sp))
+        self.assertEqual(2, uc.mem_read_u64(DATA + 0x1000))
+
+        sp.rollback()
+        self.assertEqual(0, uc.mem_read_u64(DATA))
+        self.assertEqual(0, uc.mem_read_u64(DATA + 0x1000))
+
+    def test_dirty_pages(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(DATA, 0x4000)
+
+        sp = uc.savepoints()
+
+        sp.push()
+        uc.mem_write(DATA, b'\x01' * 0x1800)
+
+        sp.push()
+        uc.mem_write_u64(DATA, 2)
+        uc.mem_write_u64(DATA + 0x3000, 2)
+
+        self.assertEqual((2, 2), sp.dirty_pages())
+
+        sp.release()
+        self.assertEqual((4,), sp.dirty_pages())
+
+        sp.rollback()
+        self.assertEqual((0,), sp.dirty_pages())
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(DATA, 0x4000)
+
+        sp = uc.savepoints()
+
+        with self.assertRaises(UcError):
+            sp.rollback()
+
+        with self.assertRaises(UcError):
+            sp.release()
+
+        sp.push()
+
+        with self.assertRaises(UcError):
+            sp.rollback_to(1)
+
+
+if __name__ == '__main__':
+    regress.main()
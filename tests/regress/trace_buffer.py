@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+
+import ctypes
+import struct
+import unittest
+
+import regress
+from unicorn import *
+from unicorn.x86_const import *
+from unicorn.unicorn_py3.unicorn import uc_trace_record
+
+ADDRESS = 0x10000
+DATA = 0x20000
+
+# x86-32: mov [0x20000], eax; mov ebx, [0x20000]; inc ecx
+CODE = b'\xa3\x00\x00\x02\x00\x8b\x1d\x00\x00\x02\x00\x41'
+
+# address, value, size, type
+RECORD = struct.Struct('=QQII')
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TraceBuffer(regress.RegressTest):
+
+    def consumer(self, uc, batches):
+        def consume(handler_uc, records, user_data):
+            self.assertIs(uc, handler_uc)
+            self.assertEqual('ud', user_data)
+
+            # records refer to the trace buffer, and are copied to be kept
+            batches.append(list(RECORD.iter_unpack(records)))
+
+        return consume
+
+    def test_batches(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_map(DATA, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+        uc.reg_write(UC_X86_REG_EAX, 0x1234)
+
+        batches = []
+
+        uc.trace_start(UC_HOOK_CODE | UC_HOOK_MEM_WRITE | UC_HOOK_MEM_READ_AFTER, 4, self.consumer(uc, batches), 'ud')
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        # flushed once the buffer is full, and when emulation is done
+        self.assertEqual([4, 1], [len(batch) for batch in batches])
+        self.assertEqual([
+            (ADDRESS, 0, 5, UC_HOOK_CODE),
+            (DATA, 0x1234, 4, UC_HOOK_MEM_WRITE),
+            (ADDRESS + 5, 0, 6, UC_HOOK_CODE),
+            (DATA, 0x1234, 4, UC_HOOK_MEM_READ_AFTER),
+            (ADDRESS + 11, 0, 1, UC_HOOK_CODE)
+        ], sum(batches, []))
+
+        uc.trace_stop()
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        self.assertEqual(2, len(batches))
+
+    def test_flush(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_map(DATA, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+        uc.reg_write(UC_X86_REG_EAX, 0x1234)
+
+        batches = []
+
+        uc.trace_start(UC_HOOK_BLOCK, 16, self.consumer(uc, batches), 'ud', ADDRESS, ADDRESS + 0xfff)
+
+        uc.trace_flush()
+        self.assertEqual([], batches)
+
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([[(ADDRESS, 0, len(CODE), UC_HOOK_BLOCK)]] * 2, batches)
+
+        uc.trace_stop()
+
+    def test_records(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, CODE[-1:])
+
+        batches = []
+
+        def consume(uc, records, user_data):
+            batches.append([(r.address, r.size, r.type) for r in records])
+            batches.append((records[0].address, records[-1].type))
+
+        uc.trace_start(UC_HOOK_CODE | UC_HOOK_BLOCK, 16, consume)
+        uc.emu_start(ADDRESS, ADDRESS + 1)
+
+        self.assertEqual([
+            [(ADDRESS, 1, UC_HOOK_BLOCK), (ADDRESS, 1, UC_HOOK_CODE)],
+            (ADDRESS, UC_HOOK_CODE)
+        ], batches)
+
+    def test_stop_from_consumer(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_map(DATA, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+
+        batches = []
+
+        def consume(uc, records, user_data):
+            batches.append(len(records))
+            uc.trace_stop()
+
+            # the trace is being stopped already
+            with self.assertRaises(UcError):
+                uc.trace_stop()
+
+        uc.trace_start(UC_HOOK_CODE | UC_HOOK_MEM_WRITE | UC_HOOK_MEM_READ_AFTER, 4, consume)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        # events past the first batch are not recorded
+        self.assertEqual([4], batches)
+        self.assertEqual(1, uc.reg_read(UC_X86_REG_ECX))
+
+        with self.assertRaises(UcError):
+            uc.trace_stop()
+
+        # a new trace may be started once the consumer is done
+        uc.trace_start(UC_HOOK_CODE, 4, consume)
+        uc.emu_start(ADDRESS + 11, ADDRESS + len(CODE))
+
+        self.assertEqual([4, 1], batches)
+
+    def test_consumer_error(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_map(DATA, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+        uc.reg_write(UC_X86_REG_EAX, 0x1234)
+
+        def consume(uc, records, user_data):
+            raise ValueError(len(records))
+
+        uc.trace_start(UC_HOOK_CODE, 2, consume)
+
+        with self.assertRaises(ValueError):
+            uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+    def test_layout(self):
+        # records are handed over as is, so the binding structure has to match the native one
+        self.assertEqual(RECORD.size, ctypes.sizeof(uc_trace_record))
+
+        self.assertEqual(
+            [0, 8, 16, 20],
+            [getattr(uc_trace_record, name).offset for name in ('address', 'value', 'size', 'type')]
+        )
+
+    # structured batches need numpy; the records layout is covered by test_layout regardless
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_structured(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_map(DATA, 0x1000)
+        uc.mem_write(ADDRESS, CODE)
+        uc.reg_write(UC_X86_REG_EAX, 0x1234)
+
+        batches = []
+
+        uc.trace_start(UC_HOOK_CODE, 16, lambda uc, records, _: batches.append(records['address'].tolist()), structured=True)
+        uc.emu_start(ADDRESS, ADDRESS + len(CODE))
+
+        self.assertEqual([[ADDRESS, ADDRESS + 5, ADDRESS + 11]], batches)
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+
+        consume = self.consumer(uc, [])
+
+        with self.assertRaises(UcError):
+            uc.trace_stop()
+
+        with self.assertRaises(UcError):
+            uc.trace_start(UC_HOOK_INTR, 16, consume)
+
+        with self.assertRaises(UcError):
+            uc.trace_start(UC_HOOK_CODE, 0, consume)
+
+        uc.trace_start(UC_HOOK_CODE, 16, consume)
+
+        with self.assertRaises(UcError):
+            uc.trace_start(UC_HOOK_CODE, 16, consume)
+
+
+if __name__ == '__main__':
+    regress.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+import array
+
+import regress
+from unicorn import *
+
+ADDRESS = 0x10000
+
+
+class TypedMemAccess(regress.RegressTest):
+
+    def test_little_endian(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, bytes(range(16)))
+
+        self.assertEqual(0x00, uc.mem_read_u8(ADDRESS))
+        self.assertEqual(0x0201, uc.mem_read_u16(ADDRESS + 1))
+        self.assertEqual(0x03020100, uc.mem_read_u32(ADDRESS))
+        self.assertEqual(0x0f0e0d0c0b0a0908, uc.mem_read_u64(ADDRESS + 8))
+
+        uc.mem_write_u32(ADDRESS, 0xdeadbeef)
+        self.assertEqual(b'\xef\xbe\xad\xde', uc.mem_read(ADDRESS, 4))
+
+        uc.mem_write_u64(ADDRESS, 0x1122334455667788)
+        self.assertEqual(0x1122334455667788, uc.mem_read_u64(ADDRESS))
+
+    def test_big_endian(self):
+        uc = Uc(UC_ARCH_ARM, UC_MODE_ARM | UC_MODE_BIG_ENDIAN)
+        uc.mem_map(ADDRESS, 0x1000)
+        uc.mem_write(ADDRESS, bytes(range(16)))
+
+        self.assertEqual(0x0102, uc.mem_read_u16(ADDRESS + 1))
+        self.assertEqual(0x00010203, uc.mem_read_u32(ADDRESS))
+
+        uc.mem_write_u16(ADDRESS, 0xbeef)
+        self.assertEqual(b'\xbe\xef', uc.mem_read(ADDRESS, 2))
+
+        self.assertEqual(array.array('H', [0x0405, 0x0607]), uc.mem_read_array(ADDRESS + 4, 'H', 2))
+
+        uc.mem_write_array(ADDRESS, 'I', [0x11223344, 0x55667788])
+        self.assertEqual(b'\x11\x22\x33\x44\x55\x66\x77\x88', uc.mem_read(ADDRESS, 8))
+
+        self.assertEqual((0x1122, 0x33, 0x44556677), uc.mem_unpack(ADDRESS, 'HBI'))
+        self.assertEqual((0x2211,), uc.mem_unpack(ADDRESS, '<H'))
+
+    def test_arrays(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+
+        values = array.array('I', range(64))
+        uc.mem_write_array(ADDRESS, 'I', values)
+
+        self.assertEqual(values, uc.mem_read_array(ADDRESS, 'I', 64))
+        self.assertEqual(array.array('B', [1, 0, 0, 0]), uc.mem_read_array(ADDRESS + 4, 'B', 4))
+
+    def test_pack(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+
+        uc.mem_pack(ADDRESS, 'IH', 0x8048000, 0x1234)
+
+        self.assertEqual(b'\x00\x80\x04\x08\x34\x12', uc.mem_read(ADDRESS, 6))
+        self.assertEqual((0x8048000, 0x1234), uc.mem_unpack(ADDRESS, 'IH'))
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_32)
+        uc.mem_map(ADDRESS, 0x1000)
+
+        with self.assertRaises(UcError):
+            uc.mem_read_u32(ADDRESS + 0xffe)
+
+        with self.assertRaises(UcError):
+            uc.mem_write_u64(ADDRESS - 8, 0)
+
+
+if __name__ == '__main__':
+    regress.main()
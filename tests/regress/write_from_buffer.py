@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+import array
+import mmap
+
+import regress
+from unicorn import *
+
+ADDRESS = 0x10000
+DATA = bytes(range(256)) * 16
+
+
+class MemWriteBuffer(regress.RegressTest):
+
+    def test_readonly_buffers(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+
+        uc.mem_write(ADDRESS, DATA)
+        self.assertEqual(DATA, uc.mem_read(ADDRESS, len(DATA)))
+
+        uc.mem_write(ADDRESS, memoryview(b'\xcc' * 64)[16:48])
+        self.assertEqual(b'\xcc' * 32 + DATA[32:64], uc.mem_read(ADDRESS, 64))
+
+    def test_writable_buffers(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+
+        uc.mem_write(ADDRESS, bytearray(b'\xaa' * 16))
+        self.assertEqual(b'\xaa' * 16, uc.mem_read(ADDRESS, 16))
+
+        # size is taken in bytes rather than in items
+        uc.mem_write(ADDRESS, array.array('I', [0x11223344] * 4))
+        self.assertEqual(b'\x44\x33\x22\x11' * 4, uc.mem_read(ADDRESS, 16))
+
+        mm = mmap.mmap(-1, 0x1000)
+        mm[:] = DATA[:0x1000]
+        uc.mem_write(ADDRESS, mm)
+        self.assertEqual(DATA[:0x1000], uc.mem_read(ADDRESS, 0x1000))
+
+    def test_invalid(self):
+        uc = Uc(UC_ARCH_X86, UC_MODE_64)
+        uc.mem_map(ADDRESS, 0x2000)
+
+        with self.assertRaises(TypeError):
+            uc.mem_write(ADDRESS, memoryview(DATA)[::2])
+
+        with self.assertRaises(UcError):
+            uc.mem_write(ADDRESS + 0x1ff8, DATA[:16])
+
+
+if __name__ == '__main__':
+    regress.main()
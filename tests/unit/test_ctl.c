@@ -181,11 +181,14 @@ static void test_uc_ctl_change_page_size(void)
 {
     uc_engine *uc;
     uc_engine *uc2;
+    uint32_t page_size;
 
     OK(uc_open(UC_ARCH_ARM, UC_MODE_ARM, &uc));
     OK(uc_open(UC_ARCH_ARM, UC_MODE_ARM, &uc2));
 
     OK(uc_ctl_set_page_size(uc, 4096));
+    OK(uc_ctl_get_page_size(uc, &page_size));
+    TEST_CHECK(page_size == 4096);
 
     OK(uc_mem_map(uc2, 1 << 10, 1 << 10, UC_PROT_ALL));
     uc_assert_err(UC_ERR_ARG, uc_mem_map(uc, 1 << 10, 1 << 10, UC_PROT_ALL));
@@ -402,6 +405,52 @@ static void test_noexec(void)
     OK(uc_close(uc));
 }
 
+static uint64_t test_coverage_hash(uint64_t address)
+{
+    return ((address >> 4) ^ (address << 8)) & 0xffff;
+}
+
+static void test_uc_ctl_coverage_map(void)
+{
+    uc_engine *uc;
+    uint8_t map[0x10000];
+    uint64_t first, second;
+    size_t i, hits;
+    // jmp 4; nop; nop; inc eax
+    char code[] = "\xeb\x02\x90\x90\x40";
+
+    uc_common_setup(&uc, UC_ARCH_X86, UC_MODE_32, code, sizeof(code) - 1);
+
+    uc_assert_err(UC_ERR_ARG, uc_ctl_coverage_map(uc, map, 1000));
+
+    memset(map, 0, sizeof(map));
+    OK(uc_ctl_coverage_map(uc, map, sizeof(map)));
+
+    // the previous block is forgotten on each run, so edges hit twice
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+
+    first = test_coverage_hash(code_start);
+    second = test_coverage_hash(code_start + 4) ^ (first >> 1);
+
+    TEST_CHECK(map[first] == 2);
+    TEST_CHECK(map[second] == 2);
+
+    for (i = 0, hits = 0; i < sizeof(map); i++) {
+        hits += map[i];
+    }
+
+    TEST_CHECK(hits == 4);
+
+    // nothing is collected once stopped
+    OK(uc_ctl_coverage_map(uc, NULL, 0));
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+
+    TEST_CHECK(map[first] == 2);
+
+    OK(uc_close(uc));
+}
+
 TEST_LIST = {{"test_uc_ctl_mode", test_uc_ctl_mode},
              {"test_uc_ctl_page_size", test_uc_ctl_page_size},
              {"test_uc_ctl_arch", test_uc_ctl_arch},
@@ -416,4 +465,5 @@ TEST_LIST = {{"test_uc_ctl_mode", test_uc_ctl_mode},
              {"test_uc_emu_stop_set_ip", test_uc_emu_stop_set_ip},
              {"test_tlb_clear", test_tlb_clear},
              {"test_noexec", test_noexec},
+             {"test_uc_ctl_coverage_map", test_uc_ctl_coverage_map},
              {NULL, NULL}};
@@ -449,6 +449,152 @@ static void test_snapshot_unmap(void)
     OK(uc_close(uc));
 }
 
+static void test_snapshot_regions(void)
+{
+    uc_engine *uc;
+    uc_context *ctx;
+    uc_mem_region *regions;
+    uint32_t count;
+    uint64_t tmp = 1;
+
+    OK(uc_open(UC_ARCH_X86, UC_MODE_64, &uc));
+    OK(uc_ctl_context_mode(uc, UC_CTL_CONTEXT_MEMORY | UC_CTL_CONTEXT_CPU));
+    OK(uc_mem_map(uc, 0x1000, 0x2000, UC_PROT_ALL));
+    OK(uc_context_alloc(uc, &ctx));
+    OK(uc_context_save(uc, ctx));
+
+    // copy on write must not alter the reported regions
+    OK(uc_mem_write(uc, 0x2000, &tmp, sizeof(tmp)));
+    OK(uc_mem_regions(uc, &regions, &count));
+    TEST_CHECK(count == 1);
+    TEST_CHECK(regions[0].begin == 0x1000);
+    TEST_CHECK(regions[0].end == 0x2fff);
+    OK(uc_free(regions));
+
+    OK(uc_context_restore(uc, ctx));
+    OK(uc_mem_regions(uc, &regions, &count));
+    TEST_CHECK(count == 1);
+    TEST_CHECK(regions[0].begin == 0x1000);
+    TEST_CHECK(regions[0].end == 0x2fff);
+    OK(uc_free(regions));
+
+    OK(uc_context_free(ctx));
+    OK(uc_close(uc));
+}
+
+static void test_snapshot_dirty_pages(void)
+{
+    uc_engine *uc;
+    uc_context *c1, *c2;
+    size_t count;
+    uint64_t tmp = 1;
+
+    OK(uc_open(UC_ARCH_X86, UC_MODE_64, &uc));
+    OK(uc_ctl_context_mode(uc, UC_CTL_CONTEXT_MEMORY | UC_CTL_CONTEXT_CPU));
+    OK(uc_mem_map(uc, 0x1000, 0x4000, UC_PROT_ALL));
+    OK(uc_context_alloc(uc, &c1));
+    OK(uc_context_alloc(uc, &c2));
+
+    OK(uc_context_save(uc, c1));
+    OK(uc_mem_write(uc, 0x1000, &tmp, sizeof(tmp)));
+    OK(uc_mem_write(uc, 0x1008, &tmp, sizeof(tmp)));
+    OK(uc_mem_write(uc, 0x3000, &tmp, sizeof(tmp)));
+    OK(uc_ctl_context_dirty_pages(uc, c1, &count));
+    TEST_CHECK(count == 2);
+
+    OK(uc_context_save(uc, c2));
+    OK(uc_mem_write(uc, 0x1000, &tmp, sizeof(tmp)));
+    OK(uc_ctl_context_dirty_pages(uc, c2, &count));
+    TEST_CHECK(count == 1);
+    OK(uc_ctl_context_dirty_pages(uc, c1, &count));
+    TEST_CHECK(count == 3);
+
+    OK(uc_context_restore(uc, c2));
+    OK(uc_ctl_context_dirty_pages(uc, c2, &count));
+    TEST_CHECK(count == 0);
+    OK(uc_ctl_context_dirty_pages(uc, c1, &count));
+    TEST_CHECK(count == 2);
+
+    OK(uc_context_restore(uc, c1));
+    OK(uc_ctl_context_dirty_pages(uc, c1, &count));
+    TEST_CHECK(count == 0);
+
+    OK(uc_context_free(c1));
+    OK(uc_context_free(c2));
+    OK(uc_close(uc));
+}
+
+static void test_mem_read_write_batch(void)
+{
+    uc_engine *uc;
+    uint64_t addresses[] = {0x1000, 0x1ffc, 0x3000};
+    uint32_t wvals[] = {0x11223344, 0x55667788, 0x99aabbcc};
+    uint32_t rvals[] = {0, 0, 0};
+    const void *wptrs[] = {&wvals[0], &wvals[1], &wvals[2]};
+    void *rptrs[] = {&rvals[0], &rvals[1], &rvals[2]};
+    size_t sizes[] = {4, 4, 4};
+    uc_err errs[3];
+
+    OK(uc_open(UC_ARCH_X86, UC_MODE_64, &uc));
+    OK(uc_mem_map(uc, 0x1000, 0x1000, UC_PROT_ALL));
+
+    uc_assert_err(UC_ERR_WRITE_UNMAPPED,
+                  uc_mem_write_batch(uc, addresses, wptrs, sizes, errs, 3));
+    TEST_CHECK(errs[0] == UC_ERR_OK);
+    TEST_CHECK(errs[1] == UC_ERR_OK);
+    TEST_CHECK(errs[2] == UC_ERR_WRITE_UNMAPPED);
+
+    uc_assert_err(UC_ERR_READ_UNMAPPED,
+                  uc_mem_read_batch(uc, addresses, rptrs, sizes, errs, 3));
+    TEST_CHECK(errs[0] == UC_ERR_OK);
+    TEST_CHECK(errs[1] == UC_ERR_OK);
+    TEST_CHECK(errs[2] == UC_ERR_READ_UNMAPPED);
+    TEST_CHECK(rvals[0] == wvals[0]);
+    TEST_CHECK(rvals[1] == wvals[1]);
+
+    OK(uc_mem_read_batch(uc, addresses, rptrs, sizes, NULL, 2));
+
+    OK(uc_close(uc));
+}
+
+static void test_mem_read_string(void)
+{
+    uc_engine *uc;
+    char buf[0x20];
+    size_t chars;
+    // an unaligned NUL pair must not be taken as a utf-16 terminator
+    char wide[] = "a\x00\x00b\x00\x00";
+
+    OK(uc_open(UC_ARCH_X86, UC_MODE_64, &uc));
+    OK(uc_mem_map(uc, 0x1000, 0x2000, UC_PROT_ALL));
+
+    OK(uc_mem_write(uc, 0x1ffc, "abcdefgh", 9));
+    OK(uc_mem_read_string(uc, 0x1ffc, buf, sizeof(buf), 1, &chars));
+    TEST_CHECK(chars == 8);
+    TEST_CHECK(strcmp(buf, "abcdefgh") == 0);
+
+    // truncated by the chars limit
+    OK(uc_mem_read_string(uc, 0x1ffc, buf, 4, 1, &chars));
+    TEST_CHECK(chars == 4);
+
+    // truncated by an unmapped page
+    OK(uc_mem_write(uc, 0x2ffc, "abcd", 4));
+    uc_assert_err(UC_ERR_READ_UNMAPPED,
+                  uc_mem_read_string(uc, 0x2ffc, buf, sizeof(buf), 1, &chars));
+    TEST_CHECK(chars == 4);
+
+    OK(uc_mem_write(uc, 0x1001, wide, sizeof(wide) - 1));
+    OK(uc_mem_read_string(uc, 0x1001, buf, sizeof(buf) / 2, 2, &chars));
+    TEST_CHECK(chars == 2);
+    OK(uc_mem_read_string(uc, 0x1001, buf, sizeof(buf), 1, &chars));
+    TEST_CHECK(chars == 1);
+
+    uc_assert_err(UC_ERR_ARG,
+                  uc_mem_read_string(uc, 0x1000, buf, sizeof(buf), 3, &chars));
+
+    OK(uc_close(uc));
+}
+
 TEST_LIST = {{"test_map_correct", test_map_correct},
              {"test_map_wrapping", test_map_wrapping},
              {"test_mem_protect", test_mem_protect},
@@ -464,4 +610,8 @@ TEST_LIST = {{"test_map_correct", test_map_correct},
              {"test_snapshot_with_vtlb", test_snapshot_with_vtlb},
              {"test_context_snapshot", test_context_snapshot},
              {"test_snapshot_unmap", test_snapshot_unmap},
+             {"test_snapshot_regions", test_snapshot_regions},
+             {"test_snapshot_dirty_pages", test_snapshot_dirty_pages},
+             {"test_mem_read_write_batch", test_mem_read_write_batch},
+             {"test_mem_read_string", test_mem_read_string},
              {NULL, NULL}};
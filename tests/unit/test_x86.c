@@ -915,6 +915,166 @@ static void test_x86_hook_tcg_op(void)
     OK(uc_close(uc));
 }
 
+typedef struct _TRACE_RESULTS {
+    uc_trace_record records[16];
+    size_t len;
+    int flushes;
+} TRACE_RESULTS;
+
+static void test_x86_trace_cb(uc_engine *uc, const uc_trace_record *records,
+                              size_t count, void *data)
+{
+    TRACE_RESULTS *results = (TRACE_RESULTS *)data;
+
+    memcpy(&results->records[results->len], records,
+           count * sizeof(uc_trace_record));
+    results->len += count;
+    results->flushes++;
+}
+
+static void test_x86_trace(void)
+{
+    uc_engine *uc;
+    TRACE_RESULTS results;
+    // mov [0x1100], eax; mov ebx, [0x1100]; inc ecx
+    char code[] = "\xa3\x00\x11\x00\x00\x8b\x1d\x00\x11\x00\x00\x41";
+    int r_eax = 0x1234;
+
+    uc_common_setup(&uc, UC_ARCH_X86, UC_MODE_32, code, sizeof(code) - 1);
+    OK(uc_reg_write(uc, UC_X86_REG_EAX, &r_eax));
+
+    memset(&results, 0, sizeof(TRACE_RESULTS));
+    OK(uc_trace_start(uc,
+                      UC_HOOK_CODE | UC_HOOK_MEM_WRITE | UC_HOOK_MEM_READ_AFTER,
+                      4, test_x86_trace_cb, &results, 1, 0));
+
+    // a single trace may be active
+    uc_assert_err(UC_ERR_ARG,
+                  uc_trace_start(uc, UC_HOOK_CODE, 4, test_x86_trace_cb,
+                                 &results, 1, 0));
+
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+
+    // flushed once the buffer is full, and when emulation is done
+    TEST_CHECK(results.flushes == 2);
+    TEST_CHECK(results.len == 5);
+
+    TEST_CHECK(results.records[0].type == UC_HOOK_CODE);
+    TEST_CHECK(results.records[0].address == code_start);
+    TEST_CHECK(results.records[0].size == 5);
+    TEST_CHECK(results.records[1].type == UC_HOOK_MEM_WRITE);
+    TEST_CHECK(results.records[1].address == 0x1100);
+    TEST_CHECK(results.records[1].value == 0x1234);
+    TEST_CHECK(results.records[2].type == UC_HOOK_CODE);
+    TEST_CHECK(results.records[2].address == code_start + 5);
+    TEST_CHECK(results.records[3].type == UC_HOOK_MEM_READ_AFTER);
+    TEST_CHECK(results.records[3].value == 0x1234);
+    TEST_CHECK(results.records[4].type == UC_HOOK_CODE);
+    TEST_CHECK(results.records[4].address == code_start + 11);
+
+    OK(uc_trace_stop(uc));
+    uc_assert_err(UC_ERR_ARG, uc_trace_stop(uc));
+
+    // nothing is recorded once stopped
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+    TEST_CHECK(results.len == 5);
+
+    uc_assert_err(UC_ERR_ARG,
+                  uc_trace_start(uc, UC_HOOK_INSN, 4, test_x86_trace_cb,
+                                 &results, 1, 0));
+
+    OK(uc_close(uc));
+}
+
+static void test_x86_trace_stop_cb(uc_engine *uc,
+                                   const uc_trace_record *records,
+                                   size_t count, void *data)
+{
+    test_x86_trace_cb(uc, records, count, data);
+
+    // the trace buffer is released once the callback returns
+    OK(uc_trace_stop(uc));
+    uc_assert_err(UC_ERR_ARG, uc_trace_stop(uc));
+}
+
+static void test_x86_trace_stop_from_callback(void)
+{
+    uc_engine *uc;
+    TRACE_RESULTS results;
+    // mov [0x1100], eax; mov ebx, [0x1100]; inc ecx
+    char code[] = "\xa3\x00\x11\x00\x00\x8b\x1d\x00\x11\x00\x00\x41";
+    int r_ecx;
+
+    uc_common_setup(&uc, UC_ARCH_X86, UC_MODE_32, code, sizeof(code) - 1);
+
+    memset(&results, 0, sizeof(TRACE_RESULTS));
+    OK(uc_trace_start(uc,
+                      UC_HOOK_CODE | UC_HOOK_MEM_WRITE | UC_HOOK_MEM_READ_AFTER,
+                      4, test_x86_trace_stop_cb, &results, 1, 0));
+
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+    OK(uc_reg_read(uc, UC_X86_REG_ECX, &r_ecx));
+
+    // nothing is recorded past the first flush
+    TEST_CHECK(results.flushes == 1);
+    TEST_CHECK(results.len == 4);
+    TEST_CHECK(r_ecx == 1);
+
+    uc_assert_err(UC_ERR_ARG, uc_trace_stop(uc));
+
+    OK(uc_close(uc));
+}
+
+typedef struct _ADDRESS_HITS {
+    uint64_t addresses[8];
+    int len;
+} ADDRESS_HITS;
+
+static void test_x86_hook_addresses_cb(uc_engine *uc, uint64_t address,
+                                       uint32_t size, void *data)
+{
+    ADDRESS_HITS *hits = (ADDRESS_HITS *)data;
+
+    hits->addresses[hits->len++] = address;
+}
+
+static void test_x86_hook_addresses(void)
+{
+    uc_engine *uc;
+    uc_hook h, other;
+    ADDRESS_HITS hits;
+    // inc ecx; inc ecx; inc edx
+    char code[] = "\x41\x41\x42";
+    uint64_t first = code_start + 1;
+    uint64_t second = code_start + 2;
+
+    uc_common_setup(&uc, UC_ARCH_X86, UC_MODE_32, code, sizeof(code) - 1);
+
+    memset(&hits, 0, sizeof(ADDRESS_HITS));
+    OK(uc_hook_add_addresses(uc, &h, test_x86_hook_addresses_cb, &hits, &first,
+                             1));
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+
+    TEST_CHECK(hits.len == 1);
+    TEST_CHECK(hits.addresses[0] == first);
+
+    // the set is updated in place, translated code is refreshed
+    OK(uc_hook_addresses_insert(uc, h, &second, 1));
+    OK(uc_hook_addresses_remove(uc, h, &first, 1));
+    OK(uc_emu_start(uc, code_start, code_start + sizeof(code) - 1, 0, 0));
+
+    TEST_CHECK(hits.len == 2);
+    TEST_CHECK(hits.addresses[1] == second);
+
+    // plain hooks have no address set
+    OK(uc_hook_add(uc, &other, UC_HOOK_CODE, test_x86_hook_addresses_cb,
+                   &hits, 1, 0));
+    uc_assert_err(UC_ERR_ARG, uc_hook_addresses_insert(uc, other, &first, 1));
+
+    OK(uc_hook_del(uc, h));
+    OK(uc_close(uc));
+}
+
 static bool test_x86_cmpxchg_mem_hook(uc_engine *uc, uc_mem_type type,
                                       uint64_t address, int size, int64_t val,
                                       void *data)
@@ -1824,6 +1984,9 @@ TEST_LIST = {
     {"test_x86_clear_tb_cache", test_x86_clear_tb_cache},
     {"test_x86_clear_empty_tb", test_x86_clear_empty_tb},
     {"test_x86_hook_tcg_op", test_x86_hook_tcg_op},
+    {"test_x86_trace", test_x86_trace},
+    {"test_x86_trace_stop_from_callback", test_x86_trace_stop_from_callback},
+    {"test_x86_hook_addresses", test_x86_hook_addresses},
     {"test_x86_cmpxchg", test_x86_cmpxchg},
     {"test_x86_nested_emu_start", test_x86_nested_emu_start},
     {"test_x86_nested_emu_stop", test_x86_nested_emu_stop},
@@ -34,6 +34,9 @@
 static void clear_deleted_hooks(uc_engine *uc);
 static uc_err uc_snapshot(uc_engine *uc);
 static uc_err uc_restore_latest_snapshot(uc_engine *uc);
+static size_t uc_snapshot_dirty_pages(uc_engine *uc, int level);
+static void trace_flush(uc_engine *uc);
+static void trace_free(uc_engine *uc);
 
 #if defined(__APPLE__) && defined(HAVE_PTHREAD_JIT_PROTECT) &&                 \
     defined(HAVE_SPRR) && (defined(__arm__) || defined(__aarch64__))
@@ -107,6 +110,9 @@ static void hook_delete(void *data)
 
     if (h->refs == 0) {
         g_hash_table_destroy(h->hooked_regions);
+        if (h->addresses) {
+            g_hash_table_destroy(h->addresses);
+        }
         free(h);
     }
 }
@@ -553,6 +559,12 @@ uc_err uc_close(uc_engine *uc)
         qemu_vfree(uc->bounce.buffer);
     }
 
+    // the trace hooks are freed along with all others
+    if (uc->trace != NULL) {
+        free(uc->trace->records);
+        free(uc->trace);
+    }
+
     // free hooks and hook lists
     clear_deleted_hooks(uc);
 
@@ -885,6 +897,103 @@ uc_err uc_mem_write(uc_engine *uc, uint64_t address, const void *_bytes,
     }
 }
 
+UNICORN_EXPORT
+uc_err uc_mem_read_batch(uc_engine *uc, const uint64_t *addresses,
+                         void *const *vals, const size_t *sizes, uc_err *errs,
+                         int count)
+{
+    uc_err ret = UC_ERR_OK;
+    int i;
+
+    for (i = 0; i < count; i++) {
+        uc_err err = uc_mem_read(uc, addresses[i], vals[i], sizes[i]);
+        if (errs) {
+            errs[i] = err;
+        }
+        if (err && ret == UC_ERR_OK) {
+            ret = err;
+        }
+    }
+
+    return ret;
+}
+
+UNICORN_EXPORT
+uc_err uc_mem_read_string(uc_engine *uc, uint64_t address, void *_bytes,
+                          size_t max_chars, size_t width, size_t *chars)
+{
+    uint8_t *bytes = _bytes;
+    size_t limit = max_chars * width;
+    size_t count = 0; // bytes read so far
+    size_t scanned = 0;
+    size_t chunk, i;
+    uc_err err = UC_ERR_OK;
+
+    UC_INIT(uc);
+
+    *chars = 0;
+
+    if (width != 1 && width != 2 && width != 4) {
+        restore_jit_state(uc);
+        return UC_ERR_ARG;
+    }
+
+    while (count < limit) {
+        // chunks do not cross pages, so the chars preceding an unreadable page
+        // are not lost
+        chunk = uc->target_page_size -
+                ((address + count) & (uc->target_page_size - 1));
+        if (chunk > limit - count) {
+            chunk = limit - count;
+        }
+
+        err = uc_mem_read(uc, address + count, bytes + count, chunk);
+        if (err != UC_ERR_OK) {
+            break;
+        }
+
+        count += chunk;
+
+        // look for a terminator among the complete chars read so far
+        for (; scanned + width <= count; scanned += width) {
+            for (i = 0; i < width && bytes[scanned + i] == 0; i++) {
+            }
+
+            if (i == width) {
+                *chars = scanned / width;
+                restore_jit_state(uc);
+                return UC_ERR_OK;
+            }
+        }
+    }
+
+    *chars = scanned / width;
+
+    restore_jit_state(uc);
+    return err;
+}
+
+UNICORN_EXPORT
+uc_err uc_mem_write_batch(uc_engine *uc, const uint64_t *addresses,
+                          const void *const *vals, const size_t *sizes,
+                          uc_err *errs, int count)
+{
+    uc_err ret = UC_ERR_OK;
+    int i;
+
+    for (i = 0; i < count; i++) {
+        uc_err err = uc_mem_write(uc, addresses[i], vals[i], sizes[i]);
+        if (errs) {
+            errs[i] = err;
+        }
+        if (err && ret == UC_ERR_OK) {
+            ret = err;
+        }
+    }
+
+    return ret;
+}
+
 #define TIMEOUT_STEP 2 // microseconds
 static void *_timeout_fn(void *arg)
 {
@@ -965,6 +1074,9 @@ uc_err uc_emu_start(uc_engine *uc, uint64_t begin, uint64_t until,
     // Avoid nested uc_emu_start saves wrong jit states.
     if (uc->nested_level == 0) {
         UC_INIT(uc);
+
+        // edges do not span distinct emulation runs
+        uc->coverage_prev = 0;
     }
 
     // Advance the nested levels. We must decrease the level count by one when
@@ -1107,6 +1219,11 @@ uc_err uc_emu_start(uc_engine *uc, uint64_t begin, uint64_t until,
     if (uc->nested_level == 0) {
         uc->emulation_done = true;
 
+        // hand the events recorded during emulation to the trace callback
+        if (uc->trace != NULL) {
+            trace_flush(uc);
+        }
+
         // remove hooks to delete
         // make sure we delete all hooks at the first level.
         clear_deleted_hooks(uc);
@@ -1932,6 +2049,315 @@ uc_err uc_hook_del(uc_engine *uc, uc_hook hh)
     return UC_ERR_OK;
 }
 
+UNICORN_EXPORT
+uc_err uc_hook_add_addresses(uc_engine *uc, uc_hook *hh, void *callback,
+                             void *user_data, const uint64_t *addresses,
+                             size_t count)
+{
+    struct hook *hook;
+    uc_err err;
+
+    err = uc_hook_add(uc, hh, UC_HOOK_CODE, callback, user_data, 1, 0);
+    if (err != UC_ERR_OK) {
+        return err;
+    }
+
+    hook = (struct hook *)*hh;
+    hook->addresses = g_hash_table_new_full(
+        hook_addresses_hash, hook_addresses_equal, g_free, NULL);
+
+    err = uc_hook_addresses_insert(uc, *hh, addresses, count);
+    if (err != UC_ERR_OK) {
+        uc_hook_del(uc, *hh);
+    }
+
+    return err;
+}
+
+UNICORN_EXPORT
+uc_err uc_hook_addresses_insert(uc_engine *uc, uc_hook hh,
+                                const uint64_t *addresses, size_t count)
+{
+    struct hook *hook = (struct hook *)hh;
+    uint64_t *key;
+    size_t i;
+
+    UC_INIT(uc);
+
+    if (hook->addresses == NULL || hook->to_delete) {
+        restore_jit_state(uc);
+        return UC_ERR_ARG;
+    }
+
+    for (i = 0; i < count; i++) {
+        if (g_hash_table_lookup(hook->addresses, (void *)&addresses[i])) {
+            continue;
+        }
+
+        key = malloc(sizeof(uint64_t));
+        if (key == NULL) {
+            restore_jit_state(uc);
+            return UC_ERR_NOMEM;
+        }
+
+        *key = addresses[i];
+        g_hash_table_insert(hook->addresses, (void *)key, (void *)1);
+
+        // retranslate the block so that the hook gets emitted for it
+        uc->uc_invalidate_tb(uc, addresses[i], 1);
+    }
+
+    restore_jit_state(uc);
+    return UC_ERR_OK;
+}
+
+UNICORN_EXPORT
+uc_err uc_hook_addresses_remove(uc_engine *uc, uc_hook hh,
+                                const uint64_t *addresses, size_t count)
+{
+    struct hook *hook = (struct hook *)hh;
+    size_t i;
+
+    UC_INIT(uc);
+
+    if (hook->addresses == NULL || hook->to_delete) {
+        restore_jit_state(uc);
+        return UC_ERR_ARG;
+    }
+
+    for (i = 0; i < count; i++) {
+        if (g_hash_table_remove(hook->addresses, (void *)&addresses[i])) {
+            uc->uc_invalidate_tb(uc, addresses[i], 1);
+        }
+    }
+
+    restore_jit_state(uc);
+    return UC_ERR_OK;
+}
+
+static void trace_flush(uc_engine *uc)
+{
+    uc_trace *trace = uc->trace;
+    size_t count = trace->count;
+
+    if (count) {
+        trace->count = 0;
+        trace->flushing = true;
+        trace->callback(uc, trace->records, count, trace->user_data);
+        trace->flushing = false;
+    }
+
+    // the buffer may only be released once the callback is done with it
+    if (trace->stopped && !trace->flushing) {
+        trace_free(uc);
+    }
+}
+
+static inline void trace_record(uc_engine *uc, uint32_t type, uint64_t address,
+                                uint32_t size, uint64_t value)
+{
+    uc_trace *trace = uc->trace;
+    uc_trace_record *record;
+
+    if (trace == NULL) {
+        return;
+    }
+
+    if (trace->count == trace->capacity) {
+        trace_flush(uc);
+
+        // the callback may have stopped the trace
+        trace = uc->trace;
+        if (trace == NULL) {
+            return;
+        }
+    }
+
+    record = &trace->records[trace->count++];
+    record->address = address;
+    record->value = value;
+    record->size = size;
+    record->type = type;
+}
+
+static void trace_code_cb(uc_engine *uc, uint64_t address, uint32_t size,
+                          void *user_data)
+{
+    trace_record(uc, UC_HOOK_CODE, address, size, 0);
+}
+
+static void trace_block_cb(uc_engine *uc, uint64_t address, uint32_t size,
+                           void *user_data)
+{
+    trace_record(uc, UC_HOOK_BLOCK, address, size, 0);
+}
+
+static void trace_mem_cb(uc_engine *uc, uc_mem_type type, uint64_t address,
+                         int size, int64_t value, void *user_data)
+{
+    switch (type) {
+    case UC_MEM_READ:
+        trace_record(uc, UC_HOOK_MEM_READ, address, size, 0);
+        break;
+    case UC_MEM_WRITE:
+        trace_record(uc, UC_HOOK_MEM_WRITE, address, size, value);
+        break;
+    case UC_MEM_READ_AFTER:
+        trace_record(uc, UC_HOOK_MEM_READ_AFTER, address, size, value);
+        break;
+    default:
+        break;
+    }
+}
+
+static void trace_free(uc_engine *uc)
+{
+    int i;
+
+    for (i = 0; i < ARRAY_SIZE(uc->trace->hooks); i++) {
+        if (uc->trace->hooks[i]) {
+            uc_hook_del(uc, uc->trace->hooks[i]);
+        }
+    }
+
+    free(uc->trace->records);
+    free(uc->trace);
+    uc->trace = NULL;
+}
+
+UNICORN_EXPORT
+uc_err uc_trace_start(uc_engine *uc, int types, size_t capacity,
+                      uc_cb_trace_t callback, void *user_data, uint64_t begin,
+                      uint64_t end)
+{
+    const int mem_types =
+        UC_HOOK_MEM_READ | UC_HOOK_MEM_WRITE | UC_HOOK_MEM_READ_AFTER;
+    uc_trace *trace;
+    uc_err err = UC_ERR_OK;
+
+    UC_INIT(uc);
+
+    if (uc->trace != NULL || types == 0 ||
+        (types & ~(UC_HOOK_CODE | UC_HOOK_BLOCK | mem_types)) != 0 ||
+        capacity == 0 || callback == NULL) {
+        restore_jit_state(uc);
+        return UC_ERR_ARG;
+    }
+
+    trace = calloc(1, sizeof(uc_trace));
+    if (trace == NULL) {
+        restore_jit_state(uc);
+        return UC_ERR_NOMEM;
+    }
+
+    trace->records = malloc(capacity * sizeof(uc_trace_record));
+    if (trace->records == NULL) {
+        free(trace);
+        restore_jit_state(uc);
+        return UC_ERR_NOMEM;
+    }
+
+    trace->capacity = capacity;
+    trace->callback = callback;
+    trace->user_data = user_data;
+
+    uc->trace = trace;
+
+    if (types & UC_HOOK_CODE) {
+        err = uc_hook_add(uc, &trace->hooks[0], UC_HOOK_CODE, trace_code_cb,
+                          NULL, begin, end);
+    }
+
+    if (err == UC_ERR_OK && (types & UC_HOOK_BLOCK)) {
+        err = uc_hook_add(uc, &trace->hooks[1], UC_HOOK_BLOCK, trace_block_cb,
+                          NULL, begin, end);
+    }
+
+    if (err == UC_ERR_OK && (types & mem_types)) {
+        err = uc_hook_add(uc, &trace->hooks[2], types & mem_types,
+                          trace_mem_cb, NULL, begin, end);
+    }
+
+    if (err != UC_ERR_OK) {
+        trace_free(uc);
+    }
+
+    restore_jit_state(uc);
+    return err;
+}
+
+UNICORN_EXPORT
+uc_err uc_trace_flush(uc_engine *uc)
+{
+    UC_INIT(uc);
+
+    if (uc->trace == NULL) {
+        restore_jit_state(uc);
+        return UC_ERR_ARG;
+    }
+
+    trace_flush(uc);
+
+    restore_jit_state(uc);
+    return UC_ERR_OK;
+}
+
+UNICORN_EXPORT
+uc_err uc_trace_stop(uc_engine *uc)
+{
+    UC_INIT(uc);
+
+    if (uc->trace == NULL || uc->trace->stopped) {
+        restore_jit_state(uc);
+        return UC_ERR_ARG;
+    }
+
+    // when called by the trace callback, the trace is released once it returns
+    uc->trace->stopped = true;
+    trace_flush(uc);
+
+    restore_jit_state(uc);
+    return UC_ERR_OK;
+}
+
+static void coverage_block_cb(uc_engine *uc, uint64_t address, uint32_t size,
+                              void *user_data)
+{
+    uint64_t cur = ((address >> 4) ^ (address << 8)) & uc->coverage_mask;
+
+    uc->coverage_map[cur ^ uc->coverage_prev]++;
+    uc->coverage_prev = cur >> 1;
+}
+
+static uc_err uc_set_coverage_map(uc_engine *uc, uint8_t *map, size_t size)
+{
+    uc_err err = UC_ERR_OK;
+
+    if (map != NULL && (size == 0 || (size & (size - 1)) != 0)) {
+        return UC_ERR_ARG;
+    }
+
+    if (uc->coverage_hook) {
+        uc_hook_del(uc, uc->coverage_hook);
+        uc->coverage_hook = 0;
+    }
+
+    uc->coverage_map = map;
+    uc->coverage_mask = map != NULL ? size - 1 : 0;
+    uc->coverage_prev = 0;
+
+    if (map != NULL) {
+        err = uc_hook_add(uc, &uc->coverage_hook, UC_HOOK_BLOCK,
+                          coverage_block_cb, NULL, 1, 0);
+        if (err != UC_ERR_OK) {
+            uc->coverage_map = NULL;
+            uc->coverage_hook = 0;
+        }
+    }
+
+    return err;
+}
+
 // TCG helper
 // 2 arguments are enough for most opcodes. Load/Store needs 3 arguments but we
 // have memory hooks already. We may exceed the maximum arguments of a tcg
@@ -2047,9 +2473,18 @@ uc_err uc_mem_regions(uc_engine *uc, uc_mem_region **regions, uint32_t *count)
     }
 
     for (i = 0; i < *count; i++) {
-        r[i].begin = uc->mapped_blocks[i]->addr;
-        r[i].end = uc->mapped_blocks[i]->end - 1;
-        r[i].perms = uc->mapped_blocks[i]->perms;
+        MemoryRegion *mr = uc->mapped_blocks[i];
+        uint64_t base = 0;
+
+        // regions copied on write by a snapshot are moved into a container,
+        // and their addresses become relative to it
+        if (mr->container && mr->container != uc->system_memory) {
+            base = mr->container->addr;
+        }
+
+        r[i].begin = base + mr->addr;
+        r[i].end = base + mr->end - 1;
+        r[i].perms = mr->perms;
     }
 
     *regions = r;
@@ -2523,7 +2958,7 @@ uc_err uc_ctl(uc_engine *uc, uc_control_type control, ...)
                 break;
             }
 
-            while (page_size) {
+            while (page_size > 1) {
                 bits++;
                 page_size >>= 1;
             }
@@ -2809,6 +3244,38 @@ uc_err uc_ctl(uc_engine *uc, uc_control_type control, ...)
         restore_jit_state(uc);
         break;
 
+    case UC_CTL_CONTEXT_DIRTY_PAGES: {
+
+        UC_INIT(uc);
+
+        if (rw == UC_CTL_IO_READ_WRITE) {
+            uc_context *context = va_arg(args, uc_context *);
+            size_t *count = va_arg(args, size_t *);
+            *count = uc_snapshot_dirty_pages(uc, context->snapshot_level);
+        } else {
+            err = UC_ERR_ARG;
+        }
+
+        restore_jit_state(uc);
+        break;
+    }
+
+    case UC_CTL_COVERAGE_MAP: {
+
+        UC_INIT(uc);
+
+        if (rw == UC_CTL_IO_WRITE) {
+            uint8_t *map = va_arg(args, uint8_t *);
+            size_t size = va_arg(args, size_t);
+            err = uc_set_coverage_map(uc, map, size);
+        } else {
+            err = UC_ERR_ARG;
+        }
+
+        restore_jit_state(uc);
+        break;
+    }
+
     default:
         err = UC_ERR_ARG;
         break;
@@ -2872,6 +3339,31 @@ static uc_err uc_restore_latest_snapshot(struct uc_struct *uc)
     return UC_ERR_OK;
 }
 
+static size_t uc_snapshot_dirty_pages(struct uc_struct *uc, int level)
+{
+    MemoryRegion *container, *subregion;
+    uint64_t size = 0;
+
+    // pages copied on write are laid over the region they were copied from,
+    // in a container that holds that original region last
+    QTAILQ_FOREACH(container, &uc->system_memory->subregions, subregions_link)
+    {
+        if (container->terminates) {
+            continue;
+        }
+
+        QTAILQ_FOREACH(subregion, &container->subregions, subregions_link)
+        {
+            if (subregion->priority >= level &&
+                subregion != QTAILQ_LAST(&container->subregions)) {
+                size += int128_get64(subregion->size);
+            }
+        }
+    }
+
+    return size / uc->target_page_size;
+}
+
 #ifdef UNICORN_TRACER
 uc_tracer *get_tracer()
 {